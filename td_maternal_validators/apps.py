@@ -1,4 +1,5 @@
 from django.apps import AppConfig as DjangoApponfig
+from django.conf import settings
 from edc_visit_tracking.apps import (
     AppConfig as BaseEdcVisitTrackingAppConfig)
 
@@ -7,6 +8,22 @@ class AppConfig(DjangoApponfig):
     name = 'td_maternal_validators'
     verbose_name = 'Tshilo Dikotla Maternal Form Validators'
 
+    def ready(self):
+        # the validator modules are imported on first use; connect only
+        # the receivers of the caches that are enabled
+        if getattr(settings, 'TD_MATERNAL_STATUS_CACHE_TTL', 0):
+            from .form_validators import maternal_status_cache
+            maternal_status_cache.connect()
+        if getattr(settings, 'TD_MATERNAL_VALIDATORS_PRELOAD_LIST_MODELS', False):
+            from .form_validators import list_model_index
+            list_model_index.load()
+        if getattr(settings, 'TD_MATERNAL_VALIDATORS_FACTS_CACHE', None):
+            from .form_validators import dependency_invalidator
+            dependency_invalidator.connect()
+        if getattr(settings, 'TD_MATERNAL_VALIDATORS_INSTRUMENTATION', False):
+            from .instrumentation import instrument
+            instrument()
+
 
 class EdcVisitTrackingAppConfig(BaseEdcVisitTrackingAppConfig):
     visit_models = {
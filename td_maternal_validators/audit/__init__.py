@@ -0,0 +1,3 @@
+from .registry import audited_models, registered_models
+from .runner import Checkpoint, audit_rows, instance_cleaned_data, run_audit
+from .parallel import audit_shard, run_parallel_audit, shard_of, subject_lookup
@@ -0,0 +1,150 @@
+import hashlib
+import heapq
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from contextlib import ExitStack
+
+from django.db import connections
+
+from .registry import registered_models
+from .runner import audit_queryset, audit_rows, chunked, failure_record
+
+
+def shard_of(subject_identifier, shards):
+    """Returns the shard of a subject, the same in every process and
+    run, unlike `hash`.
+    """
+    digest = hashlib.md5(str(subject_identifier).encode()).hexdigest()
+    return int(digest, 16) % shards
+
+
+def subject_lookup(model_cls):
+    """Returns the lookup of the maternal subject_identifier of the
+    rows of `model_cls`, as `row_subject_identifier` finds it, or None.
+    """
+    fields = {field.name for field in model_cls._meta.concrete_fields}
+    if 'subject_identifier' in fields:
+        return 'subject_identifier'
+    for name in ('maternal_visit', 'appointment'):
+        if name in fields:
+            return f'{name}__subject_identifier'
+    if 'maternal_arv_preg' in fields:
+        return 'maternal_arv_preg__maternal_visit__subject_identifier'
+    return None
+
+
+def shard_querysets(model_cls, shard, shards, chunk_size=500):
+    """Yields querysets of the rows of the subjects in the shard in pk
+    order, `chunk_size` rows at a time.
+
+    Rows without a subject belong to shard 0.
+    """
+    lookup = subject_lookup(model_cls)
+    if lookup is None:
+        if shard == 0:
+            yield audit_queryset(model_cls)
+        return
+    pks = (
+        pk for pk, subject_identifier in model_cls._default_manager.order_by(
+            'pk').values_list('pk', lookup).iterator(chunk_size=chunk_size)
+        if (0 if subject_identifier is None
+            else shard_of(subject_identifier, shards)) == shard)
+    for chunk in chunked(pks, chunk_size):
+        yield audit_queryset(model_cls).filter(pk__in=chunk)
+
+
+def audit_shard(output, shard, shards, models=None, labels=None, chunk_size=500):
+    """Audits the rows of the subjects in the shard, writing the failures
+    as JSON lines to the file `output` in (model, pk) order, and returns
+    (rows, failures).
+    """
+    rows = failures = 0
+    with open(output, 'w', encoding='utf-8') as f:
+        for label, model_cls, validator_cls in registered_models(models, labels):
+            for queryset in shard_querysets(model_cls, shard, shards, chunk_size):
+                for instances in chunked(
+                        queryset.iterator(chunk_size=chunk_size), chunk_size):
+                    for failure in audit_rows(validator_cls, instances):
+                        f.write(json.dumps(
+                            failure_record(label, validator_cls, failure),
+                            sort_keys=True, default=str) + '\n')
+                        failures += 1
+                    rows += len(instances)
+    return rows, failures
+
+
+def close_connections():
+    """Drops the database connections inherited from the parent process
+    so each worker opens its own.
+    """
+    for connection in connections.all():
+        connection.close()
+
+
+def merge_key(line):
+    """Returns the (model, pk) of a failure, with integer pks compared
+    as numbers as in the pk order of `run_audit`.
+    """
+    record = json.loads(line)
+    pk = record['pk']
+    return record['model'], (int(pk) if pk.isdigit() else pk)
+
+
+def merge_shards(output, shard_outputs):
+    """Writes the failures of all shards to `output` in (model, pk)
+    order, so the report does not depend on the number of shards.
+
+    Each shard is in that order already, so the files are merged a line
+    at a time.
+    """
+    with ExitStack() as stack:
+        shard_files = [stack.enter_context(open(shard_output, encoding='utf-8'))
+                       for shard_output in shard_outputs]
+        with open(output, 'w', encoding='utf-8') as f:
+            f.writelines(heapq.merge(*shard_files, key=merge_key))
+
+
+def run_parallel_audit(output, workers=None, shards=None, models=None, labels=None,
+                       chunk_size=500):
+    """Audits like `run_audit`, with the subjects partitioned into
+    `shards` (default `workers`) by `shard_of` and the shards audited by
+    a pool of `workers` processes (default the number of CPUs).
+
+    Workers are forked, so they inherit the settings and model labels
+    of this process, and each opens its own database connection and has
+    its own subject contexts. With one worker the shards are audited in
+    this process. Returns a dictionary of rows, failures, workers,
+    shards and seconds.
+    """
+    workers = workers or os.cpu_count() or 1
+    shards = shards or workers
+    if workers > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+        raise ValueError(
+            'Parallel audits need the fork start method. Use one worker.')
+    tmp_dir = tempfile.mkdtemp()
+    shard_outputs = [os.path.join(tmp_dir, f'shard{shard}.jsonl')
+                     for shard in range(shards)]
+    arguments = [(shard_output, shard, shards, models, labels, chunk_size)
+                 for shard, shard_output in enumerate(shard_outputs)]
+    start = time.perf_counter()
+    try:
+        if workers == 1:
+            results = [audit_shard(*args) for args in arguments]
+        else:
+            close_connections()
+            context = multiprocessing.get_context('fork')
+            with context.Pool(workers, initializer=close_connections) as pool:
+                results = pool.starmap(audit_shard, arguments)
+        merge_shards(output, shard_outputs)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return {
+        'rows': sum(rows for rows, _ in results),
+        'failures': sum(failures for _, failures in results),
+        'workers': workers,
+        'shards': shards,
+        'seconds': time.perf_counter() - start}
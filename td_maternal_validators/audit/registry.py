@@ -0,0 +1,71 @@
+from django.apps import apps as django_apps
+from django.conf import settings
+
+from .. import form_validators
+
+# the td_maternal and td_prn models saved through each validator's form
+audited_models = {
+    'td_maternal.antenatalenrollment': 'AntenatalEnrollmentFormValidator',
+    'td_maternal.antenatalvisitmembership': 'AntenatalVisitMembershipFormValidator',
+    'td_maternal.karabosubjectconsent': 'KaraboSubjectConsentFormValidator',
+    'td_maternal.karabosubjectscreening': 'KaraboSubjectScreeningFormValidator',
+    'td_maternal.maternalarv': 'MaternalArvFormValidator',
+    'td_maternal.maternalarvpost': 'MarternalArvPostFormValidator',
+    'td_maternal.maternalarvpreg': 'MaternalArvPregFormValidator',
+    'td_maternal.maternalclinicalmeasurementsone':
+        'MaternalClinicalMeasurememtsOneFormValidator',
+    'td_maternal.maternalclinicalmeasurementstwo':
+        'MaternalClinicalMeasurememtsTwoFormValidator',
+    'td_maternal.maternalcontraception': 'MaternalContraceptionFormValidator',
+    'td_maternal.maternalcovidscreening': 'MaternalCovidScreeningFormValidator',
+    'td_maternal.maternaldemographics': 'MaternalDemographicsFormValidator',
+    'td_maternal.maternaldiagnoses': 'MaternalDiagnosesFormValidator',
+    'td_maternal.maternalfoodsecurity': 'MaternalFoodSecurityFormValidator',
+    'td_maternal.maternalhivinterimhx': 'MaternalHivInterimHxFormValidator',
+    'td_maternal.maternalinterimidcc': 'MaternalIterimIdccFormValidator',
+    'td_maternal.maternallabourdel': 'MaternalLabDelFormValidator',
+    'td_maternal.maternallifetimearvhistory': 'MaternalLifetimeArvHistoryFormValidator',
+    'td_maternal.maternalmedicalhistory': 'MaternalMedicalHistoryFormValidator',
+    'td_maternal.maternalobstericalhistory': 'MaternalObstericalHistoryFormValidator',
+    'td_maternal.maternalpostpartumfu': 'MaternalPostPartumFuFormValidator',
+    'td_maternal.maternalrando': 'MaternalRandoFormValidator',
+    'td_maternal.maternalsrh': 'MaternalSrhFormValidator',
+    'td_maternal.maternalsubstanceuseduringpreg':
+        'MaternalSubstanceUseDuringPregFormValidator',
+    'td_maternal.maternalsubstanceusepriorpreg':
+        'MaternalSubstanceUsePriorPregFormValidator',
+    'td_maternal.maternaltuberculosishistory': 'MaternalTuberculosisHistoryFormValidator',
+    'td_maternal.maternalultrasoundinitial': 'MaternalUltrasoundInitialFormValidator',
+    'td_maternal.maternalvisit': 'MaternalVisitFormValidator',
+    'td_maternal.rapidtestresult': 'RapidTestResultFormValidator',
+    'td_maternal.specimenconsent': 'SpecimenConsentFormValidator',
+    'td_maternal.subjectconsent': 'SubjectConsentFormValidator',
+    'td_maternal.tdconsentversion': 'TDConsentVersionFormValidator',
+    'td_prn.maternalcontact': 'MaternalContactFormValidator',
+}
+
+
+def registered_models(models=None, labels=None):
+    """Returns a list of (model label, model class, validator class) of
+    the audited models that are installed, in label order.
+
+    `models` replaces the default mapping of model label to validator
+    class name, which is `audited_models` updated with
+    settings.TD_MATERNAL_VALIDATORS_AUDIT_MODELS. `labels` limits the
+    result to those model labels.
+    """
+    if models is None:
+        models = dict(
+            audited_models,
+            **getattr(settings, 'TD_MATERNAL_VALIDATORS_AUDIT_MODELS', {}))
+    registered = []
+    for label, validator_name in sorted(models.items()):
+        if labels and label not in labels:
+            continue
+        try:
+            model_cls = django_apps.get_model(label)
+        except (LookupError, ValueError):
+            continue
+        registered.append(
+            (label, model_cls, getattr(form_validators, validator_name)))
+    return registered
@@ -0,0 +1,182 @@
+import json
+import os
+import time
+from itertools import islice
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import reset_queries
+
+from ..form_validators.batch import (
+    row_subject_identifier, share_prefetched_contexts, validation_errors)
+from ..form_validators.subject_context import subject_context_scope
+from .registry import registered_models
+
+
+def instance_cleaned_data(instance):
+    """Returns the cleaned data the form of a saved instance would
+    have, i.e. its editable fields, with related objects and M2M
+    querysets as the form fields return them.
+    """
+    cleaned_data = {}
+    for field in instance._meta.concrete_fields:
+        if field.editable and not field.primary_key:
+            cleaned_data[field.name] = getattr(instance, field.name)
+    for field in instance._meta.many_to_many:
+        cleaned_data[field.name] = getattr(instance, field.name).all()
+    return cleaned_data
+
+
+def audit_queryset(model_cls, after=None):
+    """Returns the rows of `model_cls` in pk order, optionally those
+    after the pk `after`, with their editable foreign keys joined.
+    """
+    related = [
+        field.name for field in model_cls._meta.concrete_fields
+        if field.is_relation and field.editable]
+    queryset = model_cls._default_manager.select_related(*related).order_by('pk')
+    if after is not None:
+        queryset = queryset.filter(pk__gt=after)
+    return queryset
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def audit_rows(validator_cls, instances):
+    """Validates saved instances with `validator_cls` and returns a
+    list of (instance, subject_identifier, errors, exception) of the
+    instances that fail, in order.
+    """
+    rows = [instance_cleaned_data(instance) for instance in instances]
+    failures = []
+    with subject_context_scope() as shared_contexts:
+        share_prefetched_contexts(
+            shared_contexts, validator_cls(cleaned_data={}), rows,
+            chunk_size=len(rows) or 1)
+        for instance, cleaned_data in zip(instances, rows):
+            errors, exception = None, None
+            try:
+                validator_cls(cleaned_data=cleaned_data, instance=instance).validate()
+            except ValidationError as e:
+                errors = validation_errors(e)
+            except Exception as e:
+                exception = repr(e)
+            else:
+                continue
+            try:
+                subject_identifier = row_subject_identifier(cleaned_data)
+            except Exception:
+                subject_identifier = None
+            failures.append((instance, subject_identifier, errors, exception))
+    return failures
+
+
+def failure_record(label, validator_cls, failure):
+    instance, subject_identifier, errors, exception = failure
+    return {
+        'model': label,
+        'pk': str(instance.pk),
+        'subject_identifier': subject_identifier,
+        'validator': validator_cls.__name__,
+        'errors': errors,
+        'exception': exception}
+
+
+class Checkpoint:
+    """The progress of an audit, saved as JSON after every chunk so an
+    interrupted audit can resume.
+
+    `offset` is the size of the failures file when saved; failures
+    written after it belong to a chunk that is validated again.
+    """
+
+    def __init__(self, path=None, completed=None, model=None, pk=None,
+                 offset=0, rows=0, failures=0):
+        self.path = path
+        self.completed = list(completed or [])
+        self.model = model
+        self.pk = pk
+        self.offset = offset
+        self.rows = rows
+        self.failures = failures
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls(path=path, **json.load(f))
+
+    def as_dict(self):
+        return {
+            'completed': self.completed,
+            'model': self.model,
+            'pk': self.pk,
+            'offset': self.offset,
+            'rows': self.rows,
+            'failures': self.failures}
+
+    def save(self):
+        if not self.path:
+            return
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.as_dict(), f)
+        os.replace(tmp_path, self.path)
+
+    def after(self, label):
+        """Returns the last audited pk of the model, or None.
+        """
+        return self.pk if label == self.model else None
+
+
+def run_audit(output, models=None, labels=None, chunk_size=500, checkpoint=None,
+              progress=None):
+    """Validates every saved row of the audited models with its
+    validator and writes one JSON line per failing row to the file
+    `output`. Returns the Checkpoint of the finished audit.
+
+    Rows are streamed in pk order `chunk_size` at a time, with the
+    subject facts of each chunk prefetched, so memory does not grow
+    with the size of the tables. Pass the Checkpoint of an interrupted
+    audit, with the same `output`, to resume it. `progress` is called
+    with (label, rows, failures, seconds) after each chunk.
+    """
+    checkpoint = checkpoint or Checkpoint()
+    start = time.perf_counter()
+    if checkpoint.offset and not os.path.exists(output):
+        raise ValueError(
+            f'Cannot resume the audit, failures file not found. Got {output}.')
+    with open(output, 'r+' if checkpoint.offset else 'w', encoding='utf-8') as f:
+        f.seek(checkpoint.offset)
+        f.truncate()
+        for label, model_cls, validator_cls in registered_models(models, labels):
+            if label in checkpoint.completed:
+                continue
+            queryset = audit_queryset(model_cls, after=checkpoint.after(label))
+            for instances in chunked(queryset.iterator(chunk_size=chunk_size),
+                                     chunk_size):
+                for failure in audit_rows(validator_cls, instances):
+                    f.write(json.dumps(
+                        failure_record(label, validator_cls, failure),
+                        sort_keys=True, default=str) + '\n')
+                    checkpoint.failures += 1
+                f.flush()
+                checkpoint.model, checkpoint.pk = label, str(instances[-1].pk)
+                checkpoint.offset = f.tell()
+                checkpoint.rows += len(instances)
+                checkpoint.save()
+                if settings.DEBUG:
+                    reset_queries()
+                if progress:
+                    progress(label, checkpoint.rows, checkpoint.failures,
+                             time.perf_counter() - start)
+            checkpoint.completed.append(label)
+            checkpoint.model, checkpoint.pk = None, None
+            checkpoint.save()
+    return checkpoint
@@ -0,0 +1,6 @@
+from .fixtures import Subject, build_cohort
+from .import_time import format_import_report, import_once, run_import_benchmarks
+from .parallel_audit import format_parallel_report, run_parallel_benchmarks
+from .payloads import payload_builders
+from .rule_tables import format_rule_report, run_rule_benchmarks
+from .runner import benchmark_database, format_report, percentile, run_benchmarks
@@ -0,0 +1,108 @@
+from collections import namedtuple
+
+from edc_base.utils import get_utcnow, relativedelta
+from edc_constants.constants import NO, NOT_APPLICABLE, POS, YES
+
+from ..tests.models import (
+    AntenatalEnrollment, Appointment, KaraboSubjectScreening, ListModel,
+    MaternalArv, MaternalArvPreg, MaternalLabourDel, MaternalLifetimeArvHistory,
+    MaternalLocator, MaternalMedicalHistory, MaternalObstericalHistory,
+    MaternalUltraSoundInitial, MaternalVisit, SubjectConsent, SubjectScreening,
+    TdConsentVersion)
+
+VISIT_CODES = ('1000M', '1010M', '1020M', '2000M', '2010M', '2020M')
+
+Subject = namedtuple('Subject', [
+    'subject_identifier', 'screening_identifier', 'subject_consent',
+    'maternal_visits', 'maternal_arv_preg'])
+
+
+def build_list_models():
+    """Creates the list model choices referenced by the M2M payloads.
+    """
+    for short_name in (NOT_APPLICABLE, 'hypertension', 'Pills', 'no_one'):
+        ListModel.objects.get_or_create(name=short_name, short_name=short_name)
+
+
+def build_cohort(subjects=100, visits=3):
+    """Creates `subjects` consented, HIV positive enrolled mothers, each with
+    `visits` maternal visits, ultrasound, obstetric and medical history,
+    ARVs and labour delivery, and returns them as a list of Subject.
+    """
+    build_list_models()
+    consent_datetime = get_utcnow() - relativedelta(months=10)
+    dob = (get_utcnow() - relativedelta(years=25)).date()
+    cohort = []
+    for index in range(subjects):
+        subject_identifier = f'B142-040990{index:05d}-0'
+        screening_identifier = f'S{index:07d}'
+
+        SubjectScreening.objects.create(
+            subject_identifier=subject_identifier,
+            screening_identifier=screening_identifier,
+            report_datetime=consent_datetime,
+            has_omang=YES, age_in_years=25)
+        TdConsentVersion.objects.create(
+            screening_identifier=screening_identifier, version='3',
+            report_datetime=consent_datetime)
+        subject_consent = SubjectConsent.objects.create(
+            subject_identifier=subject_identifier,
+            screening_identifier=screening_identifier,
+            first_name='TEST ONE', last_name='TEST', initials='TOT',
+            identity=f'1111{index:05d}', gender='F', dob=dob,
+            is_literate=YES, consent_datetime=consent_datetime, version='3')
+        AntenatalEnrollment.objects.create(
+            subject_identifier=subject_identifier,
+            report_datetime=consent_datetime,
+            current_hiv_status=POS,
+            week32_test=YES,
+            week32_test_date=consent_datetime.date(),
+            enrollment_hiv_status=POS,
+            week32_result=POS,
+            rapid_test_done=YES,
+            rapid_test_result=POS,
+            rapid_test_date=consent_datetime.date())
+        MaternalLocator.objects.create(
+            subject_identifier=subject_identifier,
+            report_datetime=consent_datetime,
+            may_sms=NO, may_call=YES, may_visit_home=YES)
+        KaraboSubjectScreening.objects.create(
+            subject_identifier=subject_identifier,
+            screening_identifier=f'K{index:07d}',
+            report_datetime=consent_datetime)
+
+        maternal_visits = []
+        for visit_code in VISIT_CODES[:visits]:
+            appointment = Appointment.objects.create(
+                subject_identifier=subject_identifier,
+                appt_datetime=consent_datetime,
+                visit_code=visit_code)
+            maternal_visits.append(MaternalVisit.objects.create(
+                appointment=appointment,
+                report_datetime=consent_datetime))
+        first_visit = maternal_visits[0]
+
+        MaternalUltraSoundInitial.objects.create(
+            maternal_visit=first_visit, ga_confirmed=20)
+        MaternalObstericalHistory.objects.create(
+            maternal_visit=first_visit, prev_pregnancies=1)
+        MaternalMedicalHistory.objects.create(
+            maternal_visit=first_visit,
+            date_hiv_diagnosis=consent_datetime.date())
+        MaternalLifetimeArvHistory.objects.create(
+            maternal_visit=first_visit,
+            haart_start_date=consent_datetime.date())
+        maternal_arv_preg = MaternalArvPreg.objects.create(
+            took_arv=YES, maternal_visit=first_visit)
+        MaternalArv.objects.create(
+            maternal_arv_preg=maternal_arv_preg,
+            arv_code='Tenoforvir',
+            start_date=consent_datetime.date())
+        MaternalLabourDel.objects.create(
+            subject_identifier=subject_identifier,
+            delivery_datetime=get_utcnow() - relativedelta(months=2))
+
+        cohort.append(Subject(
+            subject_identifier, screening_identifier, subject_consent,
+            maternal_visits, maternal_arv_preg))
+    return cohort
@@ -0,0 +1,83 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+
+from .runner import percentile
+
+# run in a fresh interpreter so no validator module is imported yet;
+# timed from before django.setup() so imports done at app ready count
+IMPORT_SCRIPT = '''
+import json
+import sys
+import time
+
+modules = len(sys.modules)
+start = time.perf_counter()
+import django
+
+django.setup()
+setup_seconds = time.perf_counter() - start
+setup_imports = sorted(
+    name for name in sys.modules
+    if name.startswith('td_maternal_validators.form_validators.'))
+from td_maternal_validators import form_validators
+for name in sys.argv[1:] or form_validators.__all__:
+    getattr(form_validators, name)
+print(json.dumps({
+    'seconds': time.perf_counter() - start,
+    'setup_seconds': setup_seconds,
+    'setup_imports': setup_imports,
+    'modules': len(sys.modules) - modules}))
+'''
+
+
+def import_once(names=()):
+    """Returns the seconds and number of modules imported to set up
+    Django and resolve `names`, or all exported names, from
+    `form_validators` in a fresh interpreter, with the seconds of the
+    setup and the validator modules it imported.
+    """
+    env = dict(os.environ)
+    env.setdefault('DJANGO_SETTINGS_MODULE', settings.SETTINGS_MODULE)
+    output = subprocess.run(
+        [sys.executable, '-c', IMPORT_SCRIPT, *names],
+        env=env, stdout=subprocess.PIPE, check=True,
+        universal_newlines=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run_import_benchmarks(names=('MaternalVisitFormValidator', ), repeat=5):
+    """Times resolving `names` against resolving every exported name,
+    i.e. the cost of the former eager package import.
+    """
+    results = []
+    for label, run_names in ((', '.join(names), names), ('all', ())):
+        runs = [import_once(run_names) for _ in range(repeat)]
+        timings = [run['seconds'] * 1000 for run in runs]
+        results.append({
+            'names': label,
+            'runs': len(runs),
+            'p50_ms': percentile(timings, 50),
+            'max_ms': max(timings),
+            'setup_p50_ms': percentile(
+                [run['setup_seconds'] * 1000 for run in runs], 50),
+            'setup_imports': runs[-1]['setup_imports'],
+            'modules': runs[-1]['modules']})
+    return results
+
+
+def format_import_report(results):
+    """Returns the import results as a fixed width text table.
+    """
+    header = (f'{"names":<46} {"runs":>5} {"p50 ms":>8} {"max ms":>8} '
+              f'{"setup ms":>8} {"modules":>8}')
+    lines = [header, '-' * len(header)]
+    for result in results:
+        lines.append(
+            f'{result["names"]:<46} {result["runs"]:>5} '
+            f'{result["p50_ms"]:>8.2f} {result["max_ms"]:>8.2f} '
+            f'{result["setup_p50_ms"]:>8.2f} {result["modules"]:>8}')
+    return '\n'.join(lines)
@@ -0,0 +1,79 @@
+import filecmp
+import os
+import shutil
+import tempfile
+
+from django.db import connection
+
+from .. import form_validators
+from ..audit import audited_models, run_audit, run_parallel_audit
+from .fixtures import build_cohort
+from .runner import benchmark_database, percentile, stand_in_label, stand_in_models
+
+
+def stand_in_audit_models():
+    """Returns the audited models that have a tests.models stand-in, by
+    the stand-in label.
+    """
+    models = {}
+    for label, validator_name in audited_models.items():
+        stand_in = stand_in_label(label)
+        if stand_in:
+            models[stand_in] = validator_name
+    return models
+
+
+def run_parallel_benchmarks(subjects=100, visits=3, workers=(1, 2, 4), repeat=1,
+                            chunk_size=500):
+    """Times the parallel audit of a generated cohort, in a throwaway
+    test database, a file for SQLite, with each number of `workers`,
+    and whether the report of each matches that of `run_audit`.
+    """
+    tmp_dir = tempfile.mkdtemp()
+    test_name = None
+    if connection.vendor == 'sqlite':
+        test_name = os.path.join(tmp_dir, 'cohort.sqlite3')
+    models = stand_in_audit_models()
+    validator_classes = [
+        getattr(form_validators, name) for name in sorted(set(models.values()))]
+    results = []
+    try:
+        with benchmark_database(test_name=test_name):
+            build_cohort(subjects=subjects, visits=visits)
+            with stand_in_models(validator_classes):
+                audit_output = os.path.join(tmp_dir, 'failures.jsonl')
+                run_audit(audit_output, models=models, chunk_size=chunk_size)
+                for count in workers:
+                    output = os.path.join(tmp_dir, f'failures{count}.jsonl')
+                    runs = [
+                        run_parallel_audit(
+                            output, workers=count, models=models,
+                            chunk_size=chunk_size)
+                        for _ in range(repeat)]
+                    results.append({
+                        'workers': count,
+                        'runs': len(runs),
+                        'rows': runs[-1]['rows'],
+                        'failures': runs[-1]['failures'],
+                        'matches_audit': filecmp.cmp(
+                            audit_output, output, shallow=False),
+                        'p50_s': percentile([run['seconds'] for run in runs], 50)})
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    for result in results:
+        result['speedup'] = results[0]['p50_s'] / result['p50_s']
+    return results
+
+
+def format_parallel_report(results):
+    """Returns the parallel audit results as a fixed width text table.
+    """
+    header = (f'{"workers":>7} {"runs":>5} {"rows":>8} {"failures":>8} '
+              f'{"matches":>7} {"p50 s":>8} {"speedup":>8}')
+    lines = [header, '-' * len(header)]
+    for result in results:
+        lines.append(
+            f'{result["workers"]:>7} {result["runs"]:>5} {result["rows"]:>8} '
+            f'{result["failures"]:>8} {"yes" if result["matches_audit"] else "no":>7} '
+            f'{result["p50_s"]:>8.2f} {result["speedup"]:>7.2f}x')
+    return '\n'.join(lines)
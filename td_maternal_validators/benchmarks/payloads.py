@@ -0,0 +1,461 @@
+from edc_base.utils import get_utcnow, relativedelta
+from edc_constants.constants import (
+    ALIVE, CONTINUOUS, DEAD, NO, NOT_APPLICABLE, ON_STUDY, OTHER, POS, YES)
+
+from ..tests.models import ListModel
+
+
+def list_models(*short_names):
+    return ListModel.objects.filter(short_name__in=short_names)
+
+
+def consent_date(subject):
+    return subject.subject_consent.consent_datetime.date()
+
+
+def latest_visit(subject):
+    return subject.maternal_visits[-1]
+
+
+def antenatal_enrollment(subject):
+    valid = {
+        'subject_identifier': subject.subject_identifier,
+        'report_datetime': get_utcnow(),
+        'knows_lmp': YES,
+        'last_period_date': (get_utcnow() - relativedelta(weeks=20)).date(),
+        'current_hiv_status': POS,
+        'week32_test': YES,
+        'week32_test_date': get_utcnow().date(),
+        'week32_result': POS,
+        'rapid_test_done': NOT_APPLICABLE}
+    invalid = dict(
+        valid, last_period_date=(get_utcnow() - relativedelta(weeks=2)).date())
+    return valid, invalid
+
+
+def antenatal_visit_membership(subject):
+    valid = {
+        'subject_identifier': subject.subject_identifier,
+        'report_datetime': get_utcnow()}
+    invalid = dict(
+        valid,
+        report_datetime=subject.subject_consent.consent_datetime - relativedelta(days=1))
+    return valid, invalid
+
+
+def appointment(subject):
+    valid = {
+        'subject_identifier': subject.subject_identifier,
+        'appt_datetime': get_utcnow()}
+    return valid, dict(valid, subject_identifier=None)
+
+
+def karabo_subject_consent(subject):
+    valid = {
+        'subject_identifier': subject.subject_identifier,
+        'report_datetime': get_utcnow(),
+        'first_name': 'TEST ONE',
+        'last_name': 'TEST',
+        'initials': 'TOT',
+        'dob': subject.subject_consent.dob,
+        'identity': subject.subject_consent.identity,
+        'is_literate': YES,
+        'consent_reviewed': YES,
+        'study_questions': YES,
+        'assessment_score': YES,
+        'consent_copy': YES,
+        'consent_signature': YES}
+    return valid, dict(valid, first_name='TEST TWO')
+
+
+def karabo_subject_screening(subject):
+    valid = {
+        'subject_identifier': subject.subject_identifier,
+        'report_datetime': get_utcnow()}
+    return valid, dict(valid, report_datetime=get_utcnow() - relativedelta(years=5))
+
+
+def maternal_arv(subject):
+    start_date = consent_date(subject)
+    valid = {
+        'maternal_arv_preg': subject.maternal_arv_preg,
+        'arv_code': 'Tenoforvir',
+        'start_date': start_date,
+        'stop_date': None,
+        'reason_for_stop': None}
+    invalid = dict(
+        valid, stop_date=start_date - relativedelta(days=1),
+        reason_for_stop=OTHER)
+    return valid, invalid
+
+
+def maternal_arv_post(subject):
+    valid = {
+        'maternal_visit': latest_visit(subject),
+        'on_arv_since': NO,
+        'on_arv_reason': NOT_APPLICABLE,
+        'arv_status': NOT_APPLICABLE}
+    return valid, dict(valid, on_arv_reason='pmtct bf')
+
+
+def maternal_arv_preg(subject):
+    valid = {
+        'maternal_visit': latest_visit(subject),
+        'is_interrupt': NO,
+        'interrupt': NOT_APPLICABLE}
+    return valid, dict(valid, is_interrupt=YES)
+
+
+def maternal_clinical_measurements(subject):
+    valid = {
+        'maternal_visit': latest_visit(subject),
+        'systolic_bp': 120,
+        'diastolic_bp': 80}
+    return valid, dict(valid, systolic_bp=80, diastolic_bp=120)
+
+
+def maternal_contact(subject):
+    valid = {
+        'subject_identifier': subject.subject_identifier,
+        'report_datetime': get_utcnow(),
+        'contact_type': 'voice_call',
+        'call_reason': 'reminder',
+        'contact_success': YES,
+        'contact_comment': 'Reminded of next visit.'}
+    return valid, dict(valid, contact_type='text_message')
+
+
+def maternal_contraception(subject):
+    valid = {
+        'maternal_visit': latest_visit(subject),
+        'more_children': NO,
+        'next_child': None,
+        'uses_contraceptive': NO,
+        'contr': list_models(NOT_APPLICABLE),
+        'contraceptive_startdate': None,
+        'contraceptive_relative': list_models('no_one'),
+        'another_pregnancy': NO,
+        'pregnancy_date': None,
+        'pap_smear': NO,
+        'pap_smear_date': None,
+        'pap_smear_result': NOT_APPLICABLE,
+        'influential_decision_making': 'independent'}
+    return valid, dict(valid, more_children=YES)
+
+
+def maternal_covid_screening(subject):
+    valid = {
+        'maternal_visit': latest_visit(subject),
+        'covid_tested': NO,
+        'covid_test_date': None,
+        'is_test_date_estimated': None,
+        'covid_results': None,
+        'household_positive': NO,
+        'household_test_date': None,
+        'is_household_test_estimated': None}
+    return valid, dict(valid, covid_tested=YES)
+
+
+def maternal_demographics(subject):
+    valid = {
+        'maternal_visit': latest_visit(subject),
+        'marital_status': 'single',
+        'ethnicity': 'Black African',
+        'current_occupation': 'Student',
+        'provides_money': 'Mother',
+        'money_earned': 'P1001-5000 per month',
+        'toilet_facility': 'indoor_toilet'}
+    return valid, dict(valid, marital_status=OTHER)
+
+
+def maternal_diagnoses(subject):
+    valid = {
+        'maternal_visit': latest_visit(subject),
+        'new_diagnoses': NO,
+        'diagnoses': list_models(NOT_APPLICABLE),
+        'has_who_dx': NO,
+        'who': list_models(NOT_APPLICABLE)}
+    return valid, dict(valid, new_diagnoses=YES)
+
+
+def maternal_food_security(subject):
+    valid = {
+        'maternal_visit': latest_visit(subject),
+        'skip_meals': NO,
+        'skip_meals_frequency': NOT_APPLICABLE}
+    return valid, dict(valid, skip_meals=YES)
+
+
+def maternal_hiv_interim_hx(subject):
+    valid = {
+        'maternal_visit': latest_visit(subject),
+        'has_cd4': NO,
+        'cd4_date': None,
+        'cd4_result': None,
+        'has_vl': NO,
+        'vl_date': None,
+        'vl_detectable': NOT_APPLICABLE,
+        'vl_result': None}
+    return valid, dict(valid, has_cd4=YES)
+
+
+def maternal_interim_idcc(subject):
+    valid = {
+        'maternal_visit': latest_visit(subject),
+        'info_since_lastvisit': NO,
+        'recent_cd4': None,
+        'recent_cd4_date': None,
+        'value_vl_size': NOT_APPLICABLE,
+        'value_vl': None,
+        'recent_vl_date': None}
+    return valid, dict(valid, info_since_lastvisit=YES)
+
+
+def maternal_labour_del(subject):
+    valid = {
+        'subject_identifier': subject.subject_identifier,
+        'report_datetime': get_utcnow(),
+        'delivery_datetime': get_utcnow() - relativedelta(months=2),
+        'delivery_hospital': 'Lesirane',
+        'mode_delivery': 'spontaneous vaginal',
+        'csection_reason': NOT_APPLICABLE,
+        'delivery_complications': list_models(NOT_APPLICABLE),
+        'valid_regiment_duration': YES,
+        'arv_initiation_date': consent_date(subject),
+        'still_births': 0,
+        'live_infants_to_register': 1}
+    return valid, dict(valid, live_infants_to_register=0)
+
+
+def maternal_lifetime_arv_history(subject):
+    valid = {
+        'maternal_visit': subject.maternal_visits[0],
+        'report_datetime': get_utcnow(),
+        'haart_start_date': consent_date(subject),
+        'preg_on_haart': YES,
+        'prior_preg': CONTINUOUS,
+        'prior_arv': list_models(NOT_APPLICABLE),
+        'prev_preg_azt': NOT_APPLICABLE,
+        'prev_sdnvp_labour': NOT_APPLICABLE,
+        'prev_preg_haart': NOT_APPLICABLE}
+    return valid, dict(valid, preg_on_haart=NO)
+
+
+def maternal_medical_history(subject):
+    valid = {
+        'maternal_visit': subject.maternal_visits[0],
+        'chronic_since': NO,
+        'who_diagnosis': NO,
+        'who': list_models(NOT_APPLICABLE),
+        'mother_chronic': list_models(NOT_APPLICABLE),
+        'father_chronic': list_models(NOT_APPLICABLE),
+        'mother_medications': list_models(NOT_APPLICABLE),
+        'sero_posetive': YES,
+        'date_hiv_diagnosis': consent_date(subject),
+        'perinataly_infected': NO,
+        'know_hiv_status': YES,
+        'lowest_cd4_known': NO,
+        'cd4_count': None,
+        'cd4_date': None,
+        'is_date_estimated': None}
+    return valid, dict(valid, sero_posetive=NO)
+
+
+def maternal_obsterical_history(subject):
+    valid = {
+        'maternal_visit': subject.maternal_visits[0],
+        'prev_pregnancies': 1,
+        'pregs_24wks_or_more': 0,
+        'lost_before_24wks': 0,
+        'lost_after_24wks': 0,
+        'children_deliv_before_37wks': 0,
+        'children_deliv_aftr_37wks': 0}
+    return valid, dict(valid, lost_after_24wks=1)
+
+
+def maternal_postpartum_fu(subject):
+    valid = {
+        'maternal_visit': latest_visit(subject),
+        'hospitalized': NO,
+        'hospitalization_reason': list_models(NOT_APPLICABLE),
+        'hospitalization_days': None,
+        'new_diagnoses': NO,
+        'diagnoses': list_models(NOT_APPLICABLE),
+        'has_who_dx': NO,
+        'who': list_models(NOT_APPLICABLE)}
+    return valid, dict(valid, hospitalized=YES)
+
+
+def maternal_rando(subject):
+    valid = {
+        'maternal_visit': subject.maternal_visits[0],
+        'delivery_clinic': 'PMH',
+        'delivery_clinic_other': None}
+    return valid, dict(valid, delivery_clinic=OTHER)
+
+
+def maternal_recontact(subject):
+    valid = {'future_contact': YES, 'reason_no_contact': None}
+    return valid, dict(valid, future_contact=NO)
+
+
+def maternal_srh(subject):
+    valid = {
+        'maternal_visit': latest_visit(subject),
+        'seen_at_clinic': YES,
+        'reason_unseen_clinic': None,
+        'is_contraceptive_initiated': YES,
+        'contr': list_models('Pills'),
+        'reason_not_initiated': None}
+    return valid, dict(valid, seen_at_clinic=NO)
+
+
+def maternal_substance_use_during_preg(subject):
+    valid = {
+        'maternal_visit': latest_visit(subject),
+        'smoked_during_pregnancy': NO,
+        'smoking_during_preg_freq': None,
+        'alcohol_during_pregnancy': NO,
+        'alcohol_during_preg_freq': None,
+        'marijuana_during_preg': NO,
+        'marijuana_during_preg_freq': None}
+    return valid, dict(valid, smoked_during_pregnancy=YES)
+
+
+def maternal_substance_use_prior_preg(subject):
+    valid = {
+        'maternal_visit': latest_visit(subject),
+        'smoked_prior_to_preg': NO,
+        'smoking_prior_preg_freq': None,
+        'alcohol_prior_pregnancy': NO,
+        'alcohol_prior_preg_freq': None,
+        'marijuana_prior_preg': NO,
+        'marijuana_prior_preg_freq': None}
+    return valid, dict(valid, smoked_prior_to_preg=YES)
+
+
+def maternal_tuberculosis_history(subject):
+    valid = {
+        'maternal_visit': latest_visit(subject),
+        'coughing': NO,
+        'coughing_rel': None,
+        'diagnosis': NO,
+        'diagnosis_rel': None,
+        'tb_treatment': NO,
+        'tb_treatment_rel': None}
+    return valid, dict(valid, coughing=YES)
+
+
+def maternal_ultrasound_initial(subject):
+    valid = {
+        'maternal_visit': subject.maternal_visits[0],
+        'report_datetime': get_utcnow(),
+        'est_edd_ultrasound': (get_utcnow() + relativedelta(weeks=20)).date(),
+        'ga_by_ultrasound_wks': 20,
+        'ga_by_ultrasound_days': 3}
+    return valid, dict(valid, ga_by_ultrasound_wks=41)
+
+
+def maternal_visit(subject):
+    valid = {
+        'appointment': latest_visit(subject).appointment,
+        'report_datetime': get_utcnow(),
+        'survival_status': ALIVE,
+        'last_alive_date': get_utcnow().date(),
+        'study_status': ON_STUDY,
+        'require_crfs': YES,
+        'covid_visit': NO,
+        'is_present': YES}
+    return valid, dict(valid, survival_status=DEAD)
+
+
+def rapid_test_result(subject):
+    valid = {
+        'maternal_visit': latest_visit(subject),
+        'rapid_test_done': YES,
+        'result_date': get_utcnow().date(),
+        'result': POS}
+    invalid = dict(
+        valid, result_date=consent_date(subject) - relativedelta(days=1))
+    return valid, invalid
+
+
+def specimen_consent(subject):
+    valid = {
+        'subject_identifier': subject.subject_identifier,
+        'consent_datetime': get_utcnow(),
+        'is_literate': YES,
+        'witness_name': None,
+        'may_store_samples': YES,
+        'consent_reviewed': YES,
+        'assessment_score': YES,
+        'consent_copy': YES}
+    return valid, dict(valid, is_literate=NO)
+
+
+def subject_consent(subject):
+    valid = {
+        'subject_identifier': subject.subject_identifier,
+        'screening_identifier': subject.screening_identifier,
+        'consent_datetime': get_utcnow(),
+        'dob': subject.subject_consent.dob,
+        'first_name': 'TEST ONE',
+        'last_name': 'TEST',
+        'initials': 'TOT',
+        'citizen': YES,
+        'identity': '111121111',
+        'identity_type': 'country_id',
+        'is_literate': YES,
+        'recruit_source': 'ANC clinic staff',
+        'recruitment_clinic': 'PMH'}
+    return valid, dict(valid, citizen=NO)
+
+
+def td_consent_version(subject):
+    valid = {
+        'subject_identifier': subject.subject_identifier,
+        'screening_identifier': subject.screening_identifier,
+        'report_datetime': get_utcnow()}
+    invalid = dict(
+        valid,
+        report_datetime=subject.subject_consent.consent_datetime - relativedelta(days=1))
+    return valid, invalid
+
+
+payload_builders = {
+    'AntenatalEnrollmentFormValidator': antenatal_enrollment,
+    'AntenatalVisitMembershipFormValidator': antenatal_visit_membership,
+    'AppointmentFormValidator': appointment,
+    'KaraboSubjectConsentFormValidator': karabo_subject_consent,
+    'KaraboSubjectScreeningFormValidator': karabo_subject_screening,
+    'MarternalArvPostFormValidator': maternal_arv_post,
+    'MaternalArvFormValidator': maternal_arv,
+    'MaternalArvPregFormValidator': maternal_arv_preg,
+    'MaternalClinicalMeasurememtsOneFormValidator': maternal_clinical_measurements,
+    'MaternalClinicalMeasurememtsTwoFormValidator': maternal_clinical_measurements,
+    'MaternalContactFormValidator': maternal_contact,
+    'MaternalContraceptionFormValidator': maternal_contraception,
+    'MaternalCovidScreeningFormValidator': maternal_covid_screening,
+    'MaternalDemographicsFormValidator': maternal_demographics,
+    'MaternalDiagnosesFormValidator': maternal_diagnoses,
+    'MaternalFoodSecurityFormValidator': maternal_food_security,
+    'MaternalHivInterimHxFormValidator': maternal_hiv_interim_hx,
+    'MaternalIterimIdccFormValidator': maternal_interim_idcc,
+    'MaternalLabDelFormValidator': maternal_labour_del,
+    'MaternalLifetimeArvHistoryFormValidator': maternal_lifetime_arv_history,
+    'MaternalMedicalHistoryFormValidator': maternal_medical_history,
+    'MaternalObstericalHistoryFormValidator': maternal_obsterical_history,
+    'MaternalPostPartumFuFormValidator': maternal_postpartum_fu,
+    'MaternalRandoFormValidator': maternal_rando,
+    'MaternalRecontactFormValidator': maternal_recontact,
+    'MaternalSrhFormValidator': maternal_srh,
+    'MaternalSubstanceUseDuringPregFormValidator': maternal_substance_use_during_preg,
+    'MaternalSubstanceUsePriorPregFormValidator': maternal_substance_use_prior_preg,
+    'MaternalTuberculosisHistoryFormValidator': maternal_tuberculosis_history,
+    'MaternalUltrasoundInitialFormValidator': maternal_ultrasound_initial,
+    'MaternalVisitFormValidator': maternal_visit,
+    'RapidTestResultFormValidator': rapid_test_result,
+    'SpecimenConsentFormValidator': specimen_consent,
+    'SubjectConsentFormValidator': subject_consent,
+    'TDConsentVersionFormValidator': td_consent_version,
+}
@@ -0,0 +1,83 @@
+import time
+
+from django.core.exceptions import ValidationError
+
+from ..form_validators import RuleTableMixin
+from .payloads import payload_builders
+from .runner import benchmarked_validators, percentile
+
+
+def rule_table_validators(names=None):
+    """Returns the benchmarked validator classes with a rule table,
+    optionally limited to `names`.
+    """
+    return [
+        validator_cls for validator_cls in benchmarked_validators(names)
+        if issubclass(validator_cls, RuleTableMixin) and validator_cls.rules]
+
+
+def helper_rules(validator_cls):
+    """Returns the compiled rules of the validator without their checks,
+    so every rule runs its FormValidator helper.
+    """
+    return tuple(
+        (None, function, args, kwargs)
+        for _, function, args, kwargs in validator_cls._compiled_rules)
+
+
+def time_rules(validator_cls, cleaned_data, compiled_rules=None):
+    """Returns the seconds of one `apply_rules` of the validator on
+    `cleaned_data`, with `compiled_rules` if given.
+    """
+    form_validator = validator_cls(cleaned_data=cleaned_data)
+    if compiled_rules is not None:
+        form_validator._compiled_rules = compiled_rules
+    start = time.perf_counter()
+    try:
+        form_validator.apply_rules()
+    except ValidationError:
+        pass
+    return time.perf_counter() - start
+
+
+def run_rule_benchmarks(cohort, validator_names=None, repeat=100):
+    """Times `apply_rules` of the rule table validators on the valid and
+    invalid payload of every subject in `cohort`, with the compiled
+    checks against calling every rule helper.
+    """
+    results = []
+    for validator_cls in rule_table_validators(validator_names):
+        builder = payload_builders[validator_cls.__name__]
+        helpers = helper_rules(validator_cls)
+        for index, kind in enumerate(('valid', 'invalid')):
+            checked_runs, helper_runs = [], []
+            for subject in cohort:
+                cleaned_data = builder(subject)[index]
+                for _ in range(repeat):
+                    checked_runs.append(time_rules(validator_cls, cleaned_data))
+                    helper_runs.append(
+                        time_rules(validator_cls, cleaned_data, helpers))
+            checked_us = percentile(checked_runs, 50) * 1e6
+            helpers_us = percentile(helper_runs, 50) * 1e6
+            results.append({
+                'validator': validator_cls.__name__,
+                'payload': kind,
+                'runs': len(checked_runs),
+                'checked_p50_us': checked_us,
+                'helpers_p50_us': helpers_us,
+                'speedup': helpers_us / checked_us if checked_us else None})
+    return results
+
+
+def format_rule_report(results):
+    """Returns the rule table results as a fixed width text table.
+    """
+    header = (f'{"validator":<46} {"payload":<8} {"runs":>6} '
+              f'{"checked us":>10} {"helpers us":>10} {"speedup":>8}')
+    lines = [header, '-' * len(header)]
+    for result in results:
+        lines.append(
+            f'{result["validator"]:<46} {result["payload"]:<8} '
+            f'{result["runs"]:>6} {result["checked_p50_us"]:>10.2f} '
+            f'{result["helpers_p50_us"]:>10.2f} {result["speedup"] or 0:>7.2f}x')
+    return '\n'.join(lines)
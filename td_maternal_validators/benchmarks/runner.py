@@ -0,0 +1,191 @@
+import inspect
+import math
+import time
+from contextlib import contextmanager
+
+from django.apps import apps as django_apps
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import (
+    CaptureQueriesContext, setup_test_environment, teardown_test_environment)
+from edc_constants.constants import POS
+
+from .. import form_validators
+from ..form_validators import SubjectContext
+from .payloads import payload_builders
+
+APP_LABEL = 'td_maternal_validators'
+
+
+class MaternalStatusHelper:
+    """Stands in for td_maternal's MaternalStatusHelper, as in the tests.
+    """
+
+    hiv_status = POS
+
+
+def percentile(values, percent):
+    """Returns the nearest-rank percentile of `values`.
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+def benchmarked_validators(names=None):
+    """Returns the exported form validator classes with a payload
+    builder, optionally limited to `names`.
+    """
+    validators = []
+    for name in form_validators.__all__:
+        if name in payload_builders and (not names or name in names):
+            validators.append(getattr(form_validators, name))
+    return validators
+
+
+def stand_in_label(label):
+    """Returns the label of the tests.models stand-in for `label`
+    or None.
+    """
+    try:
+        model_name = label.split('.')[1]
+        django_apps.get_model(APP_LABEL, model_name)
+    except (IndexError, LookupError):
+        return None
+    return f'{APP_LABEL}.{model_name}'
+
+
+@contextmanager
+def stand_in_models(validator_classes):
+    """Points the `*_model` labels of the validators, and of their
+    subject context, at the tests.models stand-ins and replaces the
+    maternal status helper, restoring the classes on exit.
+    """
+    originals = []
+    for cls in [SubjectContext, *validator_classes]:
+        for name in dir(cls):
+            value = inspect.getattr_static(cls, name)
+            if name == 'maternal_status_helper':
+                replacement = MaternalStatusHelper()
+            elif name.endswith('_model') and isinstance(value, str):
+                replacement = stand_in_label(value)
+            else:
+                continue
+            if replacement:
+                originals.append((cls, name, cls.__dict__.get(name, None),
+                                  name in cls.__dict__))
+                setattr(cls, name, replacement)
+    try:
+        yield
+    finally:
+        for cls, name, value, own in reversed(originals):
+            if own:
+                setattr(cls, name, value)
+            else:
+                delattr(cls, name)
+
+
+@contextmanager
+def benchmark_database(verbosity=0, test_name=None):
+    """Creates a throwaway test database with the tests.models tables
+    for the duration of the benchmark.
+
+    `test_name` names the test database, e.g. a file for SQLite, which
+    is otherwise in memory, so forked workers can share it.
+    """
+    test_settings = connection.settings_dict.setdefault('TEST', {})
+    old_test_name = test_settings.get('NAME')
+    if test_name:
+        test_settings['NAME'] = test_name
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(
+        verbosity=verbosity, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=verbosity)
+        teardown_test_environment()
+        test_settings['NAME'] = old_test_name
+
+
+def run_once(validator_cls, cleaned_data):
+    """Runs one validation and returns (outcome, seconds, queries,
+    exception).
+    """
+    with CaptureQueriesContext(connection) as queries:
+        start = time.perf_counter()
+        try:
+            validator_cls(cleaned_data=cleaned_data).validate()
+        except ValidationError as e:
+            outcome, exception = 'invalid', e
+        except Exception as e:
+            outcome, exception = 'error', e
+        else:
+            outcome, exception = 'valid', None
+        elapsed = time.perf_counter() - start
+    return outcome, elapsed, len(queries), exception
+
+
+def run_benchmarks(cohort, validator_names=None, repeat=1):
+    """Validates the valid and invalid payload of every subject in
+    `cohort` with each benchmarked validator and returns one result
+    per validator and payload kind.
+    """
+    validator_classes = benchmarked_validators(validator_names)
+    results = []
+    with stand_in_models(validator_classes):
+        for validator_cls in validator_classes:
+            builder = payload_builders[validator_cls.__name__]
+            runs = {'valid': [], 'invalid': []}
+            for _ in range(repeat):
+                for subject in cohort:
+                    valid, invalid = builder(subject)
+                    runs['valid'].append(run_once(validator_cls, valid))
+                    runs['invalid'].append(run_once(validator_cls, invalid))
+            for kind, kind_runs in runs.items():
+                results.append(summarize(validator_cls.__name__, kind, kind_runs))
+    return results
+
+
+def summarize(validator_name, kind, runs):
+    timings = [elapsed * 1000 for _, elapsed, _, _ in runs]
+    queries = [count for _, _, count, _ in runs]
+    outcomes = [outcome for outcome, _, _, _ in runs]
+    errors = [repr(e) for outcome, _, _, e in runs if outcome == 'error']
+    return {
+        'validator': validator_name,
+        'payload': kind,
+        'runs': len(runs),
+        'p50_ms': percentile(timings, 50),
+        'p90_ms': percentile(timings, 90),
+        'p99_ms': percentile(timings, 99),
+        'mean_queries': sum(queries) / len(queries) if queries else 0,
+        'max_queries': max(queries, default=0),
+        'valid': outcomes.count('valid'),
+        'invalid': outcomes.count('invalid'),
+        'errors': outcomes.count('error'),
+        'first_error': errors[0] if errors else None}
+
+
+def format_report(results):
+    """Returns the results as a fixed width text table.
+    """
+    header = (f'{"validator":<46} {"payload":<8} {"runs":>5} {"p50 ms":>8} '
+              f'{"p90 ms":>8} {"p99 ms":>8} {"queries":>8} {"max q":>6} '
+              f'{"valid":>6} {"invalid":>7} {"errors":>6}')
+    lines = [header, '-' * len(header)]
+    for result in results:
+        lines.append(
+            f'{result["validator"]:<46} {result["payload"]:<8} '
+            f'{result["runs"]:>5} {result["p50_ms"] or 0:>8.2f} '
+            f'{result["p90_ms"] or 0:>8.2f} {result["p99_ms"] or 0:>8.2f} '
+            f'{result["mean_queries"]:>8.1f} {result["max_queries"]:>6} '
+            f'{result["valid"]:>6} {result["invalid"]:>7} {result["errors"]:>6}')
+    for result in results:
+        if result['first_error']:
+            lines.append(
+                f'{result["validator"]} ({result["payload"]}): '
+                f'{result["first_error"]}')
+    return '\n'.join(lines)
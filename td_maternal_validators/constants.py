@@ -1,2 +1,3 @@
 RESTARTED = 'restarted'
 NEVER_STARTED = 'never started'
+OFFSTUDY_SCHEDULED = 'offstudy_scheduled'
@@ -1,38 +1,105 @@
-from .antenatal_enrollment_form_validation import AntenatalEnrollmentFormValidator
-from .antenatal_visit_membership_form_validation import AntenatalVisitMembershipFormValidator
-from .appointment_form_validator import AppointmentFormValidator
-from .crf_form_validator import TDCRFFormValidator
-from .form_validator_mixin import TDFormValidatorMixin
-from .karabo_subject_consent_form_validation import KaraboSubjectConsentFormValidator
-from .karabo_subject_screening_form_validation import KaraboSubjectScreeningFormValidator
-from .maternal_arv_form_validation import MaternalArvFormValidator
-from .maternal_arv_post_form_validator import MarternalArvPostFormValidator
-from .maternal_arv_preg_form_validation import MaternalArvPregFormValidator
-from .maternal_clinical_measurements_one_form_validation import MaternalClinicalMeasurememtsOneFormValidator
-from .maternal_clinical_measurements_two_form_validation import MaternalClinicalMeasurememtsTwoFormValidator
-from .maternal_contact_form_validation import MaternalContactFormValidator
-from .maternal_contraception_form_validation import MaternalContraceptionFormValidator
-from .maternal_covid_screening_form_validation import MaternalCovidScreeningFormValidator
-from .maternal_demographics_form_validation import MaternalDemographicsFormValidator
-from .maternal_diagnoses_form_validation import MaternalDiagnosesFormValidator
-from .maternal_food_security_form_validation import MaternalFoodSecurityFormValidator
-from .maternal_hiv_interim_hx_form_validation import MaternalHivInterimHxFormValidator
-from .maternal_interim_idcc_form_validation import MaternalIterimIdccFormValidator
-from .maternal_labour_del_form_validation import MaternalLabDelFormValidator
-from .maternal_lifetime_arv_history_form_validation import MaternalLifetimeArvHistoryFormValidator
-from .maternal_medical_history_form_validation import MaternalMedicalHistoryFormValidator
-from .maternal_obsterical_history_form_validation import MaternalObstericalHistoryFormValidator
-from .maternal_postpartum_fu_form_validation import MaternalPostPartumFuFormValidator
-from .maternal_rando_form_validation import MaternalRandoFormValidator
-from .maternal_recontact_form_validator import MaternalRecontactFormValidator
-from .maternal_srh_form_validation import MaternalSrhFormValidator
-from .maternal_substance_during_preg_form_validation import MaternalSubstanceUseDuringPregFormValidator
-from .maternal_substance_use_prior_preg_form_validation import MaternalSubstanceUsePriorPregFormValidator
-from .maternal_turbeculosis_form_validation import MaternalTuberculosisHistoryFormValidator
-from .maternal_ultrasound_initial_form_validation import MaternalUltrasoundInitialFormValidator
-from .maternal_visit_form_validation import MaternalVisitFormValidator
-from .rapid_test_result_form_validation import RapidTestResultFormValidator
-from .specimen_consent_form_validation import SpecimenConsentFormValidator
-from .subject_consent_form_validation import SubjectConsentFormValidator
-from .td_consent_version_form_validation import TDConsentVersionFormValidator
+"""Form validators for the td_maternal CRFs and PRN forms.
 
+Names are imported from their modules on first access, so importing
+one validator does not import the others and their dependencies.
+"""
+import sys
+from importlib import import_module
+
+_exports = {
+    'AntenatalEnrollmentFormValidator': 'antenatal_enrollment_form_validation',
+    'AntenatalVisitMembershipFormValidator': 'antenatal_visit_membership_form_validation',
+    'AppointmentFormValidator': 'appointment_form_validator',
+    'AsyncValidationMixin': 'async_validation',
+    'validate_many': 'batch',
+    'CollectErrorsMixin': 'collect_errors',
+    'DependencyInvalidator': 'dependency_invalidation',
+    'dependency_invalidator': 'dependency_invalidation',
+    'Dependency': 'dependency_manifest',
+    'dependency_manifest': 'dependency_manifest',
+    'manifest_labels': 'dependency_manifest',
+    'TDCRFFormValidator': 'crf_form_validator',
+    'TDFormValidatorMixin': 'form_validator_mixin',
+    'KaraboEligibility': 'karabo_eligibility',
+    'karabo_eligibility': 'karabo_eligibility',
+    'KaraboWindow': 'karabo_eligibility',
+    'KaraboWindowReport': 'karabo_eligibility',
+    'KaraboSubjectConsentFormValidator': 'karabo_subject_consent_form_validation',
+    'KaraboSubjectScreeningFormValidator': 'karabo_subject_screening_form_validation',
+    'ListModelIndex': 'list_model_index',
+    'list_model_index': 'list_model_index',
+    'M2MSnapshotMixin': 'm2m_snapshot',
+    'MaternalArvFormValidator': 'maternal_arv_form_validation',
+    'MarternalArvPostFormValidator': 'maternal_arv_post_form_validator',
+    'MaternalArvPregFormValidator': 'maternal_arv_preg_form_validation',
+    'MaternalClinicalMeasurememtsOneFormValidator':
+        'maternal_clinical_measurements_one_form_validation',
+    'MaternalClinicalMeasurememtsTwoFormValidator':
+        'maternal_clinical_measurements_two_form_validation',
+    'MaternalContactFormValidator': 'maternal_contact_form_validation',
+    'MaternalContraceptionFormValidator': 'maternal_contraception_form_validation',
+    'MaternalCovidScreeningFormValidator': 'maternal_covid_screening_form_validation',
+    'MaternalDemographicsFormValidator': 'maternal_demographics_form_validation',
+    'MaternalDiagnosesFormValidator': 'maternal_diagnoses_form_validation',
+    'MaternalFoodSecurityFormValidator': 'maternal_food_security_form_validation',
+    'MaternalHivInterimHxFormValidator': 'maternal_hiv_interim_hx_form_validation',
+    'MaternalIterimIdccFormValidator': 'maternal_interim_idcc_form_validation',
+    'MaternalLabDelFormValidator': 'maternal_labour_del_form_validation',
+    'MaternalLifetimeArvHistoryFormValidator': 'maternal_lifetime_arv_history_form_validation',
+    'MaternalMedicalHistoryFormValidator': 'maternal_medical_history_form_validation',
+    'MaternalObstericalHistoryFormValidator': 'maternal_obsterical_history_form_validation',
+    'MaternalPostPartumFuFormValidator': 'maternal_postpartum_fu_form_validation',
+    'MaternalRandoFormValidator': 'maternal_rando_form_validation',
+    'MaternalRecontactFormValidator': 'maternal_recontact_form_validator',
+    'MaternalSrhFormValidator': 'maternal_srh_form_validation',
+    'MaternalStatus': 'maternal_status',
+    'MaternalStatusCache': 'maternal_status',
+    'MaternalStatusMixin': 'maternal_status',
+    'maternal_status_cache': 'maternal_status',
+    'MaternalSubstanceUseDuringPregFormValidator':
+        'maternal_substance_during_preg_form_validation',
+    'MaternalSubstanceUsePriorPregFormValidator':
+        'maternal_substance_use_prior_preg_form_validation',
+    'MaternalTuberculosisHistoryFormValidator': 'maternal_turbeculosis_form_validation',
+    'MaternalUltrasoundInitialFormValidator': 'maternal_ultrasound_initial_form_validation',
+    'MaternalVisitFormValidator': 'maternal_visit_form_validation',
+    'OffstudyStatus': 'offstudy_status',
+    'OffstudyStatusMixin': 'offstudy_status',
+    'RapidTestResultFormValidator': 'rapid_test_result_form_validation',
+    'ResultCacheMixin': 'result_cache',
+    'RuleTableMixin': 'rule_table',
+    'SpecimenConsentFormValidator': 'specimen_consent_form_validation',
+    'SubjectConsentFormValidator': 'subject_consent_form_validation',
+    'SubjectContext': 'subject_context',
+    'SubjectContextMixin': 'subject_context',
+    'subject_context_scope': 'subject_context',
+    'SubjectFacts': 'subject_facts',
+    'SubjectFactsCache': 'subject_facts',
+    'subject_facts_cache': 'subject_facts',
+    'SubjectTimeline': 'subject_facts',
+    'TDConsentVersionFormValidator': 'td_consent_version_form_validation',
+    'ResolvedVisit': 'visit_resolution',
+    'VisitResolutionMixin': 'visit_resolution',
+}
+
+__all__ = sorted(_exports)
+
+
+def __getattr__(name):
+    try:
+        module_name = _exports[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):
+    # module __getattr__ (PEP 562) is not available, import eagerly
+    for _name in __all__:
+        __getattr__(_name)
@@ -1,6 +1,7 @@
 from edc_appointment.form_validators import (
     AppointmentFormValidator as BaseAppointmentFormValidator)
 from .crf_form_validator import TDCRFFormValidator
+from .dependency_manifest import Dependency
 
 
 class AppointmentFormValidator(TDCRFFormValidator,
@@ -8,6 +9,9 @@ class AppointmentFormValidator(TDCRFFormValidator,
 
     appointment_model = 'edc_appointment.appointment'
 
+    dependencies = (
+        Dependency('appointment_model', 'subject_identifier'), )
+
     def clean(self):
         cleaned_data = self.cleaned_data
         self.subject_identifier = cleaned_data.get('subject_identifier')
@@ -0,0 +1,114 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.db import connection, connections
+
+from .batch import row_subject_identifier
+from .subject_context import SubjectContextMixin
+
+
+class AsyncValidationMixin(SubjectContextMixin):
+    """Adds `aclean` and `avalidate` for async views and API handlers.
+
+    Before the usual `clean` runs, the subject facts and the validator's
+    own `prefetch_lookups` are fetched in the calling thread, so `clean`
+    reads them from memory.
+
+    Set `async_thread_sensitive = False` to fetch them concurrently, one
+    thread per group, in about one database round trip. The threads
+    use their own connections, so a caller inside a transaction, e.g.
+    with ATOMIC_REQUESTS, still fetches in its own thread, as the
+    threads would not see its uncommitted rows.
+    """
+
+    async_thread_sensitive = True
+
+    # facts in a group depend on each other and are fetched in order
+    prefetch_fact_groups = (
+        ('subject_screening', 'consent_version'),
+        ('consents', ),
+        ('offstudy_action_item', ),
+        ('maternal_offstudy', ),
+        ('antenatal_enrollment', ),
+        ('maternal_labour_del', ),
+    )
+
+    # names of validator methods, taking no arguments, that look up and
+    # memoize a prerequisite by subject_identifier, see `lookup`.
+    prefetch_lookups = ()
+
+    def lookup(self, name, loader):
+        """Returns the result of `loader` memoized by name for the
+        validator's subject_identifier.
+        """
+        try:
+            lookups = self._lookups
+        except AttributeError:
+            lookups = self._lookups = {}
+        key = (name, self.subject_identifier)
+        try:
+            return lookups[key]
+        except KeyError:
+            value = lookups[key] = loader()
+            return value
+
+    async def aprefetch(self):
+        """Fetches the subject facts and `prefetch_lookups` concurrently.
+        """
+        if getattr(self, 'subject_identifier', None) is None:
+            self.subject_identifier = row_subject_identifier(self.cleaned_data)
+        if self.subject_identifier is None:
+            return
+        context, in_atomic_block = await sync_to_async(
+            self.caller_state, thread_sensitive=True)()
+        thread_sensitive = self.async_thread_sensitive or in_atomic_block
+        facts = self.subject_context_facts()
+        fact_groups = [
+            names for names in self.prefetch_fact_groups
+            if facts is None or set(names) & set(facts)]
+        await asyncio.gather(
+            *[self.run_concurrently(
+                thread_sensitive, self.load_facts, context, names)
+              for names in fact_groups],
+            *[self.run_concurrently(thread_sensitive, self.load_lookup, name)
+              for name in self.prefetch_lookups])
+
+    def caller_state(self):
+        """Returns the subject context, as shared in the calling thread's
+        `subject_context_scope`, and whether the calling thread is in a
+        transaction.
+        """
+        return self.subject_context, connection.in_atomic_block
+
+    def run_concurrently(self, thread_sensitive, function, *args):
+        return sync_to_async(
+            self._in_worker(thread_sensitive, function),
+            thread_sensitive=thread_sensitive)(*args)
+
+    @staticmethod
+    def _in_worker(thread_sensitive, function):
+        if thread_sensitive:
+            return function
+
+        def worker(*args):
+            try:
+                return function(*args)
+            finally:
+                connections.close_all()
+        return worker
+
+    @staticmethod
+    def load_facts(context, names):
+        for name in names:
+            getattr(context, name)
+
+    def load_lookup(self, name):
+        getattr(self, name)()
+
+    async def aclean(self):
+        await self.aprefetch()
+        return await sync_to_async(self.clean, thread_sensitive=True)()
+
+    async def avalidate(self):
+        await self.aprefetch()
+        return await sync_to_async(self.validate, thread_sensitive=True)()
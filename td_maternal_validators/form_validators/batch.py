@@ -0,0 +1,75 @@
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+
+from .subject_context import SubjectContext, context_key, subject_context_scope
+
+
+def row_subject_identifier(cleaned_data):
+    """Returns the maternal subject_identifier a row of cleaned data
+    belongs to.
+    """
+    if cleaned_data.get('subject_identifier'):
+        return cleaned_data.get('subject_identifier')
+    for field in ('maternal_visit', 'appointment'):
+        if cleaned_data.get(field):
+            return cleaned_data.get(field).subject_identifier
+    if cleaned_data.get('maternal_arv_preg'):
+        return cleaned_data.get('maternal_arv_preg').maternal_visit.subject_identifier
+    return None
+
+
+def validation_errors(validation_error):
+    """Returns a ValidationError as a dictionary of messages by field.
+    """
+    if hasattr(validation_error, 'error_dict'):
+        return validation_error.message_dict
+    return {NON_FIELD_ERRORS: validation_error.messages}
+
+
+def share_prefetched_contexts(shared_contexts, form_validator, rows, chunk_size=500):
+    """Adds the subject contexts of the subjects in `rows`, prefetched
+    with the model labels and facts of `form_validator`, to
+    `shared_contexts`.
+    """
+    model_labels = getattr(form_validator, 'subject_context_models', None)
+    if model_labels is None:
+        return
+    contexts = SubjectContext.prefetch(
+        [row_subject_identifier(row) for row in rows], chunk_size=chunk_size,
+        facts=form_validator.subject_context_facts(), **model_labels)
+    shared_contexts.update(
+        {context_key(subject_identifier, model_labels): context
+         for subject_identifier, context in contexts.items()})
+
+
+def validate_many(validator_cls, rows, instances=None, chunk_size=500):
+    """Validates rows of cleaned data with `validator_cls`, returning
+    a list of error dictionaries in row order (empty if valid).
+
+    Subject facts are prefetched for all subjects in the rows before
+    any row is validated.
+    """
+    rows = list(rows)
+    instances = list(instances) if instances is not None else [None] * len(rows)
+    if len(instances) != len(rows):
+        raise ValueError(
+            f'Expected one instance per row. Got {len(instances)} instances '
+            f'for {len(rows)} rows.')
+
+    form_validators = [
+        validator_cls(cleaned_data=cleaned_data, instance=instance)
+        for cleaned_data, instance in zip(rows, instances)]
+    if not form_validators:
+        return []
+
+    results = []
+    with subject_context_scope() as shared_contexts:
+        share_prefetched_contexts(
+            shared_contexts, form_validators[0], rows, chunk_size=chunk_size)
+        for form_validator in form_validators:
+            try:
+                form_validator.validate()
+            except ValidationError as e:
+                results.append(validation_errors(e))
+            else:
+                results.append({})
+    return results
@@ -0,0 +1,101 @@
+from functools import wraps
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+
+from .batch import validation_errors
+
+
+def collecting_step(method):
+    """Wraps a `validate_*` method so that, while the validator collects
+    all errors, a field error it raises is recorded and the step returns
+    None instead of raising.
+
+    Non-field errors, and any error of a step named in the validator's
+    `prerequisite_steps`, e.g. a missing prerequisite form, are raised
+    as usual and end `clean`.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self._collecting or self._in_step:
+            return method(self, *args, **kwargs)
+        self._in_step = True
+        try:
+            return method(self, *args, **kwargs)
+        except ValidationError as e:
+            if (not hasattr(e, 'error_dict')
+                    or method.__name__ in self.prerequisite_steps):
+                raise
+            self.record_errors(e)
+            return None
+        finally:
+            self._in_step = False
+    wrapper._collecting_step = True
+    return wrapper
+
+
+class CollectErrorsMixin:
+    """Optionally runs every `validate_*` step of `clean` and raises the
+    errors of all failing steps together at the end.
+
+    Enable per class or instance with `collect_all_errors = True`, or
+    for all validators with settings.TD_MATERNAL_VALIDATORS_COLLECT_ALL_ERRORS.
+    Errors raised outside the `validate_*` steps, or by one of the
+    `prerequisite_steps`, still end `clean`.
+    """
+
+    collect_all_errors = None
+
+    # `validate_*` steps checking for a prerequisite form or record; the
+    # later steps cannot run without it, so their errors end `clean`
+    prerequisite_steps = ()
+
+    _collecting = False
+    _in_step = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, value in list(vars(cls).items()):
+            if (name.startswith('validate_') and callable(value)
+                    and not getattr(value, '_collecting_step', False)):
+                setattr(cls, name, collecting_step(value))
+
+    @property
+    def collects_all_errors(self):
+        if self.collect_all_errors is not None:
+            return self.collect_all_errors
+        return getattr(
+            settings, 'TD_MATERNAL_VALIDATORS_COLLECT_ALL_ERRORS', False)
+
+    def record_errors(self, validation_error):
+        """Merges the messages of a ValidationError into the errors
+        collected so far.
+
+        The collected errors are new lists of message strings; the lists
+        in `_errors` may be those of a raised ValidationError and are
+        not changed.
+        """
+        for field, messages in validation_errors(validation_error).items():
+            recorded = self._collected_errors.setdefault(field, [])
+            for message in messages:
+                if message not in recorded:
+                    recorded.append(message)
+
+    def validate(self):
+        if not self.collects_all_errors:
+            return super().validate()
+        self._collecting = True
+        self._collected_errors = {}
+        cleaned_data = self.cleaned_data
+        try:
+            cleaned_data = super().validate()
+        except ValidationError as e:
+            self.record_errors(e)
+        finally:
+            self._collecting = False
+        if self._collected_errors:
+            self._errors.update(
+                {field: list(messages)
+                 for field, messages in self._collected_errors.items()})
+            raise ValidationError(self._collected_errors)
+        return cleaned_data
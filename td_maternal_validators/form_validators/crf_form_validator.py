@@ -1,12 +1,17 @@
-from td_prn.action_items import MATERNALOFF_STUDY_ACTION
-
 from django import forms
-from django.apps import apps as django_apps
-from edc_action_item.site_action_items import site_action_items
-from edc_constants.constants import NEW, NO
+
+from .async_validation import AsyncValidationMixin
+from .collect_errors import CollectErrorsMixin
+from .m2m_snapshot import M2MSnapshotMixin
+from .offstudy_status import OffstudyStatusMixin
+from .result_cache import ResultCacheMixin
+from .rule_table import RuleTableMixin
+from .visit_resolution import VisitResolutionMixin
 
 
-class TDCRFFormValidator:
+class TDCRFFormValidator(ResultCacheMixin, CollectErrorsMixin, AsyncValidationMixin,
+                         M2MSnapshotMixin, RuleTableMixin, VisitResolutionMixin,
+                         OffstudyStatusMixin):
 
     def clean(self):
         self.validate_against_visit_datetime(
@@ -17,35 +22,6 @@ class TDCRFFormValidator:
 
     def validate_against_visit_datetime(self, report_datetime):
         if (report_datetime and report_datetime <
-                self.cleaned_data.get('maternal_visit').report_datetime):
+                self.resolved_visit.maternal_visit.report_datetime):
             raise forms.ValidationError(
                 "Report datetime cannot be before visit datetime.")
-
-    def validate_offstudy_model(self):
-        maternal_offstudy_cls = django_apps.get_model(
-            'td_prn.maternaloffstudy')
-        action_cls = site_action_items.get(
-            maternal_offstudy_cls.action_name)
-        action_item_model_cls = action_cls.action_item_model_cls()
-
-        try:
-            action_item_model_cls.objects.get(
-                subject_identifier=self.subject_identifier,
-                action_type__name=MATERNALOFF_STUDY_ACTION,
-                status=NEW)
-        except action_item_model_cls.DoesNotExist:
-            try:
-                maternal_offstudy_cls.objects.get(
-                    subject_identifier=self.subject_identifier)
-            except maternal_offstudy_cls.DoesNotExist:
-                pass
-            else:
-                raise forms.ValidationError(
-                    'Participant has been taken offstudy. Cannot capture any '
-                    'new data.')
-        else:
-            self.maternal_visit = self.cleaned_data.get('maternal_visit') or None
-            if not self.maternal_visit or self.maternal_visit.require_crfs == NO:
-                raise forms.ValidationError(
-                    'Participant is scheduled to be taken offstudy without '
-                    'any new data collection. Cannot capture any new data.')
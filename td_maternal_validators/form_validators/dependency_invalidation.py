@@ -0,0 +1,104 @@
+import inspect
+
+from django.apps import apps as django_apps
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from .dependency_manifest import manifest_labels
+from .model_resolver import resolve_model
+from .subject_context import SubjectContext
+from .subject_facts import subject_facts_cache
+
+
+class DependencyInvalidator:
+    """Moves a subject to a new subject facts version when a row of a
+    model the validators read, i.e. any model in the dependency manifest
+    of a validator class, is saved or deleted for that subject.
+
+    The version is moved again when the transaction commits, so that
+    facts read from the not yet committed rows are dropped as well.
+    """
+
+    subject_facts_cache = subject_facts_cache
+    subject_screening_model = 'td_maternal.subjectscreening'
+
+    @property
+    def subject_screening_cls(self):
+        return resolve_model(self, self.subject_screening_model)
+
+    def default_classes(self):
+        from .. import form_validators
+        classes = [getattr(form_validators, name) for name in form_validators.__all__]
+        return [form_validators.SubjectContext] + [
+            cls for cls in classes if inspect.isclass(cls) and hasattr(cls, 'clean')]
+
+    def dependency_labels(self, *classes):
+        """Returns the sorted model labels of the dependency manifests of
+        the classes, by default of the subject context and all validators.
+        """
+        return manifest_labels(*(classes or self.default_classes()))
+
+    def connect(self, *labels):
+        """Connects the receivers for the labels, by default all
+        dependency labels. Labels of models not installed are skipped.
+        """
+        for label in labels or self.dependency_labels():
+            try:
+                model = django_apps.get_model(label)
+            except (LookupError, ValueError):
+                continue
+            for signal in (post_save, post_delete):
+                signal.connect(
+                    self.dependency_changed, sender=model, weak=False,
+                    dispatch_uid=f'dependency_invalidator_{label}')
+
+    def disconnect(self, *labels):
+        for label in labels or self.dependency_labels():
+            try:
+                model = django_apps.get_model(label)
+            except (LookupError, ValueError):
+                continue
+            for signal in (post_save, post_delete):
+                signal.disconnect(
+                    sender=model, dispatch_uid=f'dependency_invalidator_{label}')
+
+    def dependency_changed(self, sender, instance, **kwargs):
+        if not self.subject_facts_cache.enabled:
+            return
+        subject_identifier = self.subject_identifier(instance)
+        if subject_identifier:
+            self.invalidate(subject_identifier)
+            # infant rows, e.g. the infant birth, are anchors of the mother
+            infant_suffix = SubjectContext.infant_suffix
+            if subject_identifier.endswith(infant_suffix):
+                self.invalidate(subject_identifier[:-len(infant_suffix)])
+
+    def invalidate(self, subject_identifier):
+        self.subject_facts_cache.invalidate(subject_identifier)
+        transaction.on_commit(
+            lambda: self.subject_facts_cache.invalidate(subject_identifier))
+
+    def subject_identifier(self, instance):
+        """Returns the maternal subject_identifier of a dependency row
+        or None.
+        """
+        subject_identifier = getattr(instance, 'subject_identifier', None)
+        if subject_identifier:
+            return subject_identifier
+        for field in ('maternal_visit', 'appointment'):
+            try:
+                related = getattr(instance, field, None)
+            except ObjectDoesNotExist:
+                continue
+            if getattr(related, 'subject_identifier', None):
+                return related.subject_identifier
+        screening_identifier = getattr(instance, 'screening_identifier', None)
+        if screening_identifier:
+            return self.subject_screening_cls.objects.filter(
+                screening_identifier=screening_identifier).values_list(
+                    'subject_identifier', flat=True).first()
+        return None
+
+
+dependency_invalidator = DependencyInvalidator()
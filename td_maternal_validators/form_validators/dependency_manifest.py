@@ -0,0 +1,48 @@
+from collections import namedtuple
+
+# A model a validator reads: `model` is the name of the attribute holding
+# the model label, on the validator or else its subject context, or a
+# model label; `lookup` is the field the rows are looked up by.
+Dependency = namedtuple('Dependency', ['model', 'lookup'])
+
+ManifestEntry = namedtuple('ManifestEntry', ['model', 'label', 'lookup'])
+
+
+def resolve_label(owner, model):
+    """Returns the model label of a Dependency model of `owner`, a
+    validator or subject context class.
+    """
+    for source in (owner, getattr(owner, 'subject_context_cls', None)):
+        label = getattr(source, model, None) if source is not None else None
+        if isinstance(label, str):
+            return label.lower()
+    if '.' in model:
+        return model.lower()
+    raise AttributeError(
+        f'{owner.__name__} has no model label attribute {model}.')
+
+
+def dependency_manifest(validator_cls):
+    """Returns a tuple of ManifestEntry of the models `validator_cls`
+    reads, as declared in the `dependencies` of the class and its bases,
+    with the model labels currently set on the class.
+
+    Reads of the subject facts cache, when enabled, are declared by the
+    subject context instead.
+    """
+    entries = []
+    for cls in reversed(validator_cls.__mro__):
+        for dependency in vars(cls).get('dependencies', ()):
+            entry = ManifestEntry(
+                dependency.model, resolve_label(validator_cls, dependency.model),
+                dependency.lookup)
+            if entry not in entries:
+                entries.append(entry)
+    return tuple(entries)
+
+
+def manifest_labels(*classes):
+    """Returns the sorted model labels of the manifests of the classes.
+    """
+    return sorted({
+        entry.label for cls in classes for entry in dependency_manifest(cls)})
@@ -1,71 +1,98 @@
 from django import forms
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 
+from .async_validation import AsyncValidationMixin
+from .collect_errors import CollectErrorsMixin
+from .dependency_manifest import Dependency
+from .model_resolver import resolve_model
+from .result_cache import ResultCacheMixin
 
-class TDFormValidatorMixin:
+
+class TDFormValidatorMixin(ResultCacheMixin, CollectErrorsMixin, AsyncValidationMixin):
 
     antenatal_enrollment_model = 'td_maternal.antenatalenrollment'
     consent_version_model = 'td_maternal.tdconsentversion'
     maternal_consent_model = 'td_maternal.subjectconsent'
     subject_screening_model = 'td_maternal.subjectscreening'
 
+    dependencies = (
+        Dependency('subject_screening_model', 'subject_identifier'),
+        Dependency('consent_version_model', 'screening_identifier'),
+        Dependency('maternal_consent_model', 'subject_identifier'))
+
     @property
     def antenatal_enrollment_cls(self):
-        return django_apps.get_model(self.antenatal_enrollment_model)
+        return resolve_model(self, self.antenatal_enrollment_model)
 
     @property
     def consent_version_cls(self):
-        return django_apps.get_model(self.consent_version_model)
+        return resolve_model(self, self.consent_version_model)
 
     @property
     def maternal_consent_cls(self):
-        return django_apps.get_model(self.maternal_consent_model)
+        return resolve_model(self, self.maternal_consent_model)
 
     @property
     def subject_screening_cls(self):
-        return django_apps.get_model(self.subject_screening_model)
+        return resolve_model(self, self.subject_screening_model)
 
     def validate_against_consent_datetime(self, report_datetime, id=None):
         """Returns an instance of the current maternal consent or
         raises an exception if not found."""
 
-        consent = self.validate_against_consent(id=id)
+        consent_datetime = self.consent_datetime(id=id)
 
-        if report_datetime and report_datetime < consent.consent_datetime:
+        if report_datetime and report_datetime < consent_datetime:
             raise forms.ValidationError(
                 "Report datetime cannot be before consent datetime")
 
+    def consent_datetime(self, id=None):
+        """Returns the datetime of the consent `validate_against_consent`
+        returns, from the subject facts cache if enabled.
+        """
+        facts = self.subject_context.facts
+        if facts and facts.consent_datetime and not id:
+            return facts.consent_datetime
+        return self.validate_against_consent(id=id).consent_datetime
+
     def validate_against_consent(self, id=None):
         """Returns an instance of the current maternal consent version form or
         raises an exception if not found."""
         try:
-            consent_version = self.consent_version_cls.objects.get(
-                screening_identifier=self.subject_screening.screening_identifier)
-        except self.consent_version_cls.DoesNotExist:
+            consents = self._consents
+        except AttributeError:
+            consents = self._consents = {}
+        key = (self.subject_identifier, id)
+        if key not in consents:
+            consents[key] = self.get_consent(id=id)
+        return consents[key]
+
+    def get_consent(self, id=None):
+        """Returns the consent for `validate_against_consent` from the
+        subject context without memoizing it."""
+        consent_version = self.subject_context.consent_version
+        if not consent_version:
             raise ValidationError(
                 'Please complete mother\'s consent version form before proceeding')
+        if not id:
+            consent = self.subject_context.latest_consent(
+                version=consent_version.version)
         else:
-            if not id:
-                consent = self.maternal_consent_cls.objects.filter(
-                    subject_identifier=self.subject_identifier,
-                    version=consent_version.version).order_by(
-                        '-consent_datetime').first()
-            else:
-                consent = self.maternal_consent_cls.objects.filter(
-                    subject_identifier=self.subject_identifier).order_by(
-                        'consent_datetime').first()
-            if not consent:
-                raise ValidationError(
-                    'Please complete Maternal Consent form '
-                    f'before  proceeding.')
-            else:
-                return consent
+            consent = self.subject_context.first_consent
+        if not consent:
+            raise ValidationError(
+                'Please complete Maternal Consent form '
+                f'before  proceeding.')
+        return consent
 
     @property
     def subject_screening(self):
-        try:
-            return self.subject_screening_cls.objects.get(
-                subject_identifier=self.subject_identifier)
-        except self.subject_screening_cls.DoesNotExist:
-            return None
+        return self.subject_context.subject_screening
+
+    def invalidate_consent(self):
+        """Drops the memoized consent, consent version and screening,
+        e.g. after changing `maternal_consent_model`.
+        """
+        self._consents = {}
+        self.subject_context.invalidate(
+            'subject_screening', 'consent_version', 'consents')
@@ -0,0 +1,120 @@
+from collections import namedtuple
+from datetime import datetime, time, timedelta, timezone
+
+from dateutil.relativedelta import relativedelta
+from django.db.models import Q
+from edc_base.utils import get_utcnow
+
+from .model_resolver import resolve_model
+
+# infants younger than `window_months` are eligible for Karabo, i.e.
+# from delivery until the window closes
+KaraboWindow = namedtuple('KaraboWindow', ['delivery_datetime', 'closes'])
+
+KaraboWindowReport = namedtuple('KaraboWindowReport', ['date', 'entering', 'leaving'])
+
+
+class KaraboEligibility:
+    """Answers whether the infant of a subject is young enough for the
+    Karabo sub-study from the eligibility window of its delivery
+    datetime.
+
+    `report` lists the subjects entering or leaving the window on a date
+    from a single query, see `delivery_range`.
+    """
+
+    maternal_labour_del_model = 'td_maternal.maternallabourdel'
+    window_months = 21
+
+    def __init__(self, window_months=None, **model_labels):
+        if window_months is not None:
+            self.window_months = window_months
+        for attr, label in model_labels.items():
+            if attr != 'maternal_labour_del_model':
+                raise TypeError(
+                    f'Invalid model label for Karabo eligibility. Got {attr}.')
+            setattr(self, attr, label)
+
+    @property
+    def maternal_labour_del_cls(self):
+        return resolve_model(self, self.maternal_labour_del_model)
+
+    def window(self, delivery_datetime):
+        """Returns the KaraboWindow of a delivery datetime or None.
+        """
+        if delivery_datetime is None:
+            return None
+        return KaraboWindow(
+            delivery_datetime,
+            delivery_datetime + relativedelta(months=self.window_months))
+
+    def is_eligible(self, delivery_datetime, report_datetime=None):
+        """Returns True if the infant delivered at `delivery_datetime` is
+        younger than `window_months` at `report_datetime`, default now.
+        """
+        window = self.window(delivery_datetime)
+        if window is None:
+            return False
+        return (report_datetime or get_utcnow()) < window.closes
+
+    def windows(self, subject_identifiers=None):
+        """Returns a dictionary of KaraboWindows by subject_identifier,
+        for all delivered subjects by default, from one query.
+        """
+        deliveries = self.maternal_labour_del_cls.objects.all()
+        if subject_identifiers is not None:
+            deliveries = deliveries.filter(
+                subject_identifier__in=list(subject_identifiers))
+        return {
+            subject_identifier: self.window(delivery_datetime)
+            for subject_identifier, delivery_datetime in deliveries.values_list(
+                'subject_identifier', 'delivery_datetime').iterator()}
+
+    def first_delivery_closing(self, moment):
+        """Returns the earliest delivery datetime whose window closes at
+        or after `moment`.
+        """
+        delivery = moment - relativedelta(months=self.window_months)
+        if delivery + relativedelta(months=self.window_months) < moment:
+            # the day of `moment` does not exist in the month of delivery,
+            # e.g. the 30th of February, so no window closes before the
+            # start of the next month
+            delivery = datetime.combine(
+                delivery.date() + timedelta(days=1), time.min,
+                tzinfo=delivery.tzinfo)
+        return delivery
+
+    def delivery_range(self, day):
+        """Returns the (start, end) delivery datetimes of the windows
+        closing on `day`, end excluded.
+        """
+        start = datetime.combine(day, time.min, tzinfo=timezone.utc)
+        return (self.first_delivery_closing(start),
+                self.first_delivery_closing(start + timedelta(days=1)))
+
+    def report(self, day=None):
+        """Returns the KaraboWindowReport of the subjects entering the
+        window, i.e. delivered, and leaving it on `day`, default today.
+
+        The date math is done once for the bounds of the day rather than
+        for each subject.
+        """
+        day = day or get_utcnow().date()
+        entering = (datetime.combine(day, time.min, tzinfo=timezone.utc),
+                    datetime.combine(day + timedelta(days=1), time.min,
+                                     tzinfo=timezone.utc))
+        leaving = self.delivery_range(day)
+        rows = self.maternal_labour_del_cls.objects.filter(
+            Q(delivery_datetime__gte=entering[0], delivery_datetime__lt=entering[1])
+            | Q(delivery_datetime__gte=leaving[0], delivery_datetime__lt=leaving[1])
+        ).values_list('subject_identifier', 'delivery_datetime')
+        entering_ids, leaving_ids = [], []
+        for subject_identifier, delivery_datetime in rows.iterator():
+            if entering[0] <= delivery_datetime < entering[1]:
+                entering_ids.append(subject_identifier)
+            else:
+                leaving_ids.append(subject_identifier)
+        return KaraboWindowReport(day, sorted(entering_ids), sorted(leaving_ids))
+
+
+karabo_eligibility = KaraboEligibility()
@@ -1,10 +1,11 @@
 from django import forms
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_constants.constants import NO, YES
 from edc_form_validators import FormValidator
 
 from .crf_form_validator import TDCRFFormValidator
+from .dependency_manifest import Dependency
+from .model_resolver import resolve_model
 
 
 class KaraboSubjectConsentFormValidator(TDCRFFormValidator,
@@ -14,13 +15,45 @@ class KaraboSubjectConsentFormValidator(TDCRFFormValidator,
 
     karabo_screening_model = 'td_maternal.karabosubjectscreening'
 
+    dependencies = (
+        Dependency('maternal_subject_consent', 'subject_identifier'),
+        Dependency('karabo_screening_model', 'subject_identifier'))
+
+    maternal_consent_fields = {
+        'first_name': 'Please Enter Maternal First Name similar to Tshilo Dikotla',
+        'last_name': 'Please Enter Maternal Surname similar to Tshilo Dikotla',
+        'initials': 'Please Enter Maternal Initials similar to Tshilo Dikotla',
+        'dob': 'Please Enter Maternal Date of Birth similar to Tshilo Dikotla',
+        'identity': 'Please Enter Maternal identity similar to Tshilo Dikotla'}
+
     @property
     def maternal_consent_cls(self):
-        return django_apps.get_model(self.maternal_subject_consent)
+        return resolve_model(self, self.maternal_subject_consent)
 
     @property
     def karabo_screening_cls(self):
-        return django_apps.get_model(self.karabo_screening_model)
+        return resolve_model(self, self.karabo_screening_model)
+
+    @property
+    def subject_context_models(self):
+        model_labels = super().subject_context_models
+        model_labels.update(
+            maternal_consent_model=self.maternal_subject_consent,
+            karabo_subject_screening_model=self.karabo_screening_model)
+        return model_labels
+
+    @property
+    def maternal_consent(self):
+        """Returns the latest Tshilo Dikotla consent for the mother.
+        """
+        maternal_consent = self.get_subject_context(
+            self.maternal_identifier).latest_consent()
+        if not maternal_consent:
+            msg = {'subject_identifier': 'Subject Identifier doesn\'t'
+                   ' exists in Tshilo Dikotla'}
+            self._errors.update(msg)
+            raise ValidationError(msg)
+        return maternal_consent
 
     def clean(self):
         cleaned_data = self.cleaned_data
@@ -36,11 +69,7 @@ class KaraboSubjectConsentFormValidator(TDCRFFormValidator,
             field='is_literate',
             field_required='guardian_name'
         )
-        self.validate_maternal_name()
-        self.validate_maternal_surname()
-        self.validate_maternal_initials()
-        self.validate_maternal_dob()
-        self.validate_maternal_omang()
+        self.validate_maternal_consent_fields()
         self.clean_review_questions('consent_reviewed', NO)
         self.clean_review_questions('study_questions', NO)
         self.clean_review_questions('assessment_score', NO)
@@ -49,118 +78,36 @@ class KaraboSubjectConsentFormValidator(TDCRFFormValidator,
 
     def validate_against_screening_date(self, subject_identifier=None,
                                         report_datetime=None):
-
-        try:
-            karabo_screening = self.karabo_screening_cls.objects.get(
-                subject_identifier=subject_identifier)
-        except self.karabo_screening_cls.DoesNotExist:
-            raise ValidationError(
-                'Please complete Karabo Screening form '
-                f'before  proceeding.')
-        else:
-            if report_datetime and report_datetime < karabo_screening.report_datetime:
-                raise forms.ValidationError(
-                    "Report datetime cannot be before Karabo Screening datetime.")
-            else:
-                return karabo_screening
-
-    def validate_maternal_name(self):
-        '''Validates maternal name from Tshilo dikotla and Karabo Study
-        '''
-        subject_identifier = self.cleaned_data.get('subject_identifier')
-
-        try:
-            maternal_consent = self.maternal_consent_cls.objects.filter(
-                subject_identifier=subject_identifier).order_by(
-                    'consent_datetime').last()
-        except self.maternal_consent_cls.DoesNotExist:
-            raise ValidationError({
-                'subject_identifier': 'Subject Identifier doesn\'t'
-                ' exists in Tshilo Dikotla'})
-        else:
-            if not self.cleaned_data['first_name'] == maternal_consent.first_name:
+        """Returns the Karabo screening datetime of the subject, from the
+        timeline or else the screening, after checking the report
+        datetime is not before it.
+        """
+        subject_context = self.get_subject_context(subject_identifier)
+        screening_datetime = subject_context.anchor('karabo_screening_datetime')
+        if not screening_datetime:
+            karabo_screening = subject_context.karabo_screening
+            if not karabo_screening:
                 raise ValidationError(
-                    {'first_name': 'Please Enter Maternal First Name'
-                     ' similar to Tshilo Dikotla'})
-
-    def validate_maternal_surname(self):
-        '''Validates maternal name from Tshilo dikotla and Karabo Study
+                    'Please complete Karabo Screening form '
+                    f'before  proceeding.')
+            screening_datetime = karabo_screening.report_datetime
+        if report_datetime and report_datetime < screening_datetime:
+            raise forms.ValidationError(
+                "Report datetime cannot be before Karabo Screening datetime.")
+        return screening_datetime
+
+    def validate_maternal_consent_fields(self):
+        '''Validates maternal details against the Tshilo Dikotla consent,
+        reporting all mismatches together.
         '''
-        subject_identifier = self.cleaned_data.get('subject_identifier')
-        try:
-            maternal_consent = self.maternal_consent_cls.objects.filter(
-                subject_identifier=subject_identifier).order_by(
-                    'consent_datetime').last()
-
-        except self.maternal_consent_cls.DoesNotExist:
-            raise ValidationError(
-                {'subject_identifier': 'Subject Identifier doesn\'t'
-                 ' exists in Tshilo Dikotla'})
-
-        else:
-            if not self.cleaned_data['last_name'] == maternal_consent.last_name:
-                raise ValidationError(
-                    {'last_name': 'Please Enter Maternal Surname'
-                     ' similar to Tshilo Dikotla'})
-
-    def validate_maternal_initials(self):
-        '''Validates maternal name from Tshilo dikotla and Karabo Study
-        '''
-        subject_identifier = self.cleaned_data.get('subject_identifier')
-
-        try:
-            maternal_consent = self.maternal_consent_cls.objects.filter(
-                subject_identifier=subject_identifier).order_by(
-                    'consent_datetime').last()
-
-        except self.maternal_consent_cls.DoesNotExist:
-            raise ValidationError(
-                {'subject_identifier': 'Subject Identifier doesn\'t'
-                 ' exists in Tshilo Dikotla'})
-        else:
-            if not self.cleaned_data['initials'] == maternal_consent.initials:
-                raise ValidationError(
-                    {'initials': 'Please Enter Maternal Initials'
-                     ' similar to Tshilo Dikotla'})
-
-    def validate_maternal_dob(self):
-        '''Validates maternal name from Tshilo dikotla and Karabo Study
-        '''
-        subject_identifier = self.cleaned_data.get('subject_identifier')
-        try:
-            maternal_consent = self.maternal_consent_cls.objects.filter(
-                subject_identifier=subject_identifier).order_by(
-                    'consent_datetime').last()
-
-        except self.maternal_consent_cls.DoesNotExist:
-            raise ValidationError(
-                {'subject_identifier': 'Subject Identifier doesn\'t'
-                 ' exists in Tshilo Dikotla'})
-
-        else:
-            if not self.cleaned_data['dob'] == maternal_consent.dob:
-                raise ValidationError(
-                    {'dob': 'Please Enter Maternal Date of Birth'
-                     ' similar to Tshilo Dikotla'})
-
-    def validate_maternal_omang(self):
-        '''Validates maternal name from Tshilo dikotla and Karabo Study
-        '''
-        subject_identifier = self.cleaned_data.get('subject_identifier')
-
-        try:
-            maternal_consent = self.maternal_consent_cls.objects.filter(
-                subject_identifier=subject_identifier).order_by(
-                    'consent_datetime').last()
-        except self.maternal_consent_cls.DoesNotExist:
-            raise ValidationError(
-                {'subject_identifier': 'Subject Identifier doesn\'t'
-                 ' exists in Tshilo Dikotla'})
-        else:
-            if self.cleaned_data.get('identity') != maternal_consent.identity:
-                raise ValidationError(
-                    {'identity': 'Please Enter Maternal identity'
-                     ' similar to Tshilo Dikotla'})
+        maternal_consent = self.maternal_consent
+        errors = {}
+        for field, message in self.maternal_consent_fields.items():
+            if self.cleaned_data.get(field) != getattr(maternal_consent, field):
+                errors[field] = message
+        if errors:
+            self._errors.update(errors)
+            raise ValidationError(errors)
 
     def clean_review_questions(self, field, response):
         cleaned_field = self.cleaned_data.get(field)
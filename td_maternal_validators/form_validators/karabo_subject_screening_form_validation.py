@@ -1,22 +1,27 @@
 from django import forms
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_form_validators import FormValidator
 
 from .crf_form_validator import TDCRFFormValidator
+from .dependency_manifest import Dependency
+from .model_resolver import resolve_model
 
 
 class KaraboSubjectScreeningFormValidator(TDCRFFormValidator, FormValidator):
 
     infant_birth_model = 'td_infant.infantbirth'
 
+    dependencies = (
+        Dependency('infant_birth_model', 'subject_identifier'), )
+
     @property
     def infant_birth_cls(self):
-        return django_apps.get_model(self.infant_birth_model)
+        return resolve_model(self, self.infant_birth_model)
 
     def clean(self):
         cleaned_data = self.cleaned_data
-        self.subject_identifier = cleaned_data.get('subject_identifier') + '-10'
+        self.maternal_identifier = cleaned_data.get('subject_identifier')
+        self.subject_identifier = self.maternal_identifier + '-10'
         self.validate_against_birth_date(
             infant_identifier=self.subject_identifier,
             report_datetime=cleaned_data.get('report_datetime'))
@@ -26,6 +31,13 @@ class KaraboSubjectScreeningFormValidator(TDCRFFormValidator, FormValidator):
     def validate_against_birth_date(self, infant_identifier=None,
                                     report_datetime=None):
 
+        birth_datetime = self.get_subject_context(
+            self.maternal_identifier).anchor('infant_birth_datetime')
+        if birth_datetime:
+            if report_datetime and report_datetime < birth_datetime:
+                raise forms.ValidationError(
+                    "Report datetime cannot be before infant birth datetime.")
+            return None
         try:
             infant_birth = self.infant_birth_cls.objects.get(
                 subject_identifier=infant_identifier)
@@ -0,0 +1,99 @@
+import threading
+
+from django.apps import apps as django_apps
+from django.db.models.signals import post_delete, post_save
+
+
+class ListModelIndex:
+    """Process-wide index of list model short_names by model label
+    and pk, as given in API and sync payloads.
+
+    A list model is loaded with one query, either for all list models
+    by `load`, e.g. at app ready, or on the first lookup of one of its
+    pks, and is reloaded when any of its rows is saved or deleted. The
+    reload receivers of a list model are connected when it is first
+    loaded.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._short_names = {}
+        self._loaded = set()
+
+    def list_models(self):
+        from edc_base.model_mixins import ListModelMixin
+        return [model for model in django_apps.get_models()
+                if issubclass(model, ListModelMixin)]
+
+    def load(self, *models):
+        """Loads the short_names of the given list models, or of all
+        list models if none are given.
+        """
+        for model in models or self.list_models():
+            short_names = {
+                str(pk): short_name for pk, short_name in
+                model.objects.values_list('pk', 'short_name')}
+            with self._lock:
+                self._short_names = dict(self._short_names)
+                self._short_names[model._meta.label_lower] = short_names
+                self._loaded.add(model)
+            self.connect(model)
+
+    def clear(self):
+        with self._lock:
+            self._short_names = {}
+            self._loaded = set()
+
+    def short_name(self, pk, model=None):
+        """Returns the short_name for the list model pk or None.
+
+        Without a model, the pk is looked up in all loaded list models,
+        which is unambiguous for UUID pks only.
+        """
+        pk = str(pk)
+        if model:
+            try:
+                return self._short_names[model._meta.label_lower][pk]
+            except KeyError:
+                pass
+        else:
+            for short_names in self._short_names.values():
+                try:
+                    return short_names[pk]
+                except KeyError:
+                    pass
+        if model:
+            unloaded = [model] if model not in self._loaded else []
+        else:
+            unloaded = [m for m in self.list_models() if m not in self._loaded]
+        if unloaded:
+            self.load(*unloaded)
+            return self.short_name(pk, model=model)
+        return None
+
+    def short_names(self, pks, model=None):
+        """Returns a frozenset of the short_names for the pks.
+        """
+        short_names = set()
+        for pk in pks:
+            short_name = self.short_name(pk, model=model)
+            if short_name is not None:
+                short_names.add(short_name)
+        return frozenset(short_names)
+
+    def connect(self, *models):
+        """Connects the receivers that reload the given list models, or
+        all list models, on change.
+        """
+        for model in models or self.list_models():
+            for signal in (post_save, post_delete):
+                signal.connect(
+                    self.list_model_changed, sender=model, weak=False,
+                    dispatch_uid=f'list_model_index_{model._meta.label_lower}')
+
+    def list_model_changed(self, sender, **kwargs):
+        if sender in self._loaded:
+            self.load(sender)
+
+
+list_model_index = ListModelIndex()
@@ -0,0 +1,67 @@
+from django.core.exceptions import FieldDoesNotExist
+
+from .list_model_index import list_model_index
+from .model_resolver import resolve_model
+
+
+class M2MSnapshotMixin:
+    """Resolves an M2M field in cleaned_data to a frozenset of the
+    selected short_names once per submitted value.
+
+    Resolving a queryset evaluates it, so the FormValidator m2m_*
+    helpers that count and iterate the same queryset afterwards read
+    its result cache instead of querying again. A list of pks, as in
+    API and sync payloads, is resolved from the list model index
+    without a query, by the list model of the M2M field of the CRF
+    model, i.e. of `instance` or `m2m_model`.
+    """
+
+    list_model_index = list_model_index
+
+    # label of the CRF model of the M2M fields, if not the model of
+    # `instance`, e.g. for pk payloads validated without an instance
+    m2m_model = None
+
+    def m2m_selection(self, m2m_field):
+        try:
+            snapshots = self._m2m_snapshots
+        except AttributeError:
+            snapshots = self._m2m_snapshots = {}
+        value = self.cleaned_data.get(m2m_field)
+        try:
+            snapshot_value, selection = snapshots[m2m_field]
+        except KeyError:
+            pass
+        else:
+            if snapshot_value is value:
+                return selection
+        model = self.m2m_related_model(m2m_field)
+        selection = frozenset(
+            short_name for short_name in (
+                self.selected_short_name(selected, model=model)
+                for selected in value or [])
+            if short_name is not None)
+        snapshots[m2m_field] = (value, selection)
+        return selection
+
+    def m2m_related_model(self, m2m_field):
+        """Returns the list model of the M2M field or None if the CRF
+        model is not known.
+        """
+        if self.m2m_model:
+            model = resolve_model(self, self.m2m_model)
+        else:
+            model = getattr(self, 'instance', None)
+        try:
+            return model._meta.get_field(m2m_field).related_model
+        except (AttributeError, FieldDoesNotExist):
+            return None
+
+    def selected_short_name(self, selected, model=None):
+        """Returns the short_name of a selected list model instance
+        or pk of the list model `model`.
+        """
+        try:
+            return selected.short_name
+        except AttributeError:
+            return self.list_model_index.short_name(selected, model=model)
@@ -1,8 +1,9 @@
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_constants.constants import YES
 from edc_form_validators import FormValidator
 from .crf_form_validator import TDCRFFormValidator
+from .dependency_manifest import Dependency
+from .model_resolver import resolve_model
 
 
 class MaternalArvFormValidator(TDCRFFormValidator,
@@ -10,14 +11,15 @@ class MaternalArvFormValidator(TDCRFFormValidator,
 
     arv_history_model = 'td_maternal.maternallifetimearvhistory'
 
+    dependencies = (
+        Dependency('arv_history_model', 'maternal_visit'), )
+
     @property
     def arv_history_cls(self):
-        return django_apps.get_model(self.arv_history_model)
+        return resolve_model(self, self.arv_history_model)
 
     def clean(self):
-        cleaned_data = self.cleaned_data
-        self.subject_identifier = cleaned_data.get(
-            'maternal_arv_preg').maternal_visit.subject_identifier
+        self.subject_identifier = self.resolved_visit.subject_identifier
         super().clean()
 
         self.validate_date(cleaned_data=self.cleaned_data)
@@ -36,7 +38,7 @@ class MaternalArvFormValidator(TDCRFFormValidator,
             raise ValidationError(msg)
 
     def validate_took_arv(self, cleaned_data=None):
-        took_arv = cleaned_data.get('maternal_arv_preg').took_arv
+        took_arv = self.resolved_visit.parent.took_arv
         if took_arv == YES:
             if not cleaned_data.get('arv_code'):
                 msg = {'arv_code':
@@ -53,11 +55,9 @@ class MaternalArvFormValidator(TDCRFFormValidator,
                 raise ValidationError(msg)
 
     def validate_historical_and_present_arv_start_dates(self, cleaned_data=None):
-        maternal_visit = cleaned_data.get(
-            'maternal_arv_preg').maternal_visit
         try:
             arv_history = self.arv_history_cls.objects.get(
-                maternal_visit=maternal_visit)
+                maternal_visit=self.resolved_visit.maternal_visit)
             if arv_history.haart_start_date:
                 if cleaned_data.get('start_date') < arv_history.haart_start_date:
                     msg = {'start_date':
@@ -1,10 +1,11 @@
-from django.apps import apps as django_apps
 from django.forms import forms
 from edc_constants.constants import NO, YES
 from edc_form_validators import FormValidator
 
 from ..constants import NEVER_STARTED
 from .crf_form_validator import TDCRFFormValidator
+from .dependency_manifest import Dependency
+from .model_resolver import resolve_model
 
 
 class MarternalArvPostFormValidator(TDCRFFormValidator,
@@ -12,13 +13,15 @@ class MarternalArvPostFormValidator(TDCRFFormValidator,
 
     maternal_arv_post_adh = 'td_maternal.maternalarvpostadh'
 
+    dependencies = (
+        Dependency('maternal_arv_post_adh', 'maternal_visit'), )
+
     @property
     def maternal_arv_post_adh_cls(self):
-        return django_apps.get_model(self.maternal_arv_post_adh)
+        return resolve_model(self, self.maternal_arv_post_adh)
 
     def clean(self):
-        self.subject_identifier = self.cleaned_data.get(
-            'maternal_visit').subject_identifier
+        self.subject_identifier = self.resolved_visit.subject_identifier
         super().clean()
 
         condition = (self.cleaned_data.get('on_arv_since') == NO
@@ -6,8 +6,7 @@ from .crf_form_validator import TDCRFFormValidator
 class MaternalArvPregFormValidator(TDCRFFormValidator, FormValidator):
 
     def clean(self):
-        self.subject_identifier = self.cleaned_data.get(
-            'maternal_visit').subject_identifier
+        self.subject_identifier = self.resolved_visit.subject_identifier
         super().clean()
 
         self.applicable_if(
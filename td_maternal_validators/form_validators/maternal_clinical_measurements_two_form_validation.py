@@ -9,8 +9,7 @@ class MaternalClinicalMeasurememtsTwoFormValidator(TDCRFFormValidator,
 
     def clean(self):
         cleaned_data = self.cleaned_data
-        self.subject_identifier = cleaned_data.get(
-            'maternal_visit').subject_identifier
+        self.subject_identifier = self.resolved_visit.subject_identifier
         super().clean()
 
         if (cleaned_data.get('systolic_bp') and cleaned_data.get('diastolic_bp')):
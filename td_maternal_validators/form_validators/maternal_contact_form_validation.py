@@ -1,9 +1,10 @@
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_constants.constants import YES, NO
 from edc_form_validators import FormValidator
 
+from .dependency_manifest import Dependency
 from .form_validator_mixin import TDFormValidatorMixin
+from .model_resolver import resolve_model
 
 
 class MaternalContactFormValidator(TDFormValidatorMixin,
@@ -11,9 +12,14 @@ class MaternalContactFormValidator(TDFormValidatorMixin,
 
     maternal_locator_model = 'td_maternal.maternallocator'
 
+    dependencies = (
+        Dependency('maternal_locator_model', 'subject_identifier'), )
+
+    prerequisite_steps = ('validate_maternal_locator', )
+
     @property
     def maternal_locator_cls(self):
-        return django_apps.get_model(self.maternal_locator_model)
+        return resolve_model(self, self.maternal_locator_model)
 
     def clean(self):
         cleaned_data = self.cleaned_data
@@ -27,37 +33,8 @@ class MaternalContactFormValidator(TDFormValidatorMixin,
             self.cleaned_data.get('report_datetime'),
             id=id)
 
-        locator = self.maternal_locator
-        if self.maternal_locator:
-            if (cleaned_data.get('contact_type') == 'in_person'
-                    and locator.may_visit_home == NO):
-                msg = {'contact_type':
-                       'Maternal Locator says may_visit_home: '
-                       f'{locator.may_visit_home}, you cannot call '
-                       'participant if they did not give permission.'}
-                self._errors.update(msg)
-                raise ValidationError(msg)
-            if (cleaned_data.get('contact_type') == 'voice_call'
-                    and locator.may_call == NO):
-                msg = {'contact_type':
-                       f'Maternal Locator says may_call: {locator.may_call}, '
-                       'you cannot call participant if they did not give '
-                       'permission.'}
-                self._errors.update(msg)
-                raise ValidationError(msg)
-            if (cleaned_data.get('contact_type') == 'text_message'
-                    and locator.may_sms == NO):
-                msg = {'contact_type':
-                       f'Maternal Locator says may_sms: {locator.may_sms}, '
-                       'you cannot sms participant if they did not give '
-                       'permission.'}
-                self._errors.update(msg)
-                raise ValidationError(msg)
-        else:
-            msg = {'__all__': 'Maternal Locator not found, please add '
-                   'Locator before proceeding.'}
-            self._errors.update(msg)
-            raise ValidationError(msg)
+        self.validate_maternal_locator()
+        self.validate_contact_type(cleaned_data=cleaned_data)
 
         self.validate_other_specify(
             field='call_reason',)
@@ -68,6 +45,40 @@ class MaternalContactFormValidator(TDFormValidatorMixin,
             field='contact_success',
             field_required='contact_comment')
 
+    def validate_maternal_locator(self):
+        if not self.maternal_locator:
+            msg = {'__all__': 'Maternal Locator not found, please add '
+                   'Locator before proceeding.'}
+            self._errors.update(msg)
+            raise ValidationError(msg)
+
+    def validate_contact_type(self, cleaned_data=None):
+        locator = self.maternal_locator
+        if (cleaned_data.get('contact_type') == 'in_person'
+                and locator.may_visit_home == NO):
+            msg = {'contact_type':
+                   'Maternal Locator says may_visit_home: '
+                   f'{locator.may_visit_home}, you cannot call '
+                   'participant if they did not give permission.'}
+            self._errors.update(msg)
+            raise ValidationError(msg)
+        if (cleaned_data.get('contact_type') == 'voice_call'
+                and locator.may_call == NO):
+            msg = {'contact_type':
+                   f'Maternal Locator says may_call: {locator.may_call}, '
+                   'you cannot call participant if they did not give '
+                   'permission.'}
+            self._errors.update(msg)
+            raise ValidationError(msg)
+        if (cleaned_data.get('contact_type') == 'text_message'
+                and locator.may_sms == NO):
+            msg = {'contact_type':
+                   f'Maternal Locator says may_sms: {locator.may_sms}, '
+                   'you cannot sms participant if they did not give '
+                   'permission.'}
+            self._errors.update(msg)
+            raise ValidationError(msg)
+
     @property
     def maternal_locator(self):
         cleaned_data = self.cleaned_data
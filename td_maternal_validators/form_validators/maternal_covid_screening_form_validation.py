@@ -4,42 +4,32 @@ from edc_constants.constants import YES, NOT_APPLICABLE
 from edc_form_validators import FormValidator
 
 from .crf_form_validator import TDCRFFormValidator
+from .rule_table import M2MSingleSelectionIf, RequiredIf, Step
 
 
 class MaternalCovidScreeningFormValidator(TDCRFFormValidator,
                                           FormValidator):
 
-    def clean(self):
-        self.subject_identifier = self.cleaned_data.get(
-            'maternal_visit').subject_identifier
-
-        covid_fields = ['covid_test_date',
-                        'is_test_date_estimated',
-                        'covid_results']
-
-        for value in covid_fields:
-            self.required_if(
-                YES,
-                field='covid_tested',
-                field_required=value)
-
-        self.validate_covid_test_date('covid_test_date')
-
-        household_fields = ['household_test_date',
-                            'is_household_test_estimated']
-
-        for value in household_fields:
-            self.required_if(
-                YES,
-                field='household_positive',
-                field_required=value)
-
-        self.validate_covid_test_date('household_test_date')
-
-        self.m2m_single_selection_if(
-            NOT_APPLICABLE,
-            m2m_field='covid_symptoms')
+    rules = (
+        RequiredIf(YES, field='covid_tested', field_required='covid_test_date'),
+        RequiredIf(
+            YES, field='covid_tested', field_required='is_test_date_estimated'),
+        RequiredIf(YES, field='covid_tested', field_required='covid_results'),
+        Step('validate_covid_test_date', 'covid_test_date',
+             fields=('covid_test_date', )),
+        RequiredIf(
+            YES, field='household_positive', field_required='household_test_date'),
+        RequiredIf(
+            YES, field='household_positive',
+            field_required='is_household_test_estimated'),
+        Step('validate_covid_test_date', 'household_test_date',
+             fields=('household_test_date', )),
+        M2MSingleSelectionIf(NOT_APPLICABLE, m2m_field='covid_symptoms'),
+    )
 
+    def clean(self):
+        self.subject_identifier = self.resolved_visit.subject_identifier
+        self.apply_rules()
         super().clean()
 
     def validate_covid_test_date(self, test_date):
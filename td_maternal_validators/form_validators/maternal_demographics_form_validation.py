@@ -1,36 +1,22 @@
 from edc_form_validators import FormValidator
 
 from .crf_form_validator import TDCRFFormValidator
+from .rule_table import OtherSpecify
 
 
 class MaternalDemographicsFormValidator(TDCRFFormValidator,
                                         FormValidator):
 
+    rules = (
+        OtherSpecify(field='marital_status'),
+        OtherSpecify(field='ethnicity'),
+        OtherSpecify(field='current_occupation'),
+        OtherSpecify(field='provides_money'),
+        OtherSpecify(field='money_earned'),
+        OtherSpecify(field='toilet_facility'),
+    )
+
     def clean(self):
-        self.subject_identifier = self.cleaned_data.get(
-            'maternal_visit').subject_identifier
+        self.subject_identifier = self.resolved_visit.subject_identifier
         super().clean()
-
-        self.validate_other_specify(
-            field='marital_status',
-        )
-
-        self.validate_other_specify(
-            field='ethnicity',
-        )
-
-        self.validate_other_specify(
-            field='current_occupation',
-        )
-
-        self.validate_other_specify(
-            field='provides_money',
-        )
-
-        self.validate_other_specify(
-            field='money_earned',
-        )
-
-        self.validate_other_specify(
-            field='toilet_facility',
-        )
+        self.apply_rules()
@@ -1,11 +1,13 @@
-from td_maternal.helper_classes import MaternalStatusHelper
-
 from django.core.exceptions import ValidationError
 from edc_constants.constants import YES, NOT_APPLICABLE, OTHER, POS
 from edc_form_validators.form_validator import FormValidator
 
+from .m2m_snapshot import M2MSnapshotMixin
+from .maternal_status import MaternalStatusMixin
+
 
-class MaternalDiagnosesFormValidator(FormValidator):
+class MaternalDiagnosesFormValidator(M2MSnapshotMixin, MaternalStatusMixin,
+                                     FormValidator):
 
     def clean(self):
         subject_status = self.maternal_status_helper.hiv_status
@@ -48,9 +50,7 @@ class MaternalDiagnosesFormValidator(FormValidator):
 
     def m2m_na_validation(self, field=None, m2m_field=None, msg=None,
                           na_msg=None):
-        qs = self.cleaned_data.get(m2m_field).values_list(
-            'short_name', flat=True)
-        selection = list(qs.all())
+        selection = self.m2m_selection(m2m_field)
         if self.cleaned_data.get(field) == YES:
             if NOT_APPLICABLE in selection:
                 message = {m2m_field: msg}
@@ -66,10 +66,3 @@ class MaternalDiagnosesFormValidator(FormValidator):
                 NOT_APPLICABLE,
                 m2m_field=m2m_field
             )
-
-    @property
-    def maternal_status_helper(self):
-        cleaned_data = self.cleaned_data
-        status_helper = MaternalStatusHelper(
-            cleaned_data.get('maternal_visit'))
-        return status_helper
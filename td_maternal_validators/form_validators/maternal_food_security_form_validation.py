@@ -8,8 +8,7 @@ class MaternalFoodSecurityFormValidator(TDCRFFormValidator, FormValidator):
 
     def clean(self):
 
-        self.subject_identifier = self.cleaned_data.get(
-            'maternal_visit').subject_identifier
+        self.subject_identifier = self.resolved_visit.subject_identifier
         super().clean()
 
         self.required_if(
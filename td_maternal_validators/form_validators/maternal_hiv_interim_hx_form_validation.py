@@ -7,8 +7,7 @@ class MaternalHivInterimHxFormValidator(TDCRFFormValidator,
                                         FormValidator):
 
     def clean(self):
-        self.subject_identifier = self.cleaned_data.get(
-            'maternal_visit').subject_identifier
+        self.subject_identifier = self.resolved_visit.subject_identifier
         super().clean()
 
         required_fields = ('cd4_date', 'cd4_result')
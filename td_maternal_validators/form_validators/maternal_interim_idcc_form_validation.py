@@ -9,8 +9,7 @@ class MaternalIterimIdccFormValidator(TDCRFFormValidator,
                                       FormValidator):
 
     def clean(self):
-        self.subject_identifier = self.cleaned_data.get(
-            'maternal_visit').subject_identifier
+        self.subject_identifier = self.resolved_visit.subject_identifier
         super().clean()
 
         required_fields = ['recent_cd4', 'recent_cd4_date', 'value_vl_size',
@@ -1,31 +1,39 @@
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_base.utils import relativedelta
 from edc_constants.constants import POS, YES, NOT_APPLICABLE, OTHER, NONE
 from edc_form_validators import FormValidator
-from td_maternal.helper_classes import MaternalStatusHelper
 
 from .crf_form_validator import TDCRFFormValidator
+from .dependency_manifest import Dependency
 from .form_validator_mixin import TDFormValidatorMixin
+from .maternal_status import MaternalStatusMixin
+from .model_resolver import resolve_model
 
 
-class MaternalLabDelFormValidator(TDCRFFormValidator,
+class MaternalLabDelFormValidator(TDCRFFormValidator, MaternalStatusMixin,
                                   TDFormValidatorMixin, FormValidator):
     maternal_arv_model = 'td_maternal.maternalarv'
     maternal_visit_model = 'td_maternal.maternalvisit'
     maternal_ultrasound_init_model = 'td_maternal.maternalultrasoundinitial'
 
+    dependencies = (
+        Dependency('maternal_ultrasound_init_model',
+                   'maternal_visit__appointment__subject_identifier'),
+        Dependency('maternal_arv_model',
+                   'maternal_arv_preg__maternal_visit__appointment__subject_identifier'),
+        Dependency('maternal_visit_model', 'subject_identifier'))
+
     @property
     def maternal_ultrasound_init_cls(self):
-        return django_apps.get_model(self.maternal_ultrasound_init_model)
+        return resolve_model(self, self.maternal_ultrasound_init_model)
 
     @property
     def maternal_visit_cls(self):
-        return django_apps.get_model(self.maternal_visit_model)
+        return resolve_model(self, self.maternal_visit_model)
 
     @property
     def maternal_arv_cls(self):
-        return django_apps.get_model(self.maternal_arv_model)
+        return resolve_model(self, self.maternal_arv_model)
 
     def clean(self):
         self.subject_identifier = self.cleaned_data.get('subject_identifier')
@@ -148,14 +156,21 @@ class MaternalLabDelFormValidator(TDCRFFormValidator,
             m2m_field='delivery_complications',
             field_other='delivery_complications_other')
 
+    @property
+    def maternal_status_visit(self):
+        try:
+            return self._latest_visit
+        except AttributeError:
+            cleaned_data = self.cleaned_data
+            self._latest_visit = self.maternal_visit_cls.objects.filter(
+                subject_identifier=cleaned_data.get(
+                    'subject_identifier')).order_by('-created').first()
+            return self._latest_visit
+
     @property
     def maternal_status_helper(self):
-        cleaned_data = self.cleaned_data
-        latest_visit = self.maternal_visit_cls.objects.filter(
-            subject_identifier=cleaned_data.get(
-                'subject_identifier')).order_by('-created').first()
-        if latest_visit:
-            return MaternalStatusHelper(latest_visit)
+        if self.maternal_status_visit:
+            return super().maternal_status_helper
         else:
             raise ValidationError(
                 'Please complete previous visits before filling in '
@@ -1,5 +1,3 @@
-from django import forms
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_constants.constants import YES, NO, RESTARTED, CONTINUOUS, STOPPED, OTHER, \
     NOT_APPLICABLE
@@ -7,7 +5,9 @@ from edc_form_validators import FormValidator
 
 from td_maternal.helper_classes import MaternalStatusHelper
 from .crf_form_validator import TDCRFFormValidator
+from .dependency_manifest import Dependency
 from .form_validator_mixin import TDFormValidatorMixin
+from .model_resolver import resolve_model
 
 
 class MaternalLifetimeArvHistoryFormValidator(TDCRFFormValidator,
@@ -18,35 +18,101 @@ class MaternalLifetimeArvHistoryFormValidator(TDCRFFormValidator,
     antenatal_enrollment_model = 'td_maternal.antenatalenrollment'
     medical_history_model = 'td_maternal.maternalmedicalhistory'
 
+    dependencies = (
+        Dependency('ob_history_model', 'maternal_visit__subject_identifier'),
+        Dependency('medical_history_model', 'maternal_visit__subject_identifier'),
+        Dependency('antenatal_enrollment_model', 'subject_identifier'))
+
     @property
     def antenatal_enrollment_cls(self):
-        return django_apps.get_model(self.antenatal_enrollment_model)
+        return resolve_model(self, self.antenatal_enrollment_model)
 
     @property
     def maternal_consent_model_cls(self):
-        return django_apps.get_model(self.maternal_consent_model)
+        return resolve_model(self, self.maternal_consent_model)
 
     @property
     def maternal_medical_history_model_cls(self):
-        return django_apps.get_model(self.medical_history_model)
+        return resolve_model(self, self.medical_history_model)
 
     @property
     def maternal_ob_history_model_cls(self):
-        return django_apps.get_model(self.ob_history_model)
+        return resolve_model(self, self.ob_history_model)
+
+    # prerequisite forms, in the order their errors are reported, as
+    # (name of the method returning the form or None, error message)
+    prerequisite_forms = (
+        ('ob_history',
+         'Please fill in the Maternal Obsterical History form first.'),
+        ('medical_history',
+         'Date of diagnosis required, complete Maternal Medical '
+         'History form before proceeding.'),
+        ('antenatal_enrollment',
+         'Date of HIV test required, complete Antenatal Enrollment'
+         ' form before proceeding.'),
+    )
+
+    prefetch_lookups = ('ob_history', 'medical_history')
 
     def clean(self):
-        self.subject_identifier = self.cleaned_data.get(
-            'maternal_visit').subject_identifier
+        self.subject_identifier = self.resolved_visit.subject_identifier
         super().clean()
 
+        prerequisites = self.prerequisites()
+
         self.validate_prior_preg(cleaned_data=self.cleaned_data)
 
-        self.validate_maternal_consent(cleaned_data=self.cleaned_data)
+        self.validate_maternal_consent(
+            cleaned_data=self.cleaned_data,
+            maternal_consent=prerequisites.get('maternal_consent'))
 
-        self.validate_prev_preg(cleaned_data=self.cleaned_data)
-        self.validate_hiv_test_date_antenatal_enrollment()
+        self.validate_prev_preg(
+            cleaned_data=self.cleaned_data,
+            ob_history=prerequisites.get('ob_history'))
+        self.validate_hiv_test_date_antenatal_enrollment(
+            medical_history=prerequisites.get('medical_history'),
+            antenatal_enrollment=prerequisites.get('antenatal_enrollment'))
         self.validate_other_mother()
 
+    def prerequisites(self):
+        """Returns the prerequisite forms by name or raises one
+        ValidationError listing every missing form.
+
+        The maternal consent is only required if haart_start_date
+        is given.
+        """
+        prerequisites = {}
+        missing = []
+        if self.cleaned_data.get('haart_start_date'):
+            id = None
+            if self.instance:
+                id = self.instance.id
+            try:
+                prerequisites['maternal_consent'] = self.validate_against_consent(
+                    id=id)
+            except ValidationError as e:
+                missing.extend(e.messages)
+        for name, message in self.prerequisite_forms:
+            prerequisites[name] = getattr(self, name)()
+            if prerequisites[name] is None:
+                missing.append(message)
+        if missing:
+            raise ValidationError(missing)
+        return prerequisites
+
+    def ob_history(self):
+        def loader():
+            return self.maternal_ob_history_model_cls.objects.filter(
+                maternal_visit__subject_identifier=self.subject_identifier).first()
+        return self.lookup('ob_history', loader)
+
+    def medical_history(self):
+        return self.lookup(
+            'medical_history', lambda: self.subject_context.medical_history)
+
+    def antenatal_enrollment(self):
+        return self.subject_context.antenatal_enrollment
+
     def validate_prior_preg(self, cleaned_data=None):
         responses = (CONTINUOUS, RESTARTED)
         if (cleaned_data.get('preg_on_haart') == NO
@@ -64,9 +130,8 @@ class MaternalLifetimeArvHistoryFormValidator(TDCRFFormValidator,
             self._errors.update(msg)
             raise ValidationError(msg)
 
-        qs = self.cleaned_data.get('prior_arv')
-        if qs and qs.count() >= 1:
-            selected = {obj.short_name: obj.name for obj in qs}
+        selected = self.m2m_selection('prior_arv')
+        if selected:
             if (self.cleaned_data.get('prior_preg') != NOT_APPLICABLE and
                     NOT_APPLICABLE in selected):
                 message = {
@@ -90,78 +155,39 @@ class MaternalLifetimeArvHistoryFormValidator(TDCRFFormValidator,
             m2m_field='prior_arv',
             field_other='prior_arv_other')
 
-    def validate_maternal_consent(self, cleaned_data=None):
+    def validate_maternal_consent(self, cleaned_data=None, maternal_consent=None):
         if cleaned_data.get('haart_start_date'):
-            id = None
-            if self.instance:
-                id = self.instance.id
-            try:
-                maternal_consent = self.validate_against_consent(id=id)
-                if cleaned_data.get('report_datetime') < maternal_consent.consent_datetime:
-                    msg = {'report_datetime': 'Report datetime CANNOT be '
-                                              'before consent datetime'}
-                    self._errors.update(msg)
-                    raise ValidationError(msg)
-
-                if cleaned_data.get('haart_start_date') < maternal_consent.dob:
-                    msg = {'haart_start_date': 'Date of triple ARVs first '
-                                               'started CANNOT be before DOB.'}
-                    self._errors.update(msg)
-                    raise ValidationError(msg)
-            except self.maternal_consent_model_cls.DoesNotExist:
-                raise ValidationError('Maternal Consent does not exist.')
-
-    def validate_prev_preg(self, cleaned_data=None):
-        ob_history = self.maternal_ob_history_model_cls.objects.filter(
-            maternal_visit__subject_identifier=cleaned_data.get(
-                'maternal_visit').subject_identifier)
-        if not ob_history:
-            raise ValidationError(
-                'Please fill in the Maternal Obsterical History form first.')
-        else:
-            condition = ob_history[0].prev_pregnancies > 1
-            fields_applicable = ['prev_preg_azt',
-                                 'prev_sdnvp_labour', 'prev_preg_haart']
-            for field_applicable in fields_applicable:
-                self.applicable_if_true(condition,
-                                        field_applicable=field_applicable)
-
-    def validate_hiv_test_date_antenatal_enrollment(self):
-        try:
-            medical_history = self.maternal_medical_history_model_cls.objects.get(
-                maternal_visit__subject_identifier=self.cleaned_data.get('maternal_visit').subject_identifier)
-        except self.maternal_medical_history_model_cls.DoesNotExist:
-            raise forms.ValidationError(
-                'Date of diagnosis required, complete Maternal Medical '
-                'History form before proceeding.')
-        else:
-            if(self.cleaned_data.get('haart_start_date') and
-               self.cleaned_data.get('haart_start_date') < medical_history.date_hiv_diagnosis):
-                msg = {'haart_start_date':
-                       'Haart start date cannot be before HIV diagnosis date.'}
+            if cleaned_data.get('report_datetime') < maternal_consent.consent_datetime:
+                msg = {'report_datetime': 'Report datetime CANNOT be '
+                                          'before consent datetime'}
                 self._errors.update(msg)
+                raise ValidationError(msg)
 
-        try:
-            antenatal_enrollment = self.antenatal_enrollment_cls.objects.get(
-                subject_identifier=self.cleaned_data.get(
-                    'maternal_visit').subject_identifier)
-        except self.antenatal_enrollment_cls.DoesNotExist:
-            raise forms.ValidationError(
-                'Date of HIV test required, complete Antenatal Enrollment'
-                ' form before proceeding.')
-        else:
-            if(self.cleaned_data.get('haart_start_date') and
-                    self.cleaned_data.get('haart_start_date') < antenatal_enrollment.week32_test_date):
-                msg = {'haart_start_date':
-                       'Haart start date cannot be before date of HIV test.'}
+            if cleaned_data.get('haart_start_date') < maternal_consent.dob:
+                msg = {'haart_start_date': 'Date of triple ARVs first '
+                                           'started CANNOT be before DOB.'}
                 self._errors.update(msg)
                 raise ValidationError(msg)
 
-    @property
-    def subject_screening(self):
-        try:
-            return self.subject_screening_cls.objects.get(
-                subject_identifier=self.cleaned_data.get(
-                    'maternal_visit').appointment.subject_identifier)
-        except self.subject_screening_cls.DoesNotExist:
-            return None
+    def validate_prev_preg(self, cleaned_data=None, ob_history=None):
+        condition = ob_history.prev_pregnancies > 1
+        fields_applicable = ['prev_preg_azt',
+                             'prev_sdnvp_labour', 'prev_preg_haart']
+        for field_applicable in fields_applicable:
+            self.applicable_if_true(condition,
+                                    field_applicable=field_applicable)
+
+    def validate_hiv_test_date_antenatal_enrollment(self, medical_history=None,
+                                                    antenatal_enrollment=None):
+        if(self.cleaned_data.get('haart_start_date') and
+           self.cleaned_data.get('haart_start_date') < medical_history.date_hiv_diagnosis):
+            msg = {'haart_start_date':
+                   'Haart start date cannot be before HIV diagnosis date.'}
+            self._errors.update(msg)
+
+        if(self.cleaned_data.get('haart_start_date') and
+                self.cleaned_data.get('haart_start_date') < antenatal_enrollment.week32_test_date):
+            msg = {'haart_start_date':
+                   'Haart start date cannot be before date of HIV test.'}
+            self._errors.update(msg)
+            raise ValidationError(msg)
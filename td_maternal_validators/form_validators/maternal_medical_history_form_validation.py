@@ -1,28 +1,32 @@
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_constants.constants import YES, NO, NOT_APPLICABLE, NEG, POS, OTHER
 from edc_form_validators import FormValidator
-from td_maternal.helper_classes import MaternalStatusHelper
 
 from .crf_form_validator import TDCRFFormValidator
+from .dependency_manifest import Dependency
+from .maternal_status import MaternalStatusMixin
+from .model_resolver import resolve_model
 
 
 class MaternalMedicalHistoryFormValidator(TDCRFFormValidator,
+                                          MaternalStatusMixin,
                                           FormValidator):
 
     antenatal_enrollment_model = 'td_maternal.antenatalenrollment'
 
+    dependencies = (
+        Dependency('antenatal_enrollment_model', 'subject_identifier'), )
+
     @property
     def antenatal_enrollment_cls(self):
-        return django_apps.get_model(self.antenatal_enrollment_model)
+        return resolve_model(self, self.antenatal_enrollment_model)
 
     @property
     def maternal_visit_cls(self):
-        return django_apps.get_model(self.maternal_visit_model)
+        return resolve_model(self, self.maternal_visit_model)
 
     def clean(self):
-        self.subject_identifier = self.cleaned_data.get(
-            'maternal_visit').subject_identifier
+        self.subject_identifier = self.resolved_visit.subject_identifier
         super().clean()
 
         self.validate_chronic_since_who_diagnosis_neg(
@@ -71,9 +75,8 @@ class MaternalMedicalHistoryFormValidator(TDCRFFormValidator,
         subject_status = self.maternal_status_helper.hiv_status
 
         if subject_status == POS and cleaned_data.get('who_diagnosis') == YES:
-            qs = self.cleaned_data.get('who')
-            if qs and qs.count() > 0:
-                selected = {obj.short_name: obj.name for obj in qs}
+            selected = self.m2m_selection('who')
+            if selected:
                 if NOT_APPLICABLE in selected:
                     msg = {'who':
                            'Participant indicated that they had WHO stage III '
@@ -81,9 +84,8 @@ class MaternalMedicalHistoryFormValidator(TDCRFFormValidator,
                     self._errors.update(msg)
                     raise ValidationError(msg)
         elif cleaned_data.get('who_diagnosis') != YES:
-            qs = self.cleaned_data.get('who')
-            if qs and qs.count() > 0:
-                selected = {obj.short_name: obj.name for obj in qs}
+            selected = self.m2m_selection('who')
+            if selected:
                 if NOT_APPLICABLE not in selected:
                     msg = {'who':
                            'Participant indicated that they do not have WHO stage'
@@ -210,15 +212,20 @@ class MaternalMedicalHistoryFormValidator(TDCRFFormValidator,
 
         if cleaned_data.get('sero_posetive') == YES:
 
-            antenatal_enrollment = self.antenatal_enrollment_cls.objects.get(
-                subject_identifier=cleaned_data.get('maternal_visit').subject_identifier)
-
-            if antenatal_enrollment.week32_test_date:
-                if antenatal_enrollment.week32_test_date != cleaned_data.get(
-                        'date_hiv_diagnosis'):
+            week32_test_date = self.subject_context.anchor('week32_test_date')
+            if week32_test_date is None:
+                antenatal_enrollment = self.subject_context.antenatal_enrollment
+                if not antenatal_enrollment:
+                    raise ValidationError(
+                        'Please complete Antenatal Enrollment form before '
+                        'proceeding.')
+                week32_test_date = antenatal_enrollment.week32_test_date
+
+            if week32_test_date:
+                if week32_test_date != cleaned_data.get('date_hiv_diagnosis'):
                     msg = {'date_hiv_diagnosis':
                            'HIV diagnosis date should match date '
-                           f'{antenatal_enrollment.week32_test_date} at Antenatal '
+                           f'{week32_test_date} at Antenatal '
                            'Enrollment'}
                     self._errors.update(msg)
                     raise ValidationError(msg)
@@ -228,10 +235,3 @@ class MaternalMedicalHistoryFormValidator(TDCRFFormValidator,
                        'Please fill the date before proceeding.'}
                 self._errors.update(msg)
                 raise ValidationError(msg)
-
-    @property
-    def maternal_status_helper(self):
-        cleaned_data = self.cleaned_data
-        status_helper = MaternalStatusHelper(
-            cleaned_data.get('maternal_visit'))
-        return status_helper
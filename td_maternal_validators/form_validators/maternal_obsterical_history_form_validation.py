@@ -1,21 +1,24 @@
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_form_validators.form_validator import FormValidator
 
 from .crf_form_validator import TDCRFFormValidator
+from .dependency_manifest import Dependency
+from .model_resolver import resolve_model
 
 
 class MaternalObstericalHistoryFormValidator(TDCRFFormValidator,
                                              FormValidator):
     maternal_ultrasound_init_model = 'td_maternal.maternalultrasoundinitial'
 
+    dependencies = (
+        Dependency('maternal_ultrasound_init_model', 'maternal_visit'), )
+
     @property
     def maternal_ultrasound_init_cls(self):
-        return django_apps.get_model(self.maternal_ultrasound_init_model)
+        return resolve_model(self, self.maternal_ultrasound_init_model)
 
     def clean(self):
-        self.subject_identifier = self.cleaned_data.get(
-            'maternal_visit').subject_identifier
+        self.subject_identifier = self.resolved_visit.subject_identifier
         super().clean()
 
         self.validate_ultrasound(cleaned_data=self.cleaned_data)
@@ -1,15 +1,16 @@
 from django.core.exceptions import ValidationError
 from edc_constants.constants import YES, POS, NOT_APPLICABLE, NO, OTHER
 from edc_form_validators import FormValidator
-from td_maternal.helper_classes import MaternalStatusHelper
-from ..form_validators import TDCRFFormValidator
 
+from .crf_form_validator import TDCRFFormValidator
+from .maternal_status import MaternalStatusMixin
 
-class MaternalPostPartumFuFormValidator(TDCRFFormValidator, FormValidator):
+
+class MaternalPostPartumFuFormValidator(TDCRFFormValidator, MaternalStatusMixin,
+                                        FormValidator):
 
     def clean(self):
-        self.subject_identifier = self.cleaned_data.get(
-            'maternal_visit').subject_identifier
+        self.subject_identifier = self.resolved_visit.subject_identifier
         super().clean()
         required_fields = ('hospitalization_reason', 'diagnoses')
         for required_field in required_fields:
@@ -59,9 +60,7 @@ class MaternalPostPartumFuFormValidator(TDCRFFormValidator, FormValidator):
                                'WHO Stage III/IV should be N/A'
         )
         self.m2m_required(m2m_field='who')
-        qs = self.cleaned_data.get('who').values_list(
-            'short_name', flat=True)
-        selection = list(qs.all())
+        selection = self.m2m_selection('who')
         if not condition:
             if NOT_APPLICABLE not in selection:
                 msg = {'who':
@@ -81,9 +80,7 @@ class MaternalPostPartumFuFormValidator(TDCRFFormValidator, FormValidator):
 
     def m2m_na_validation(self, field=None, m2m_field=None, msg=None,
                           na_msg=None):
-        qs = self.cleaned_data.get(m2m_field).values_list(
-            'short_name', flat=True)
-        selection = list(qs.all())
+        selection = self.m2m_selection(m2m_field)
         if self.cleaned_data.get(field) == YES:
             if NOT_APPLICABLE in selection:
                 message = {m2m_field: msg}
@@ -109,8 +106,3 @@ class MaternalPostPartumFuFormValidator(TDCRFFormValidator, FormValidator):
                 'Other, specify',
                 m2m_field=m2m_field,
                 field_other=field)
-
-    @property
-    def maternal_status_helper(self):
-        cleaned_data = self.cleaned_data
-        return MaternalStatusHelper(cleaned_data.get('maternal_visit'))
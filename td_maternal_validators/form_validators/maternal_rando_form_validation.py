@@ -1,9 +1,10 @@
-from django.apps import apps as django_apps
-from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.core.exceptions import ValidationError
 from edc_constants.constants import POS
 from edc_form_validators import FormValidator
 
 from .crf_form_validator import TDCRFFormValidator
+from .dependency_manifest import Dependency
+from .model_resolver import resolve_model
 
 
 class MaternalRandoFormValidator(TDCRFFormValidator,
@@ -11,15 +12,20 @@ class MaternalRandoFormValidator(TDCRFFormValidator,
 
     antenatal_enrollment_model = 'td_maternal.antenatalenrollment'
 
+    dependencies = (
+        Dependency('antenatal_enrollment_model', 'subject_identifier'), )
+
+    prerequisite_steps = ('validate_antenatal_enrollment', )
+
     @property
     def antenatal_enrollment_cls(self):
-        return django_apps.get_model(self.antenatal_enrollment_model)
+        return resolve_model(self, self.antenatal_enrollment_model)
 
     def clean(self):
-        self.subject_identifier = self.cleaned_data.get(
-            'maternal_visit').subject_identifier
+        self.subject_identifier = self.resolved_visit.subject_identifier
         super().clean()
 
+        self.validate_antenatal_enrollment()
         self.verify_hiv_status()
 
         self.validate_other_specify(
@@ -30,15 +36,14 @@ class MaternalRandoFormValidator(TDCRFFormValidator,
     def antenatal_enrollment(self):
         """Return antenatal enrollment.
         """
-        try:
-            antenatal_enrollment = self.antenatal_enrollment_cls.objects.get(
-                subject_identifier=self.cleaned_data.get('maternal_visit').appointment.subject_identifier)
-        except ObjectDoesNotExist:
+        return self.subject_context.antenatal_enrollment
+
+    def validate_antenatal_enrollment(self):
+        if not self.antenatal_enrollment:
             msg = {'sid':
                    f'Antenatal Enrollment for subject {self.subject_identifier} must exist'}
             self._errors.update(msg)
             raise ValidationError(msg)
-        return antenatal_enrollment
 
     def verify_hiv_status(self):
         if self.antenatal_enrollment.enrollment_hiv_status != POS:
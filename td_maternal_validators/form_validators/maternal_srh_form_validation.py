@@ -9,8 +9,7 @@ class MaternalSrhFormValidator(TDCRFFormValidator,
                                FormValidator):
 
     def clean(self):
-        self.subject_identifier = self.cleaned_data.get(
-            'maternal_visit').subject_identifier
+        self.subject_identifier = self.resolved_visit.subject_identifier
         super().clean()
 
         self.not_required_if(
@@ -76,9 +75,8 @@ class MaternalSrhFormValidator(TDCRFFormValidator,
                 raise ValidationError(msg)
 
     def validate_m2m_required(self):
-        qs = self.cleaned_data.get('contr')
-        if qs and qs.count() >= 1:
-            selected = {obj.short_name: obj.name for obj in qs}
+        selected = self.m2m_selection('contr')
+        if selected:
             if (self.cleaned_data.get('is_contraceptive_initiated') == YES and
                     NOT_APPLICABLE in selected):
                 message = {
@@ -89,10 +87,9 @@ class MaternalSrhFormValidator(TDCRFFormValidator,
     def validate_m2m_required_(self):
         is_contraceptive_initiated = self.cleaned_data.get(
             'is_contraceptive_initiated')
-        qs = self.cleaned_data.get('contr')
+        selected = self.m2m_selection('contr')
 
-        if qs and qs.count() >= 1:
-            selected = {obj.short_name: obj.name for obj in qs}
+        if selected:
             if is_contraceptive_initiated != YES \
                     and (NOT_APPLICABLE not in selected):
                 message = {
@@ -0,0 +1,146 @@
+import threading
+import time
+from collections import namedtuple
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.utils.module_loading import import_string
+
+from .dependency_manifest import Dependency
+
+MaternalStatus = namedtuple('MaternalStatus', ['hiv_status'])
+
+
+class MaternalStatusCache:
+    """Process-wide cache of the HIV status computed by
+    MaternalStatusHelper, by maternal visit id.
+
+    Disabled unless `ttl`, or settings.TD_MATERNAL_STATUS_CACHE_TTL, is
+    a positive number of seconds. Entries are dropped for a subject when
+    one of the `status_models` is saved or deleted, but only in the
+    process that handled the save, so other worker processes may serve
+    a stale status until the entry expires. Only enable it for a single
+    process or with a TTL the study accepts as a delay.
+    """
+
+    # imported on first use, td_maternal is slow to import
+    helper_cls = 'td_maternal.helper_classes.MaternalStatusHelper'
+
+    status_models = (
+        'td_maternal.antenatalenrollment',
+        'td_maternal.maternalhivinterimhx',
+        'td_maternal.maternalinterimidcc',
+        'td_maternal.rapidtestresult')
+
+    def __init__(self, ttl=None):
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    @property
+    def ttl(self):
+        if self._ttl is not None:
+            return self._ttl
+        return getattr(settings, 'TD_MATERNAL_STATUS_CACHE_TTL', 0)
+
+    def get_helper_cls(self):
+        if isinstance(self.helper_cls, str):
+            return import_string(self.helper_cls)
+        return self.helper_cls
+
+    @property
+    def enabled(self):
+        return self.ttl > 0
+
+    def get(self, maternal_visit):
+        """Returns the MaternalStatus for the maternal visit, computing
+        it with the helper class on a miss or if the cache is disabled.
+        """
+        if not self.enabled:
+            return MaternalStatus(
+                hiv_status=self.get_helper_cls()(maternal_visit).hiv_status)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(maternal_visit.id)
+        if entry and entry[2] > now:
+            return entry[1]
+        maternal_status = MaternalStatus(
+            hiv_status=self.get_helper_cls()(maternal_visit).hiv_status)
+        with self._lock:
+            self._entries[maternal_visit.id] = (
+                maternal_visit.subject_identifier, maternal_status,
+                now + self.ttl)
+        return maternal_status
+
+    def invalidate(self, subject_identifier=None, maternal_visit_id=None):
+        """Drops the entries of the subject or visit, or all entries
+        if neither is given.
+        """
+        with self._lock:
+            if subject_identifier is None and maternal_visit_id is None:
+                self._entries.clear()
+            elif maternal_visit_id is not None:
+                self._entries.pop(maternal_visit_id, None)
+            else:
+                for visit_id, entry in list(self._entries.items()):
+                    if entry[0] == subject_identifier:
+                        del self._entries[visit_id]
+
+    def connect(self):
+        """Connects the invalidation receivers for the status models.
+        """
+        for label in self.status_models:
+            for signal in (post_save, post_delete):
+                signal.connect(
+                    self.status_model_changed, sender=label, weak=False,
+                    dispatch_uid=f'maternal_status_cache_{label}')
+
+    def status_model_changed(self, sender, instance, **kwargs):
+        subject_identifier = getattr(instance, 'subject_identifier', None)
+        if subject_identifier is None:
+            maternal_visit = getattr(instance, 'maternal_visit', None)
+            subject_identifier = getattr(
+                maternal_visit, 'subject_identifier', None)
+        if subject_identifier is None:
+            self.invalidate()
+        else:
+            self.invalidate(subject_identifier=subject_identifier)
+
+
+maternal_status_cache = MaternalStatusCache()
+
+
+class MaternalStatusMixin:
+    """Gives a validator `maternal_status_helper`, the HIV status of the
+    submitted maternal visit.
+
+    The status is computed once per visit for the validator, and is
+    shared across requests only if the maternal status cache is enabled.
+    """
+
+    maternal_status_cache = maternal_status_cache
+
+    # read by MaternalStatusHelper
+    dependencies = (
+        Dependency('td_maternal.antenatalenrollment', 'subject_identifier'),
+        Dependency('td_maternal.maternalhivinterimhx', 'maternal_visit__subject_identifier'),
+        Dependency('td_maternal.maternalinterimidcc', 'maternal_visit__subject_identifier'),
+        Dependency('td_maternal.rapidtestresult', 'maternal_visit__subject_identifier'))
+
+    @property
+    def maternal_status_visit(self):
+        return self.cleaned_data.get('maternal_visit')
+
+    @property
+    def maternal_status_helper(self):
+        maternal_visit = self.maternal_status_visit
+        try:
+            snapshot_visit, maternal_status = self._maternal_status
+        except AttributeError:
+            pass
+        else:
+            if snapshot_visit is maternal_visit:
+                return maternal_status
+        maternal_status = self.maternal_status_cache.get(maternal_visit)
+        self._maternal_status = (maternal_visit, maternal_status)
+        return maternal_status
@@ -2,26 +2,31 @@ from edc_constants.constants import YES
 from edc_form_validators.form_validator import FormValidator
 
 from .crf_form_validator import TDCRFFormValidator
+from .rule_table import RequiredIf
+
+
+def frequency_required_if(field, field_required):
+    return RequiredIf(
+        YES,
+        field=field,
+        field_required=field_required,
+        required_msg='please give a frequency.',
+        not_required_msg='please do not give a frequency.')
 
 
 class MaternalSubstanceUseDuringPregFormValidator(TDCRFFormValidator,
                                                   FormValidator):
 
+    rules = (
+        frequency_required_if(
+            'smoked_during_pregnancy', 'smoking_during_preg_freq'),
+        frequency_required_if(
+            'alcohol_during_pregnancy', 'alcohol_during_preg_freq'),
+        frequency_required_if(
+            'marijuana_during_preg', 'marijuana_during_preg_freq'),
+    )
+
     def clean(self):
-        self.subject_identifier = self.cleaned_data.get(
-            'maternal_visit').subject_identifier
+        self.subject_identifier = self.resolved_visit.subject_identifier
         super().clean()
-
-        required_fields = {'smoked_during_pregnancy': 'smoking_during_preg_freq',
-                           'alcohol_during_pregnancy': 'alcohol_during_preg_freq',
-                           'marijuana_during_preg': 'marijuana_during_preg_freq'
-                           }
-
-        for field, required_field in required_fields.items():
-            self.required_if(
-                YES,
-                field=field,
-                field_required=required_field,
-                required_msg='please give a frequency.',
-                not_required_msg='please do not give a frequency.'
-            )
+        self.apply_rules()
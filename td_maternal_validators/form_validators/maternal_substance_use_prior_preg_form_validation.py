@@ -2,30 +2,28 @@ from edc_constants.constants import YES
 from edc_form_validators import FormValidator
 
 from .crf_form_validator import TDCRFFormValidator
+from .rule_table import RequiredIf
 
 
 class MaternalSubstanceUsePriorPregFormValidator(TDCRFFormValidator,
                                                  FormValidator):
 
-    def clean(self):
-        self.subject_identifier = self.cleaned_data.get(
-            'maternal_visit').subject_identifier
-        super().clean()
-
-        self.required_if(
+    rules = (
+        RequiredIf(
             YES,
             field='smoked_prior_to_preg',
-            field_required='smoking_prior_preg_freq'
-        )
-
-        self.required_if(
+            field_required='smoking_prior_preg_freq'),
+        RequiredIf(
             YES,
             field='alcohol_prior_pregnancy',
-            field_required='alcohol_prior_preg_freq'
-        )
-
-        self.required_if(
+            field_required='alcohol_prior_preg_freq'),
+        RequiredIf(
             YES,
             field='marijuana_prior_preg',
-            field_required='marijuana_prior_preg_freq'
-        )
+            field_required='marijuana_prior_preg_freq'),
+    )
+
+    def clean(self):
+        self.subject_identifier = self.resolved_visit.subject_identifier
+        super().clean()
+        self.apply_rules()
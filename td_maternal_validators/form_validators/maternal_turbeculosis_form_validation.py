@@ -2,30 +2,28 @@ from edc_constants.constants import YES
 from edc_form_validators import FormValidator
 
 from .crf_form_validator import TDCRFFormValidator
+from .rule_table import RequiredIf
 
 
 class MaternalTuberculosisHistoryFormValidator(TDCRFFormValidator,
                                                FormValidator):
 
-    def clean(self):
-        self.subject_identifier = self.cleaned_data.get(
-            'maternal_visit').subject_identifier
-        super().clean()
-
-        self.required_if(
+    rules = (
+        RequiredIf(
             YES,
             field='coughing',
-            field_required='coughing_rel'
-        ),
-
-        self.required_if(
+            field_required='coughing_rel'),
+        RequiredIf(
             YES,
             field='diagnosis',
-            field_required='diagnosis_rel'
-        ),
-
-        self.required_if(
+            field_required='diagnosis_rel'),
+        RequiredIf(
             YES,
             field='tb_treatment',
-            field_required='tb_treatment_rel'
-        )
+            field_required='tb_treatment_rel'),
+    )
+
+    def clean(self):
+        self.subject_identifier = self.resolved_visit.subject_identifier
+        super().clean()
+        self.apply_rules()
@@ -9,8 +9,7 @@ class MaternalUltrasoundInitialFormValidator(TDCRFFormValidator, FormValidator):
     def clean(self):
 
         cleaned_data = self.cleaned_data
-        self.subject_identifier = cleaned_data.get(
-            'maternal_visit').subject_identifier
+        self.subject_identifier = self.resolved_visit.subject_identifier
         super().clean()
 
         if cleaned_data.get('est_edd_ultrasound') and (
@@ -63,5 +62,5 @@ class MaternalUltrasoundInitialFormValidator(TDCRFFormValidator, FormValidator):
     def validate_edd_report_datetime(self):
         if (self.cleaned_data.get('est_edd_ultrasound') and
                 self.cleaned_data.get('est_edd_ultrasound') <
-                self.cleaned_data.get('maternal_visit').report_datetime.date()):
+                self.resolved_visit.maternal_visit.report_datetime.date()):
             raise ValidationError('Expected a future date')
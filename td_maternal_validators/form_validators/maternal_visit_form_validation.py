@@ -1,38 +1,48 @@
-from dateutil import relativedelta
 from django import forms
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
-from edc_action_item.site_action_items import site_action_items
-from edc_base.utils import get_utcnow
-from edc_constants.constants import OFF_STUDY, DEAD, YES, ON_STUDY, NEW, OTHER
+from edc_constants.constants import OFF_STUDY, DEAD, YES, ON_STUDY, OTHER
 from edc_constants.constants import PARTICIPANT, ALIVE, NO
 from edc_form_validators import FormValidator
 from edc_visit_tracking.constants import COMPLETED_PROTOCOL_VISIT
 from edc_visit_tracking.constants import LOST_VISIT, SCHEDULED, MISSED_VISIT
 from edc_visit_tracking.form_validators import VisitFormValidator
-from td_prn.action_items import MATERNALOFF_STUDY_ACTION
 
+from ..constants import OFFSTUDY_SCHEDULED
+from .dependency_manifest import Dependency
 from .form_validator_mixin import TDFormValidatorMixin
+from .karabo_eligibility import karabo_eligibility
+from .model_resolver import resolve_model
+from .offstudy_status import OffstudyStatusMixin
 
 
-class MaternalVisitFormValidator(VisitFormValidator,
+class MaternalVisitFormValidator(VisitFormValidator, OffstudyStatusMixin,
                                  TDFormValidatorMixin, FormValidator):
 
     maternal_labour_del_model = 'td_maternal.maternallabourdel'
     karabo_subject_consent_model = 'td_maternal.karabosubjectconsent'
     karabo_subject_screening_model = 'td_maternal.karabosubjectscreening'
 
+    dependencies = (
+        Dependency('maternal_labour_del_model', 'subject_identifier'),
+        Dependency('karabo_subject_consent_model', 'subject_identifier'),
+        Dependency('karabo_subject_screening_model', 'subject_identifier'))
+
+    karabo_eligibility = karabo_eligibility
+
+    prefetch_fact_groups = TDFormValidatorMixin.prefetch_fact_groups + (
+        ('karabo_screening', ), )
+
+    prefetch_lookups = ('karabo_consent', )
+
+    prerequisite_steps = ('validate_is_karabo_eligible', )
+
     @property
     def maternal_labour_del_cls(self):
-        return django_apps.get_model(self.maternal_labour_del_model)
+        return resolve_model(self, self.maternal_labour_del_model)
 
     @property
     def karabo_consent_model_cls(self):
-        return django_apps.get_model(self.karabo_subject_consent_model)
-
-    @property
-    def karabo_screening_model_cls(self):
-        return django_apps.get_model(self.karabo_subject_screening_model)
+        return resolve_model(self, self.karabo_subject_consent_model)
 
     def clean(self):
         super().clean()
@@ -71,50 +81,44 @@ class MaternalVisitFormValidator(VisitFormValidator,
             raise ValidationError(msg)
 
     def validate_is_karabo_eligible(self, id=None):
-        try:
-            karabo_screening = self.karabo_screening_model_cls.objects.get(
-                subject_identifier=self.subject_identifier)
-
-        except self.karabo_screening_model_cls.DoesNotExist:
+        karabo_screening = self.karabo_screening()
+        if not karabo_screening:
             if self.infant_age_valid() and not id:
                 msg = {'__all__': 'Participant has not been screened for '
                        'Karabo. Please fill in the Karabo screening form '
                        'first.'}
                 self._errors.update(msg)
                 raise ValidationError(msg)
-        else:
-            if karabo_screening.is_eligible:
-                try:
-                    self.karabo_consent_model_cls.objects.get(
-                        subject_identifier=self.subject_identifier)
-                except self.karabo_consent_model_cls.DoesNotExist:
-                    msg = {'__all__': 'Participant is eligible for Karabo '
-                           'sub-study, please complete Karabo subject consent'
-                           'first.'}
-                    self._errors.update(msg)
-                    raise ValidationError(msg)
+        elif karabo_screening.is_eligible and not self.karabo_consent():
+            msg = {'__all__': 'Participant is eligible for Karabo '
+                   'sub-study, please complete Karabo subject consent'
+                   'first.'}
+            self._errors.update(msg)
+            raise ValidationError(msg)
 
     def infant_age_valid(self):
-        if self.maternal_labour_del():
-            birth_datetime = self.maternal_labour_del().delivery_datetime
-            difference = relativedelta.relativedelta(
-                get_utcnow(), birth_datetime)
-            months = 0
-            if difference.years > 0:
-                months = difference.years * 12
-            return (months + difference.months) < 21
-        return False
+        return self.karabo_eligibility.is_eligible(self.delivery_datetime())
+
+    def karabo_screening(self):
+        return self.subject_context.karabo_screening
+
+    def karabo_consent(self):
+        def loader():
+            try:
+                return self.karabo_consent_model_cls.objects.get(
+                    subject_identifier=self.subject_identifier)
+            except self.karabo_consent_model_cls.DoesNotExist:
+                return None
+        return self.lookup('karabo_consent', loader)
 
     def maternal_labour_del(self):
-        subject_identifier = self.cleaned_data.get('appointment').subject_identifier
+        return self.subject_context.maternal_labour_del
 
-        try:
-            maternal_labour_del = self.maternal_labour_del_cls.objects.get(
-                subject_identifier=subject_identifier)
-        except self.maternal_labour_del_cls.DoesNotExist:
-            return None
-        else:
-            return maternal_labour_del
+    def delivery_datetime(self):
+        facts = self.subject_context.facts
+        if facts:
+            return facts.delivery_datetime
+        return getattr(self.maternal_labour_del(), 'delivery_datetime', None)
 
     def validate_data_collection(self):
         if (self.cleaned_data.get('reason') == SCHEDULED
@@ -125,35 +129,6 @@ class MaternalVisitFormValidator(VisitFormValidator,
             self._errors.update(msg)
             raise ValidationError(msg)
 
-    def validate_offstudy_model(self):
-        maternal_offstudy_cls = django_apps.get_model(
-            'td_prn.maternaloffstudy')
-        action_cls = site_action_items.get(
-            maternal_offstudy_cls.action_name)
-        action_item_model_cls = action_cls.action_item_model_cls()
-
-        try:
-            action_item_model_cls.objects.get(
-                subject_identifier=self.subject_identifier,
-                action_type__name=MATERNALOFF_STUDY_ACTION,
-                status=NEW)
-        except action_item_model_cls.DoesNotExist:
-            try:
-                maternal_offstudy_cls.objects.get(
-                    subject_identifier=self.subject_identifier)
-            except maternal_offstudy_cls.DoesNotExist:
-                pass
-            else:
-                raise forms.ValidationError(
-                    'Participant has been taken offstudy. Cannot capture any '
-                    'new data.')
-        else:
-            self.maternal_visit = self.cleaned_data.get('maternal_visit') or None
-            if not self.maternal_visit or self.maternal_visit.require_crfs == NO:
-                raise forms.ValidationError(
-                    'Participant is scheduled to be taken offstudy without '
-                    'any new data collection. Cannot capture any new data.')
-
     def validate_is_present(self):
 
         reason = self.cleaned_data.get('reason')
@@ -198,10 +173,10 @@ class MaternalVisitFormValidator(VisitFormValidator,
         """Returns an instance of the current maternal consent or
         raises an exception if not found."""
 
-        latest_consent = self.validate_against_consent(id=id)
+        consent_datetime = self.consent_datetime(id=id)
         last_alive_date = self.cleaned_data.get('last_alive_date')
         if (last_alive_date
-                and last_alive_date < latest_consent.consent_datetime.date()):
+                and last_alive_date < consent_datetime.date()):
             msg = {'last_alive_date': 'Date cannot be before consent date'}
             self._errors.update(msg)
             raise ValidationError(msg)
@@ -210,29 +185,14 @@ class MaternalVisitFormValidator(VisitFormValidator,
         pass
 
     def validate_study_status(self):
-        maternal_offstudy_cls = django_apps.get_model(
-            'td_prn.maternaloffstudy')
-        action_cls = site_action_items.get(
-            maternal_offstudy_cls.action_name)
-        action_item_model_cls = action_cls.action_item_model_cls()
-
-        try:
-            action_item = action_item_model_cls.objects.get(
-                subject_identifier=self.subject_identifier,
-                action_type__name=MATERNALOFF_STUDY_ACTION,
-                status=NEW)
-        except action_item_model_cls.DoesNotExist:
-            try:
-                maternal_offstudy_cls.objects.get(
-                    subject_identifier=self.subject_identifier)
-            except maternal_offstudy_cls.DoesNotExist:
-                pass
-            else:
-                if self.cleaned_data.get('study_status') == ON_STUDY:
-                    raise forms.ValidationError(
-                        {'study_status': 'Participant has been taken offstudy.'
-                         ' Cannot be indicated as on study.'})
-        else:
+        offstudy_status = self.offstudy_status
+        if offstudy_status.status == OFF_STUDY:
+            if self.cleaned_data.get('study_status') == ON_STUDY:
+                raise forms.ValidationError(
+                    {'study_status': 'Participant has been taken offstudy.'
+                     ' Cannot be indicated as on study.'})
+        elif offstudy_status.status == OFFSTUDY_SCHEDULED:
+            action_item = offstudy_status.action_item
             if (action_item.parent_reference_model_obj
                 and self.cleaned_data.get(
                     'report_datetime') >= action_item.parent_reference_model_obj.report_datetime):
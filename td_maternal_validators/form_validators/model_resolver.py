@@ -0,0 +1,24 @@
+from django.apps import apps as django_apps
+
+_resolved = {}
+
+
+def resolve_model(owner, label):
+    """Returns the model class for `label`, cached per owner class and
+    label once the app registry is ready.
+
+    The label is part of the key, so a `*_model` attribute reassigned
+    on the class, as in the tests, resolves to the new model.
+    """
+    key = (owner if isinstance(owner, type) else type(owner), label)
+    try:
+        return _resolved[key]
+    except KeyError:
+        model_cls = django_apps.get_model(label)
+        if django_apps.ready:
+            _resolved[key] = model_cls
+        return model_cls
+
+
+def clear_resolved_models():
+    _resolved.clear()
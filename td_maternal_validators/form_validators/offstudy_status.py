@@ -0,0 +1,61 @@
+from collections import namedtuple
+
+from django import forms
+from edc_constants.constants import NO, OFF_STUDY, ON_STUDY
+
+from ..constants import OFFSTUDY_SCHEDULED
+from .dependency_manifest import Dependency
+from .subject_context import SubjectContextMixin
+from .visit_resolution import VisitResolutionMixin
+
+OffstudyStatus = namedtuple('OffstudyStatus', ['status', 'action_item'])
+
+
+class OffstudyStatusMixin(SubjectContextMixin):
+    """Resolves the subject's off study status once per validator.
+    """
+
+    dependencies = (
+        Dependency('edc_action_item.actionitem', 'subject_identifier'),
+        Dependency('maternal_offstudy_model', 'subject_identifier'))
+
+    @property
+    def offstudy_status(self):
+        """Returns an OffstudyStatus with status one of ON_STUDY,
+        OFF_STUDY or OFFSTUDY_SCHEDULED.
+        """
+        try:
+            resolved = self._offstudy_status
+        except AttributeError:
+            resolved = self._offstudy_status = {}
+        try:
+            return resolved[self.subject_identifier]
+        except KeyError:
+            action_item = self.subject_context.offstudy_action_item
+            facts = self.subject_context.facts
+            if action_item:
+                status = OFFSTUDY_SCHEDULED
+            elif (facts.offstudy if facts
+                  else self.subject_context.maternal_offstudy):
+                status = OFF_STUDY
+            else:
+                status = ON_STUDY
+            offstudy_status = resolved[self.subject_identifier] = OffstudyStatus(
+                status, action_item)
+            return offstudy_status
+
+    def validate_offstudy_model(self):
+        status = self.offstudy_status.status
+        if status == OFF_STUDY:
+            raise forms.ValidationError(
+                'Participant has been taken offstudy. Cannot capture any '
+                'new data.')
+        elif status == OFFSTUDY_SCHEDULED:
+            if isinstance(self, VisitResolutionMixin):
+                self.maternal_visit = self.resolved_visit.maternal_visit
+            else:
+                self.maternal_visit = self.cleaned_data.get('maternal_visit') or None
+            if not self.maternal_visit or self.maternal_visit.require_crfs == NO:
+                raise forms.ValidationError(
+                    'Participant is scheduled to be taken offstudy without '
+                    'any new data collection. Cannot capture any new data.')
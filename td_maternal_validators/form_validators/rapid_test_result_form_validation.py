@@ -1,22 +1,27 @@
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_constants.constants import YES
 from edc_form_validators import FormValidator
 
 from .crf_form_validator import TDCRFFormValidator
+from .dependency_manifest import Dependency
+from .model_resolver import resolve_model
 
 
 class RapidTestResultFormValidator(TDCRFFormValidator, FormValidator):
 
     antenatal_enrollment_model = 'td_maternal.antenatalenrollment'
 
+    dependencies = (
+        Dependency('antenatal_enrollment_model', 'subject_identifier'), )
+
+    prerequisite_steps = ('validate_antenatal_enrollment', )
+
     @property
     def antenatal_enrollment_cls(self):
-        return django_apps.get_model(self.antenatal_enrollment_model)
+        return resolve_model(self, self.antenatal_enrollment_model)
 
     def clean(self):
-        self.subject_identifier = self.cleaned_data.get(
-            'maternal_visit').subject_identifier
+        self.subject_identifier = self.resolved_visit.subject_identifier
         super().clean()
 
         self.required_if(
@@ -38,27 +43,28 @@ class RapidTestResultFormValidator(TDCRFFormValidator, FormValidator):
             not_required_msg=('If a rapid test was not processed, '
                               f'please do not provide the result.'),
             inverse=True)
+        self.validate_antenatal_enrollment()
         self.validate_enrolment_rapid_test_date()
 
-    def validate_enrolment_rapid_test_date(self):
-        try:
-            antenatal_enrollment = self.antenatal_enrollment_cls.objects.get(
-                subject_identifier=self.cleaned_data.get(
-                    'maternal_visit').appointment.subject_identifier)
-        except self.antenatal_enrollment_cls.DoesNotExist:
+    def validate_antenatal_enrollment(self):
+        if (self.subject_context.anchor('rapid_test_date') is None
+                and not self.subject_context.antenatal_enrollment):
             message = {'rapid_test_done':
                        'Antenatal enrollment not found, please complete '
                        'enrollment form.'}
             self._errors.update(message)
             raise ValidationError(message)
-        else:
-            if antenatal_enrollment.rapid_test_date:
-                if (self.cleaned_data.get('result_date') and
-                        self.cleaned_data.get('result_date') <
-                        antenatal_enrollment.rapid_test_date):
-                    message = {
-                        'result_date':
-                        'Rapid test date cannot be before enrollment rapid '
-                        'test date.'}
-                    self._errors.update(message)
-                    raise ValidationError(message)
+
+    def validate_enrolment_rapid_test_date(self):
+        rapid_test_date = self.subject_context.anchor('rapid_test_date')
+        if rapid_test_date is None:
+            rapid_test_date = self.subject_context.antenatal_enrollment.rapid_test_date
+        if rapid_test_date:
+            if (self.cleaned_data.get('result_date') and
+                    self.cleaned_data.get('result_date') < rapid_test_date):
+                message = {
+                    'result_date':
+                    'Rapid test date cannot be before enrollment rapid '
+                    'test date.'}
+                self._errors.update(message)
+                raise ValidationError(message)
@@ -0,0 +1,117 @@
+import hashlib
+import json
+from collections.abc import Mapping
+from datetime import date, datetime, time
+from decimal import Decimal
+from uuid import UUID
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Model, QuerySet
+
+from .batch import row_subject_identifier, validation_errors
+from .dependency_manifest import dependency_manifest
+from .subject_facts import subject_facts_cache
+
+VALID = 'valid'
+INVALID = 'invalid'
+
+
+def normalized(value):
+    """Returns `value` as JSON serializable data that is equal for
+    equal submissions, e.g. a model instance as its label and pk.
+    """
+    if isinstance(value, Model):
+        return [value._meta.label_lower, str(value.pk)]
+    if isinstance(value, Mapping):
+        return {str(key): normalized(item) for key, item in value.items()}
+    if isinstance(value, (QuerySet, set, frozenset)):
+        return sorted((normalized(item) for item in value), key=repr)
+    if isinstance(value, (list, tuple)):
+        return [normalized(item) for item in value]
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return repr(value)
+
+
+class ResultCacheMixin:
+    """Optionally returns the cached outcome of `validate` for a
+    resubmitted, unchanged form without running `clean`.
+
+    Results are keyed by the validator class and the model labels of its
+    dependency manifest, the instance pk, the error mode, the normalized
+    cleaned_data and the subject facts version of the subject, so a
+    result is dropped when any record the validators depend on changes
+    for the subject.
+
+    Enable per class or instance with `cache_results = True`, or for all
+    validators with settings.TD_MATERNAL_VALIDATORS_RESULT_CACHE. Requires
+    the subject facts cache. Results expire after
+    settings.TD_MATERNAL_VALIDATORS_RESULT_CACHE_TTL seconds (default 600)
+    as some rules compare against the current date.
+    """
+
+    cache_results = None
+
+    subject_facts_cache = subject_facts_cache
+
+    @property
+    def caches_results(self):
+        cache_results = self.cache_results
+        if cache_results is None:
+            cache_results = getattr(
+                settings, 'TD_MATERNAL_VALIDATORS_RESULT_CACHE', False)
+        return bool(cache_results) and self.subject_facts_cache.enabled
+
+    @property
+    def result_cache_timeout(self):
+        return getattr(settings, 'TD_MATERNAL_VALIDATORS_RESULT_CACHE_TTL', 600)
+
+    def result_model_labels(self):
+        return {
+            entry.model: entry.label
+            for entry in dependency_manifest(self.__class__)}
+
+    def result_key(self, subject_identifier):
+        """Returns the cache key of the result for the subject.
+        """
+        cls = self.__class__
+        submission = json.dumps([
+            f'{cls.__module__}.{cls.__qualname__}',
+            normalized(self.result_model_labels()),
+            normalized(getattr(self.instance, 'pk', None)),
+            getattr(self, 'collects_all_errors', False),
+            normalized(self.cleaned_data)], sort_keys=True)
+        digest = hashlib.sha256(submission.encode()).hexdigest()
+        facts_cache = self.subject_facts_cache
+        version = facts_cache.version(subject_identifier)
+        return (f'{facts_cache.key_prefix}:result:{subject_identifier}:'
+                f'{version}:{digest}')
+
+    def validate(self):
+        if not self.caches_results:
+            return super().validate()
+        subject_identifier = row_subject_identifier(self.cleaned_data)
+        if subject_identifier is None:
+            return super().validate()
+        cache = self.subject_facts_cache.cache
+        key = self.result_key(subject_identifier)
+        result = cache.get(key)
+        if result is not None:
+            outcome, errors = result
+            if outcome == VALID:
+                return self.cleaned_data
+            self._errors.update(errors)
+            raise ValidationError(errors)
+        try:
+            cleaned_data = super().validate()
+        except ValidationError as e:
+            cache.set(key, (INVALID, validation_errors(e)),
+                      timeout=self.result_cache_timeout)
+            raise
+        cache.set(key, (VALID, None), timeout=self.result_cache_timeout)
+        return cleaned_data
@@ -0,0 +1,226 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from edc_constants.constants import NOT_APPLICABLE, OTHER
+
+# types of the values a compiled check compares directly; any other
+# value, e.g. a list model instance read by its name, is left to the
+# rule helper
+CHECKED_TYPES = frozenset(
+    [str, int, float, bool, type(None), date, datetime, Decimal])
+
+
+class Rule:
+    """A FormValidator rule helper call stated as class data, e.g.
+
+        RequiredIf(YES, field='coughing', field_required='coughing_rel')
+
+    stands for `self.required_if(YES, field='coughing', ...)`.
+
+    Rules with a `check` are compiled to direct reads and comparisons of
+    the cleaned_data fields that pass a submission the helper would
+    accept. The helper only runs when the check does not pass, so its
+    messages and error codes are raised as before.
+    """
+
+    helper = None
+
+    # the keyword arguments a check handles; a rule given any other is
+    # always run by its helper
+    check_kwargs = frozenset()
+
+    field_kwargs = (
+        'field', 'field_required', 'field_applicable', 'm2m_field',
+        'field_other', 'other_specify_field')
+
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+    def __repr__(self):
+        arguments = [repr(arg) for arg in self.args] + [
+            f'{key}={value!r}' for key, value in self.kwargs.items()]
+        return f'{self.__class__.__name__}({", ".join(arguments)})'
+
+    @property
+    def fields(self):
+        """Returns the cleaned_data fields the rule reads.
+        """
+        return tuple(
+            self.kwargs[key] for key in self.field_kwargs if key in self.kwargs)
+
+    @property
+    def checked(self):
+        return bool(self.check_kwargs) and set(self.kwargs) <= self.check_kwargs
+
+    def check(self):
+        """Returns a function of cleaned_data that returns True if the
+        helper would accept it, or None to always run the helper.
+        """
+        return None
+
+    def compile(self, validator_cls):
+        """Returns the (check, function, args, kwargs) the rule runs as.
+        """
+        function = getattr(validator_cls, self.helper, None)
+        if function is None:
+            raise TypeError(
+                f'{validator_cls.__name__} has no rule helper {self.helper}. '
+                f'Got {self!r}.')
+        return self.check(), function, self.args, self.kwargs
+
+
+class RequiredIf(Rule):
+    helper = 'required_if'
+
+    check_kwargs = frozenset(
+        ['field', 'field_required', 'required_msg', 'not_required_msg', 'inverse'])
+
+    def check(self):
+        responses = self.args
+        field = self.kwargs.get('field')
+        field_required = self.kwargs.get('field_required')
+        if not (self.checked and responses and field and field_required):
+            return None
+        inverse = self.kwargs.get('inverse')
+        inverse = True if inverse is None else bool(inverse)
+
+        def check(cleaned_data):
+            if field not in cleaned_data:
+                return True
+            value = cleaned_data[field]
+            required = cleaned_data.get(field_required)
+            if (type(value) not in CHECKED_TYPES
+                    or type(required) not in CHECKED_TYPES):
+                return False
+            has_value = bool(required) and required != NOT_APPLICABLE
+            if value in responses:
+                return has_value
+            return not (inverse and has_value)
+        return check
+
+
+class NotRequiredIf(Rule):
+    helper = 'not_required_if'
+
+
+class ApplicableIf(Rule):
+    helper = 'applicable_if'
+
+    check_kwargs = frozenset(['field', 'field_applicable', 'inverse', 'msg'])
+
+    def check(self):
+        responses = self.args
+        field = self.kwargs.get('field')
+        field_applicable = self.kwargs.get('field_applicable')
+        if not (self.checked and field and field_applicable):
+            return None
+        inverse = self.kwargs.get('inverse')
+        inverse = True if inverse is None else bool(inverse)
+
+        def check(cleaned_data):
+            if field not in cleaned_data or field_applicable not in cleaned_data:
+                return True
+            value = cleaned_data[field]
+            applicable = cleaned_data[field_applicable]
+            if (type(value) not in CHECKED_TYPES
+                    or type(applicable) not in CHECKED_TYPES):
+                return False
+            if value in responses:
+                return applicable is not None and applicable != NOT_APPLICABLE
+            return applicable == NOT_APPLICABLE or not inverse
+        return check
+
+
+class OtherSpecify(Rule):
+    helper = 'validate_other_specify'
+
+    check_kwargs = frozenset(
+        ['field', 'other_specify_field', 'required_msg', 'not_required_msg'])
+
+    @property
+    def fields(self):
+        fields = super().fields
+        if 'other_specify_field' not in self.kwargs:
+            fields += (f'{self.kwargs["field"]}_other', )
+        return fields
+
+    def check(self):
+        if not (self.checked and self.kwargs.get('field')):
+            return None
+        field, other_specify_field = self.fields
+
+        def check(cleaned_data):
+            value = cleaned_data.get(field)
+            other = cleaned_data.get(other_specify_field)
+            if (type(value) not in CHECKED_TYPES
+                    or type(other) not in CHECKED_TYPES):
+                return False
+            return bool(other) if value == OTHER else not other
+        return check
+
+
+class M2MSingleSelectionIf(Rule):
+    helper = 'm2m_single_selection_if'
+
+
+class M2MOtherSpecify(Rule):
+    helper = 'm2m_other_specify'
+
+
+class Step(Rule):
+    """A method of the validator run in table order, e.g.
+
+        Step('validate_covid_test_date', 'covid_test_date',
+             fields=('covid_test_date', ))
+
+    The method is looked up on the instance when run.
+    """
+
+    def __init__(self, method_name, *args, fields=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = method_name
+        self.step_fields = tuple(fields)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.helper!r})'
+
+    @property
+    def fields(self):
+        return self.step_fields
+
+    def compile(self, validator_cls):
+        method_name = self.helper
+        if not hasattr(validator_cls, method_name):
+            raise TypeError(
+                f'{validator_cls.__name__} has no method {method_name}.')
+
+        def function(validator, *args, **kwargs):
+            return getattr(validator, method_name)(*args, **kwargs)
+        return None, function, self.args, self.kwargs
+
+
+class RuleTableMixin:
+    """Runs the `rules` of a validator class, compiled once when the
+    class is created into a flat list of checks and helper calls.
+    """
+
+    rules = ()
+
+    _compiled_rules = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._compiled_rules = tuple(rule.compile(cls) for rule in cls.rules)
+
+    @classmethod
+    def rule_fields(cls):
+        """Returns the fields read by each rule as a list of
+        (rule, fields).
+        """
+        return [(rule, rule.fields) for rule in cls.rules]
+
+    def apply_rules(self):
+        for check, function, args, kwargs in self._compiled_rules:
+            if check is None or not check(self.cleaned_data):
+                function(self, *args, **kwargs)
@@ -1,11 +1,12 @@
 import re
 from django import forms
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError, MultipleObjectsReturned
 from edc_base.utils import relativedelta
 from edc_form_validators import FormValidator
 
 from .crf_form_validator import TDCRFFormValidator
+from .dependency_manifest import Dependency
+from .model_resolver import resolve_model
 
 
 class SubjectConsentFormValidator(TDCRFFormValidator, FormValidator):
@@ -16,17 +17,32 @@ class SubjectConsentFormValidator(TDCRFFormValidator, FormValidator):
 
     subject_consent_model = 'td_maternal.subjectconsent'
 
+    dependencies = (
+        Dependency('screening_model', 'screening_identifier'),
+        Dependency('td_consent_version_model', 'screening_identifier'),
+        Dependency('subject_consent_model', 'subject_identifier'),
+        Dependency('subject_consent_model', 'screening_identifier'))
+
     @property
     def subject_screening_cls(self):
-        return django_apps.get_model(self.screening_model)
+        return resolve_model(self, self.screening_model)
 
     @property
     def td_consent_version_cls(self):
-        return django_apps.get_model(self.td_consent_version_model)
+        return resolve_model(self, self.td_consent_version_model)
 
     @property
     def subject_consent_cls(self):
-        return django_apps.get_model(self.subject_consent_model)
+        return resolve_model(self, self.subject_consent_model)
+
+    @property
+    def subject_context_models(self):
+        model_labels = super().subject_context_models
+        model_labels.update(
+            consent_version_model=self.td_consent_version_model,
+            maternal_consent_model=self.subject_consent_model,
+            subject_screening_model=self.screening_model)
+        return model_labels
 
     def clean(self):
         cleaned_data = self.cleaned_data
@@ -59,13 +75,8 @@ class SubjectConsentFormValidator(TDCRFFormValidator, FormValidator):
         self.validate_reconsent()
 
     def validate_reconsent(self):
-        try:
-            consent_obj = self.subject_consent_cls.objects.get(
-                subject_identifier=self.cleaned_data.get('subject_identifier'),
-                version='1')
-        except self.subject_consent_cls.DoesNotExist:
-            pass
-        else:
+        consent_obj = self.subject_context.latest_consent(version='1')
+        if consent_obj:
             consent_dict = consent_obj.__dict__
             consent_fields = [
                 'first_name', 'last_name', 'dob', 'recruit_source',
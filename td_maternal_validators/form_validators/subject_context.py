@@ -0,0 +1,465 @@
+import threading
+from contextlib import contextmanager
+
+from edc_action_item.site_action_items import site_action_items
+from edc_constants.constants import NEW
+from td_prn.action_items import MATERNALOFF_STUDY_ACTION
+
+from .dependency_manifest import Dependency, dependency_manifest
+from .model_resolver import resolve_model
+from .subject_facts import subject_facts_cache
+
+_shared = threading.local()
+
+
+@contextmanager
+def subject_context_scope():
+    """Shares subject contexts between all validators run inside the
+    block, e.g. the CRFs saved for one visit.
+    """
+    previous = getattr(_shared, 'contexts', None)
+    _shared.contexts = {} if previous is None else previous
+    try:
+        yield _shared.contexts
+    finally:
+        _shared.contexts = previous
+
+
+def context_key(subject_identifier, model_labels):
+    return (subject_identifier, tuple(sorted(model_labels.items())))
+
+
+class SubjectContext:
+    """Holds the subject facts the validators look up by
+    subject_identifier, each queried at most once.
+
+    The derived `facts` and `timeline` are also shared between
+    processes if the subject facts cache is enabled.
+    """
+
+    subject_facts_cache = subject_facts_cache
+
+    antenatal_enrollment_model = 'td_maternal.antenatalenrollment'
+    consent_version_model = 'td_maternal.tdconsentversion'
+    infant_birth_model = 'td_infant.infantbirth'
+    karabo_subject_screening_model = 'td_maternal.karabosubjectscreening'
+    maternal_consent_model = 'td_maternal.subjectconsent'
+    maternal_labour_del_model = 'td_maternal.maternallabourdel'
+    maternal_offstudy_model = 'td_prn.maternaloffstudy'
+    medical_history_model = 'td_maternal.maternalmedicalhistory'
+    subject_screening_model = 'td_maternal.subjectscreening'
+
+    model_attrs = (
+        'antenatal_enrollment_model',
+        'consent_version_model',
+        'infant_birth_model',
+        'karabo_subject_screening_model',
+        'maternal_consent_model',
+        'maternal_labour_del_model',
+        'maternal_offstudy_model',
+        'medical_history_model',
+        'subject_screening_model')
+
+    dependencies = (
+        Dependency('subject_screening_model', 'subject_identifier'),
+        Dependency('consent_version_model', 'screening_identifier'),
+        Dependency('maternal_consent_model', 'subject_identifier'),
+        Dependency('edc_action_item.actionitem', 'subject_identifier'),
+        Dependency('maternal_offstudy_model', 'subject_identifier'),
+        Dependency('antenatal_enrollment_model', 'subject_identifier'),
+        Dependency('maternal_labour_del_model', 'subject_identifier'),
+        Dependency('karabo_subject_screening_model', 'subject_identifier'),
+        Dependency('medical_history_model', 'maternal_visit__subject_identifier'),
+        Dependency('infant_birth_model', 'subject_identifier'))
+
+    # the facts `prefetch` fetches, by the Dependency model they are read from
+    prefetched_facts = {
+        'subject_screening': 'subject_screening_model',
+        'consent_version': 'consent_version_model',
+        'consents': 'maternal_consent_model',
+        'offstudy_action_item': 'edc_action_item.actionitem',
+        'maternal_offstudy': 'maternal_offstudy_model',
+        'antenatal_enrollment': 'antenatal_enrollment_model',
+        'maternal_labour_del': 'maternal_labour_del_model',
+        'karabo_screening': 'karabo_subject_screening_model'}
+
+    # prefetched facts fetched by subject_identifier, by name, as the
+    # property of their model class and any further filter
+    by_subject_facts = {
+        'offstudy_action_item': (
+            'action_item_model_cls',
+            {'action_type__name': MATERNALOFF_STUDY_ACTION, 'status': NEW}),
+        'maternal_offstudy': ('maternal_offstudy_cls', {}),
+        'antenatal_enrollment': ('antenatal_enrollment_cls', {}),
+        'maternal_labour_del': ('maternal_labour_del_cls', {}),
+        'karabo_screening': ('karabo_screening_cls', {})}
+
+    infant_suffix = '-10'
+
+    def __init__(self, subject_identifier=None, **model_labels):
+        self.subject_identifier = subject_identifier
+        for attr, label in model_labels.items():
+            if attr not in self.model_attrs:
+                raise TypeError(
+                    f'Invalid model label for subject context. Got {attr}.')
+            setattr(self, attr, label)
+        self._facts = {}
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.subject_identifier!r})'
+
+    @property
+    def model_labels(self):
+        return {attr: getattr(self, attr) for attr in self.model_attrs}
+
+    def load(self):
+        """Loads all facts for the subject at once.
+        """
+        self.subject_screening
+        self.consent_version
+        self.consents
+        self.offstudy_action_item
+        self.maternal_offstudy
+        self.antenatal_enrollment
+        self.maternal_labour_del
+        return self
+
+    def invalidate(self, *names):
+        """Drops the named facts, or all facts if none are named, so
+        they are queried again on next access.
+        """
+        if not names:
+            self._facts.clear()
+        for name in names:
+            self._facts.pop(name, None)
+        # derived from the others
+        self._facts.pop('facts', None)
+        self._facts.pop('timeline', None)
+
+    def prime(self, **facts):
+        """Sets facts already fetched elsewhere, e.g. by `prefetch`.
+        """
+        self._facts.update(facts)
+        return self
+
+    @classmethod
+    def prefetch(cls, subject_identifiers, chunk_size=500, facts=None,
+                 **model_labels):
+        """Returns a dictionary of loaded contexts by subject_identifier,
+        fetching each fact for all subjects in one query per chunk.
+
+        Only the `facts` named, if any, are fetched; the others are
+        queried on access as usual.
+        """
+        subject_identifiers = list(dict.fromkeys(subject_identifiers))
+        contexts = {}
+        for index in range(0, len(subject_identifiers), chunk_size):
+            chunk = subject_identifiers[index:index + chunk_size]
+            contexts.update(
+                cls._prefetch_chunk(chunk, facts=facts, **model_labels))
+        return contexts
+
+    @classmethod
+    def _prefetch_chunk(cls, subject_identifiers, facts=None, **model_labels):
+        contexts = {
+            subject_identifier: cls(subject_identifier, **model_labels)
+            for subject_identifier in subject_identifiers}
+        template = cls(**model_labels)
+        wanted = set(cls.prefetched_facts if facts is None else facts)
+        primed = {subject_identifier: {} for subject_identifier in contexts}
+
+        if wanted & {'subject_screening', 'consent_version'}:
+            cls._prefetch_screenings(
+                template, subject_identifiers, primed,
+                consent_version='consent_version' in wanted)
+        if 'consents' in wanted:
+            cls._prefetch_consents(template, subject_identifiers, primed)
+        for name in cls.by_subject_facts:
+            if name in wanted:
+                cls._prefetch_by_subject(template, subject_identifiers, primed, name)
+
+        for subject_identifier, context in contexts.items():
+            context.prime(**primed[subject_identifier])
+        return contexts
+
+    @classmethod
+    def _prefetch_screenings(cls, template, subject_identifiers, primed,
+                             consent_version=False):
+        screenings = {
+            obj.subject_identifier: obj
+            for obj in template.subject_screening_cls.objects.filter(
+                subject_identifier__in=subject_identifiers)}
+        for subject_identifier, values in primed.items():
+            values['subject_screening'] = screenings.get(subject_identifier)
+        if consent_version:
+            consent_versions = {
+                obj.screening_identifier: obj
+                for obj in template.consent_version_cls.objects.filter(
+                    screening_identifier__in=[
+                        obj.screening_identifier for obj in screenings.values()])}
+            for values in primed.values():
+                values['consent_version'] = consent_versions.get(getattr(
+                    values['subject_screening'], 'screening_identifier', None))
+
+    @classmethod
+    def _prefetch_consents(cls, template, subject_identifiers, primed):
+        consents = {}
+        for obj in template.maternal_consent_cls.objects.filter(
+                subject_identifier__in=subject_identifiers).order_by(
+                    'consent_datetime'):
+            consents.setdefault(obj.subject_identifier, []).append(obj)
+        for subject_identifier, values in primed.items():
+            values['consents'] = consents.get(subject_identifier, [])
+
+    @classmethod
+    def _prefetch_by_subject(cls, template, subject_identifiers, primed, name):
+        attr, options = cls.by_subject_facts[name]
+        objs = {
+            obj.subject_identifier: obj
+            for obj in getattr(template, attr).objects.filter(
+                subject_identifier__in=subject_identifiers, **options)}
+        for subject_identifier, values in primed.items():
+            values[name] = objs.get(subject_identifier)
+
+    def _fact(self, name, loader):
+        try:
+            return self._facts[name]
+        except KeyError:
+            value = self._facts[name] = loader()
+            return value
+
+    @property
+    def facts(self):
+        """Returns the SubjectFacts from the subject facts cache or
+        None if the cache is disabled.
+        """
+        return self._fact('facts', lambda: self.subject_facts_cache.get(self))
+
+    @property
+    def timeline(self):
+        """Returns the SubjectTimeline of anchor dates from the subject
+        facts cache or None if the cache is disabled.
+        """
+        return self._fact(
+            'timeline', lambda: self.subject_facts_cache.get_timeline(self))
+
+    def anchor(self, name):
+        """Returns the named anchor date of the timeline or None if
+        not known, e.g. the cache is disabled or the record is missing.
+        """
+        return getattr(self.timeline, name, None)
+
+    @property
+    def antenatal_enrollment_cls(self):
+        return resolve_model(self, self.antenatal_enrollment_model)
+
+    @property
+    def consent_version_cls(self):
+        return resolve_model(self, self.consent_version_model)
+
+    @property
+    def maternal_consent_cls(self):
+        return resolve_model(self, self.maternal_consent_model)
+
+    @property
+    def infant_birth_cls(self):
+        return resolve_model(self, self.infant_birth_model)
+
+    @property
+    def karabo_screening_cls(self):
+        return resolve_model(self, self.karabo_subject_screening_model)
+
+    @property
+    def medical_history_cls(self):
+        return resolve_model(self, self.medical_history_model)
+
+    @property
+    def maternal_labour_del_cls(self):
+        return resolve_model(self, self.maternal_labour_del_model)
+
+    @property
+    def maternal_offstudy_cls(self):
+        return resolve_model(self, self.maternal_offstudy_model)
+
+    @property
+    def subject_screening_cls(self):
+        return resolve_model(self, self.subject_screening_model)
+
+    @property
+    def action_item_model_cls(self):
+        action_cls = site_action_items.get(
+            self.maternal_offstudy_cls.action_name)
+        return action_cls.action_item_model_cls()
+
+    @property
+    def subject_screening(self):
+        def loader():
+            try:
+                return self.subject_screening_cls.objects.get(
+                    subject_identifier=self.subject_identifier)
+            except self.subject_screening_cls.DoesNotExist:
+                return None
+        return self._fact('subject_screening', loader)
+
+    @property
+    def consent_version(self):
+        def loader():
+            if not self.subject_screening:
+                return None
+            try:
+                return self.consent_version_cls.objects.get(
+                    screening_identifier=self.subject_screening.screening_identifier)
+            except self.consent_version_cls.DoesNotExist:
+                return None
+        return self._fact('consent_version', loader)
+
+    @property
+    def consents(self):
+        """Returns all maternal consents for the subject ordered
+        by consent datetime.
+        """
+        def loader():
+            return list(self.maternal_consent_cls.objects.filter(
+                subject_identifier=self.subject_identifier).order_by(
+                    'consent_datetime'))
+        return self._fact('consents', loader)
+
+    @property
+    def first_consent(self):
+        return self.consents[0] if self.consents else None
+
+    def latest_consent(self, version=None):
+        """Returns the most recent maternal consent, optionally
+        for the given consent version only.
+        """
+        for consent in reversed(self.consents):
+            if version is None or consent.version == version:
+                return consent
+        return None
+
+    @property
+    def offstudy_action_item(self):
+        """Returns the open maternal off study action item or None.
+        """
+        def loader():
+            action_item_model_cls = self.action_item_model_cls
+            try:
+                return action_item_model_cls.objects.get(
+                    subject_identifier=self.subject_identifier,
+                    action_type__name=MATERNALOFF_STUDY_ACTION,
+                    status=NEW)
+            except action_item_model_cls.DoesNotExist:
+                return None
+        return self._fact('offstudy_action_item', loader)
+
+    @property
+    def maternal_offstudy(self):
+        def loader():
+            try:
+                return self.maternal_offstudy_cls.objects.get(
+                    subject_identifier=self.subject_identifier)
+            except self.maternal_offstudy_cls.DoesNotExist:
+                return None
+        return self._fact('maternal_offstudy', loader)
+
+    @property
+    def antenatal_enrollment(self):
+        def loader():
+            try:
+                return self.antenatal_enrollment_cls.objects.get(
+                    subject_identifier=self.subject_identifier)
+            except self.antenatal_enrollment_cls.DoesNotExist:
+                return None
+        return self._fact('antenatal_enrollment', loader)
+
+    @property
+    def maternal_labour_del(self):
+        def loader():
+            try:
+                return self.maternal_labour_del_cls.objects.get(
+                    subject_identifier=self.subject_identifier)
+            except self.maternal_labour_del_cls.DoesNotExist:
+                return None
+        return self._fact('maternal_labour_del', loader)
+
+    @property
+    def karabo_screening(self):
+        def loader():
+            try:
+                return self.karabo_screening_cls.objects.get(
+                    subject_identifier=self.subject_identifier)
+            except self.karabo_screening_cls.DoesNotExist:
+                return None
+        return self._fact('karabo_screening', loader)
+
+    @property
+    def medical_history(self):
+        def loader():
+            return self.medical_history_cls.objects.filter(
+                maternal_visit__subject_identifier=self.subject_identifier).first()
+        return self._fact('medical_history', loader)
+
+    @property
+    def infant_birth(self):
+        """Returns the birth of the infant of the subject, identified
+        by the subject_identifier and `infant_suffix`, or None.
+        """
+        def loader():
+            try:
+                return self.infant_birth_cls.objects.get(
+                    subject_identifier=f'{self.subject_identifier}{self.infant_suffix}')
+            except self.infant_birth_cls.DoesNotExist:
+                return None
+        return self._fact('infant_birth', loader)
+
+
+class SubjectContextMixin:
+    """Gives a validator the subject context for its subject_identifier.
+
+    Contexts live on the validator instance unless the validator runs
+    inside `subject_context_scope`, in which case they are shared.
+    """
+
+    subject_context_cls = SubjectContext
+
+    @property
+    def subject_context_models(self):
+        return {
+            attr: getattr(self, attr, getattr(self.subject_context_cls, attr))
+            for attr in self.subject_context_cls.model_attrs}
+
+    def get_subject_context(self, subject_identifier=None):
+        if subject_identifier is None:
+            subject_identifier = self.subject_identifier
+        model_labels = self.subject_context_models
+        key = context_key(subject_identifier, model_labels)
+        contexts = getattr(_shared, 'contexts', None)
+        if contexts is None:
+            try:
+                contexts = self._subject_contexts
+            except AttributeError:
+                contexts = self._subject_contexts = {}
+        try:
+            return contexts[key]
+        except KeyError:
+            context = contexts[key] = self.subject_context_cls(
+                subject_identifier, **model_labels)
+            return context
+
+    @property
+    def subject_context(self):
+        return self.get_subject_context()
+
+    def subject_context_facts(self):
+        """Returns the names of the prefetched facts of the subject context
+        whose models are in the dependency manifest of the validator, or
+        None for all facts if the subject facts cache, which reads them
+        all, is enabled.
+        """
+        if self.subject_context_cls.subject_facts_cache.enabled:
+            return None
+        model_labels = self.subject_context_models
+        labels = {entry.label for entry in dependency_manifest(self.__class__)}
+        return tuple(
+            name for name, model in self.subject_context_cls.prefetched_facts.items()
+            if model_labels.get(model, model).lower() in labels)
@@ -0,0 +1,180 @@
+import hashlib
+import time
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+SubjectFacts = namedtuple('SubjectFacts', [
+    'consent_version',
+    'consent_datetime',
+    'screening_identifier',
+    'offstudy',
+    'enrollment_hiv_status',
+    'delivery_datetime'])
+
+# the anchor dates submitted dates are compared with
+SubjectTimeline = namedtuple('SubjectTimeline', [
+    'consent_datetime',
+    'dob',
+    'karabo_screening_datetime',
+    'date_hiv_diagnosis',
+    'week32_test_date',
+    'rapid_test_date',
+    'delivery_datetime',
+    'infant_birth_datetime'])
+
+
+def current_consent(context):
+    """Returns the latest consent of the current consent version of a
+    subject context or None.
+    """
+    consent_version = getattr(context.consent_version, 'version', None)
+    if not consent_version:
+        return None
+    return context.latest_consent(version=consent_version)
+
+
+def derive_facts(context):
+    """Returns the SubjectFacts of a subject context.
+    """
+    consent = current_consent(context)
+    return SubjectFacts(
+        consent_version=getattr(context.consent_version, 'version', None),
+        consent_datetime=getattr(consent, 'consent_datetime', None),
+        screening_identifier=getattr(
+            context.subject_screening, 'screening_identifier', None),
+        offstudy=context.maternal_offstudy is not None,
+        enrollment_hiv_status=getattr(
+            context.antenatal_enrollment, 'enrollment_hiv_status', None),
+        delivery_datetime=getattr(
+            context.maternal_labour_del, 'delivery_datetime', None))
+
+
+def derive_timeline(context):
+    """Returns the SubjectTimeline of a subject context.
+    """
+    consent = current_consent(context)
+    try:
+        infant_birth = context.infant_birth
+    except LookupError:
+        # td_infant is not installed
+        infant_birth = None
+    return SubjectTimeline(
+        consent_datetime=getattr(consent, 'consent_datetime', None),
+        dob=getattr(consent, 'dob', None),
+        karabo_screening_datetime=getattr(
+            context.karabo_screening, 'report_datetime', None),
+        date_hiv_diagnosis=getattr(
+            context.medical_history, 'date_hiv_diagnosis', None),
+        week32_test_date=getattr(
+            context.antenatal_enrollment, 'week32_test_date', None),
+        rapid_test_date=getattr(
+            context.antenatal_enrollment, 'rapid_test_date', None),
+        delivery_datetime=getattr(
+            context.maternal_labour_del, 'delivery_datetime', None),
+        infant_birth_datetime=getattr(infant_birth, 'report_datetime', None))
+
+
+class SubjectFactsCache:
+    """Stores the derived facts of a subject in a Django cache shared by
+    all worker processes.
+
+    Disabled unless a cache alias is given, or set in
+    settings.TD_MATERNAL_VALIDATORS_FACTS_CACHE, e.g. 'default'. Entries
+    expire after settings.TD_MATERNAL_VALIDATORS_FACTS_CACHE_TTL seconds
+    (default 3600).
+
+    Keys include a per-subject version; `invalidate` moves the subject
+    to a new version so all of its entries, i.e. its facts, timeline
+    and cached validation results, are dropped at once.
+    """
+
+    key_prefix = 'td_maternal_validators'
+
+    def __init__(self, alias=None, timeout=None):
+        self._alias = alias
+        self._timeout = timeout
+
+    @property
+    def alias(self):
+        if self._alias is not None:
+            return self._alias
+        return getattr(settings, 'TD_MATERNAL_VALIDATORS_FACTS_CACHE', None)
+
+    @property
+    def timeout(self):
+        if self._timeout is not None:
+            return self._timeout
+        return getattr(settings, 'TD_MATERNAL_VALIDATORS_FACTS_CACHE_TTL', 3600)
+
+    @property
+    def enabled(self):
+        return bool(self.alias)
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def version_key(self, subject_identifier):
+        return f'{self.key_prefix}:version:{subject_identifier}'
+
+    def version(self, subject_identifier):
+        """Returns the current version of the subject's entries.
+        """
+        key = self.version_key(subject_identifier)
+        version = self.cache.get(key)
+        if version is None:
+            # a new version never repeats one evicted from the cache
+            self.cache.add(key, self.new_version(), timeout=None)
+            version = self.cache.get(key)
+        return version
+
+    @staticmethod
+    def new_version():
+        return int(time.time() * 1000000)
+
+    def invalidate(self, subject_identifier):
+        """Moves the subject to a new version.
+        """
+        if not self.enabled:
+            return
+        key = self.version_key(subject_identifier)
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            self.cache.set(key, self.new_version(), timeout=None)
+
+    def key(self, subject_identifier, model_labels, entry_cls=SubjectFacts):
+        labels = repr((entry_cls._fields, sorted(model_labels.items())))
+        digest = hashlib.md5(labels.encode()).hexdigest()
+        version = self.version(subject_identifier)
+        kind = entry_cls.__name__.lower()
+        return f'{self.key_prefix}:{kind}:{subject_identifier}:{version}:{digest}'
+
+    def get(self, context):
+        """Returns the SubjectFacts of a subject context, derived from
+        its facts on a cache miss, or None if the cache is disabled.
+        """
+        return self.get_entry(context, SubjectFacts, derive_facts)
+
+    def get_timeline(self, context):
+        """Returns the SubjectTimeline of a subject context, derived
+        from its facts on a cache miss, or None if the cache is disabled.
+        """
+        return self.get_entry(context, SubjectTimeline, derive_timeline)
+
+    def get_entry(self, context, entry_cls, derive):
+        if not self.enabled or context.subject_identifier is None:
+            return None
+        key = self.key(
+            context.subject_identifier, context.model_labels, entry_cls=entry_cls)
+        values = self.cache.get(key)
+        if values is None:
+            entry = derive(context)
+            self.cache.set(key, tuple(entry), timeout=self.timeout)
+            return entry
+        return entry_cls._make(values)
+
+
+subject_facts_cache = SubjectFactsCache()
@@ -3,12 +3,16 @@ from django.core.exceptions import ValidationError
 from edc_form_validators import FormValidator
 
 from .crf_form_validator import TDCRFFormValidator
+from .dependency_manifest import Dependency
 from .form_validator_mixin import TDFormValidatorMixin
 
 
 class TDConsentVersionFormValidator(TDCRFFormValidator,
                                     TDFormValidatorMixin, FormValidator):
 
+    dependencies = (
+        Dependency('subject_screening_model', 'screening_identifier'), )
+
     def clean(self):
         self.subject_identifier = self.cleaned_data.get('subject_identifier')
         if self.instance and not self.instance.id:
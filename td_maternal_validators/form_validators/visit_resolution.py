@@ -0,0 +1,82 @@
+from collections import namedtuple
+
+from .dependency_manifest import Dependency
+
+
+class ResolvedVisit(namedtuple(
+        'ResolvedVisit', ['maternal_visit', 'parent', 'subject_identifier'])):
+
+    __slots__ = ()
+
+    @property
+    def appointment(self):
+        """Returns the appointment of the visit, cached on the visit
+        once read.
+        """
+        return getattr(self.maternal_visit, 'appointment', None)
+
+
+def select_related_once(obj, related):
+    """Caches the objects of `related`, e.g. 'maternal_visit__appointment',
+    on `obj` with one select_related query unless the first is already
+    cached.
+    """
+    if obj is None or obj.pk is None:
+        return
+    name = related.split('__')[0]
+    if not obj._meta.get_field(name).is_cached(obj):
+        fetched = obj.__class__._default_manager.select_related(
+            related).get(pk=obj.pk)
+        setattr(obj, name, getattr(fetched, name))
+
+
+class VisitResolutionMixin:
+    """Resolves the maternal visit of a CRF, or of the parent CRF the
+    form points to instead, once per submitted value.
+
+    A parent CRF is joined to its visit and appointment with one
+    select_related query, unless the visit is already cached on it,
+    e.g. by the audit, so checks reading `resolved_visit` do not lazy
+    load them one by one.
+    """
+
+    appointment_model = 'edc_appointment.appointment'
+    maternal_visit_model = 'td_maternal.maternalvisit'
+
+    # read when resolving the visit of a parent CRF
+    dependencies = (
+        Dependency('maternal_visit_model', 'subject_identifier'),
+        Dependency('appointment_model', 'subject_identifier'))
+
+    visit_field = 'maternal_visit'
+
+    # fields of parent CRFs holding the visit, e.g. the MaternalArvPreg
+    # of a MaternalArv
+    visit_parent_fields = ('maternal_arv_preg', )
+
+    @property
+    def resolved_visit(self):
+        parent = None
+        maternal_visit = self.cleaned_data.get(self.visit_field)
+        if maternal_visit is None:
+            for field in self.visit_parent_fields:
+                parent = self.cleaned_data.get(field)
+                if parent is not None:
+                    break
+        try:
+            (snapshot_visit, snapshot_parent), resolved = self._resolved_visit
+        except AttributeError:
+            pass
+        else:
+            if snapshot_visit is maternal_visit and snapshot_parent is parent:
+                return resolved
+        snapshot = (maternal_visit, parent)
+        if parent is not None:
+            select_related_once(parent, f'{self.visit_field}__appointment')
+            maternal_visit = getattr(parent, self.visit_field)
+        resolved = ResolvedVisit(
+            maternal_visit=maternal_visit,
+            parent=parent,
+            subject_identifier=getattr(maternal_visit, 'subject_identifier', None))
+        self._resolved_visit = (snapshot, resolved)
+        return resolved
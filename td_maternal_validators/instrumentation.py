@@ -0,0 +1,148 @@
+import inspect
+import logging
+import threading
+import time
+from contextlib import ExitStack
+from functools import wraps
+
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+class ValidatorStats:
+    """In-process registry of query counts, database time and wall
+    time by validator class and method.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, validator_name, method_name, queries, db_time, wall_time):
+        with self._lock:
+            stats = self._stats.setdefault(
+                (validator_name, method_name),
+                {'calls': 0, 'queries': 0, 'db_time': 0.0, 'wall_time': 0.0,
+                 'max_queries': 0})
+            stats['calls'] += 1
+            stats['queries'] += queries
+            stats['db_time'] += db_time
+            stats['wall_time'] += wall_time
+            stats['max_queries'] = max(stats['max_queries'], queries)
+
+    def snapshot(self):
+        """Returns a copy of the stats as {validator: {method: stats}}.
+        """
+        with self._lock:
+            snapshot = {}
+            for (validator_name, method_name), stats in self._stats.items():
+                snapshot.setdefault(validator_name, {})[method_name] = dict(stats)
+            return snapshot
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+validator_stats = ValidatorStats()
+
+
+class _Frame:
+
+    def __init__(self, key):
+        self.key = key
+        self.queries = 0
+        self.db_time = 0.0
+
+
+def _frames():
+    try:
+        return _local.frames
+    except AttributeError:
+        _local.frames = []
+        return _local.frames
+
+
+def _execute_wrapper(execute, sql, params, many, context):
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - start
+        for frame in _frames():
+            frame.queries += 1
+            frame.db_time += elapsed
+
+
+def _instrumented(method):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        frames = _frames()
+        key = (id(self), method.__name__)
+        if any(frame.key == key for frame in frames):
+            # super() call of an instrumented method already being measured
+            return method(self, *args, **kwargs)
+        frame = _Frame(key)
+        frames.append(frame)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                if len(frames) == 1:
+                    for connection in connections.all():
+                        stack.enter_context(
+                            connection.execute_wrapper(_execute_wrapper))
+                return method(self, *args, **kwargs)
+        finally:
+            wall_time = time.perf_counter() - start
+            frames.remove(frame)
+            validator_name = self.__class__.__name__
+            validator_stats.record(
+                validator_name, method.__name__, frame.queries,
+                frame.db_time, wall_time)
+            if method.__name__ == 'clean':
+                logger.info(
+                    'validator=%s method=%s queries=%s db_ms=%.2f wall_ms=%.2f',
+                    validator_name, method.__name__, frame.queries,
+                    frame.db_time * 1000, wall_time * 1000)
+    wrapper._instrumented = True
+    return wrapper
+
+
+def instrumented_methods(validator_cls):
+    """Returns the names of `clean` and the `validate_*` methods
+    defined on the validator class itself.
+    """
+    return [
+        name for name, value in vars(validator_cls).items()
+        if inspect.isfunction(value)
+        and (name == 'clean' or name.startswith('validate_'))]
+
+
+def default_validator_classes():
+    from . import form_validators
+    values = [getattr(form_validators, name) for name in form_validators.__all__]
+    return [
+        value for value in values
+        if inspect.isclass(value) and hasattr(value, 'clean')]
+
+
+def instrument(*validator_classes):
+    """Wraps `clean` and the `validate_*` methods of the validator
+    classes, by default all classes in `form_validators`.
+    """
+    for validator_cls in validator_classes or default_validator_classes():
+        for name in instrumented_methods(validator_cls):
+            method = vars(validator_cls)[name]
+            if not getattr(method, '_instrumented', False):
+                setattr(validator_cls, name, _instrumented(method))
+
+
+def uninstrument(*validator_classes):
+    for validator_cls in validator_classes or default_validator_classes():
+        for name in instrumented_methods(validator_cls):
+            method = vars(validator_cls)[name]
+            if getattr(method, '_instrumented', False):
+                setattr(validator_cls, name, method.__wrapped__)
@@ -0,0 +1,79 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...audit import Checkpoint, run_audit, run_parallel_audit
+
+
+class Command(BaseCommand):
+
+    help = ('Validates the saved rows of every model with a registered form '
+            'validator and writes the failing rows as JSON lines.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'output',
+            help='Path of the JSON lines file of failing rows.')
+        parser.add_argument(
+            '--model', action='append', dest='labels',
+            help='Limit to this model label, e.g. td_maternal.maternalvisit, '
+                 'may be repeated.')
+        parser.add_argument(
+            '--chunk-size', type=int, default=500,
+            help='Number of rows fetched and validated at a time (default 500).')
+        parser.add_argument(
+            '--checkpoint',
+            help='Path of the checkpoint saved after every chunk '
+                 '(default OUTPUT.checkpoint).')
+        parser.add_argument(
+            '--resume-from',
+            help='Resume an interrupted audit from this checkpoint.')
+        parser.add_argument(
+            '--workers', type=int, default=1,
+            help=('Audit the subjects sharded across this many processes '
+                  '(default 1). Parallel audits are not checkpointed.'))
+
+    def handle(self, *args, **options):
+        output = options['output']
+        if options['workers'] > 1:
+            if options['resume_from']:
+                raise CommandError('Parallel audits cannot be resumed.')
+            try:
+                result = run_parallel_audit(
+                    output, workers=options['workers'], labels=options['labels'],
+                    chunk_size=options['chunk_size'])
+            except ValueError as e:
+                raise CommandError(e)
+            self.stdout.write(self.style.SUCCESS(
+                f'Audited {result["rows"]} rows in {result["seconds"]:.1f}s with '
+                f'{result["workers"]} workers, {result["failures"]} failures '
+                f'written to {output}.'))
+            return
+        checkpoint_path = (options['checkpoint'] or options['resume_from']
+                           or f'{output}.checkpoint')
+        if options['resume_from']:
+            if not os.path.exists(options['resume_from']):
+                raise CommandError(
+                    f'Checkpoint not found. Got {options["resume_from"]}.')
+            checkpoint = Checkpoint.load(options['resume_from'])
+            checkpoint.path = checkpoint_path
+            if checkpoint.offset and not os.path.exists(output):
+                raise CommandError(
+                    f'Cannot resume the audit, failures file not found. Got {output}.')
+            self.stdout.write(
+                f'Resuming after {checkpoint.rows} rows, '
+                f'{checkpoint.failures} failures.')
+        else:
+            checkpoint = Checkpoint(path=checkpoint_path)
+        checkpoint = run_audit(
+            output, labels=options['labels'],
+            chunk_size=options['chunk_size'], checkpoint=checkpoint,
+            progress=self.progress)
+        self.stdout.write(self.style.SUCCESS(
+            f'Audited {checkpoint.rows} rows, {checkpoint.failures} failures '
+            f'written to {output}.'))
+
+    def progress(self, label, rows, failures, seconds):
+        rate = rows / seconds if seconds else 0
+        self.stdout.write(
+            f'{label}: {rows} rows, {failures} failures, {rate:.0f} rows/s')
@@ -0,0 +1,77 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from ...benchmarks import (
+    benchmark_database, build_cohort, format_import_report,
+    format_parallel_report, format_report, format_rule_report, run_benchmarks,
+    run_import_benchmarks, run_parallel_benchmarks, run_rule_benchmarks)
+
+
+class Command(BaseCommand):
+
+    help = ('Times the form validators on valid and invalid payloads against '
+            'a generated cohort in a throwaway test database.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--subjects', type=int, default=100,
+            help='Number of enrolled mothers to generate (default 100).')
+        parser.add_argument(
+            '--visits', type=int, default=3,
+            help='Number of maternal visits per mother (default 3).')
+        parser.add_argument(
+            '--repeat', type=int, default=1,
+            help='Number of passes over the cohort per validator (default 1).')
+        parser.add_argument(
+            '--validator', action='append', dest='validators',
+            help='Limit to this validator class name, may be repeated.')
+        parser.add_argument(
+            '--json', dest='json_path',
+            help='Also write the results as JSON to this path.')
+        parser.add_argument(
+            '--imports', action='store_true',
+            help=('Time importing the --validator classes, by default '
+                  'MaternalVisitFormValidator, against importing all '
+                  'validators instead.'))
+        parser.add_argument(
+            '--rules', action='store_true',
+            help=('Time the rule tables of the --validator classes, by '
+                  'default all with one, with their compiled checks against '
+                  'calling every rule helper instead.'))
+        parser.add_argument(
+            '--audit-workers', type=int, action='append',
+            help=('Time the parallel audit of the cohort with this many '
+                  'worker processes instead, may be repeated.'))
+
+    def handle(self, *args, **options):
+        if options['imports']:
+            results = run_import_benchmarks(
+                names=options['validators'] or ('MaternalVisitFormValidator', ),
+                repeat=options['repeat'])
+            self.stdout.write(format_import_report(results))
+        elif options['audit_workers']:
+            results = run_parallel_benchmarks(
+                subjects=options['subjects'], visits=options['visits'],
+                workers=options['audit_workers'], repeat=options['repeat'])
+            self.stdout.write(format_parallel_report(results))
+        elif options['rules']:
+            with benchmark_database():
+                cohort = build_cohort(
+                    subjects=options['subjects'], visits=options['visits'])
+                results = run_rule_benchmarks(
+                    cohort, validator_names=options['validators'],
+                    repeat=options['repeat'])
+            self.stdout.write(format_rule_report(results))
+        else:
+            with benchmark_database():
+                cohort = build_cohort(
+                    subjects=options['subjects'], visits=options['visits'])
+                results = run_benchmarks(
+                    cohort, validator_names=options['validators'],
+                    repeat=options['repeat'])
+            self.stdout.write(format_report(results))
+        if options['json_path']:
+            with open(options['json_path'], 'w') as f:
+                json.dump(results, f, indent=2)
+            self.stdout.write(f'Results written to {options["json_path"]}')
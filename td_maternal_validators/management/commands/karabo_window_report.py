@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...form_validators import KaraboEligibility
+
+
+class Command(BaseCommand):
+
+    help = ('Lists the mothers whose infants enter or leave the Karabo '
+            'eligibility window on a date.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--date', dest='day',
+            help='Date as YYYY-MM-DD (default today).')
+        parser.add_argument(
+            '--months', type=int, default=KaraboEligibility.window_months,
+            help=('Infant age in months at which the window closes '
+                  f'(default {KaraboEligibility.window_months}).'))
+
+    def handle(self, *args, **options):
+        day = None
+        if options['day']:
+            try:
+                day = datetime.strptime(options['day'], '%Y-%m-%d').date()
+            except ValueError:
+                raise CommandError(
+                    f'Invalid date. Expected YYYY-MM-DD. Got {options["day"]}.')
+        report = KaraboEligibility(window_months=options['months']).report(day)
+        self.stdout.write(f'Karabo eligibility window on {report.date}')
+        for title, subject_identifiers in (('Entering', report.entering),
+                                           ('Leaving', report.leaving)):
+            self.stdout.write(f'{title}: {len(subject_identifiers)}')
+            for subject_identifier in subject_identifiers:
+                self.stdout.write(f'  {subject_identifier}')
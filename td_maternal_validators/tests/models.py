@@ -12,6 +12,17 @@ class ListModel(ListModelMixin, BaseUuidModel):
     pass
 
 
+class OtherListModel(ListModelMixin, BaseUuidModel):
+    pass
+
+
+class MaternalCrfSelection(BaseUuidModel):
+
+    who = models.ManyToManyField(ListModel)
+
+    contr = models.ManyToManyField(OtherListModel)
+
+
 class SubjectConsent(UpdatesOrCreatesRegistrationModelMixin, BaseUuidModel):
 
     subject_identifier = models.CharField(max_length=25)
@@ -20,6 +31,14 @@ class SubjectConsent(UpdatesOrCreatesRegistrationModelMixin, BaseUuidModel):
 
     gender = models.CharField(max_length=25)
 
+    first_name = models.CharField(max_length=25, null=True)
+
+    last_name = models.CharField(max_length=25, null=True)
+
+    initials = models.CharField(max_length=3, null=True)
+
+    identity = models.CharField(max_length=25, null=True)
+
     is_literate = models.CharField(max_length=25,
                                    blank=True,
                                    null=True)
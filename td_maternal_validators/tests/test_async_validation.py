@@ -0,0 +1,131 @@
+from asgiref.sync import async_to_sync
+from dateutil.relativedelta import relativedelta
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase
+from edc_base.utils import get_utcnow
+from edc_constants.constants import ALIVE, ON_STUDY
+
+from ..form_validators import MaternalVisitFormValidator
+from .models import Appointment, KaraboSubjectScreening, MaternalLabourDel
+from .models import SubjectConsent, SubjectScreening, TdConsentVersion
+
+
+class VisitSetUpMixin:
+
+    def setUp(self):
+        self.model_labels = dict(
+            maternal_consent_model='td_maternal_validators.subjectconsent',
+            consent_version_model='td_maternal_validators.tdconsentversion',
+            subject_screening_model='td_maternal_validators.subjectscreening',
+            antenatal_enrollment_model='td_maternal_validators.antenatalenrollment',
+            maternal_labour_del_model='td_maternal_validators.maternallabourdel',
+            karabo_subject_screening_model='td_maternal_validators.karabosubjectscreening',
+            karabo_subject_consent_model='td_maternal_validators.karabosubjectconsent')
+        for attr, label in self.model_labels.items():
+            setattr(MaternalVisitFormValidator, attr, label)
+
+        self.subject_identifier = '11111111'
+        SubjectScreening.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='ABC12345',
+            age_in_years=22)
+        self.subject_consent = SubjectConsent.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='ABC12345',
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow() - relativedelta(days=2), version='3')
+        TdConsentVersion.objects.create(
+            screening_identifier='ABC12345', version='3',
+            report_datetime=get_utcnow())
+        self.appointment = Appointment.objects.create(
+            subject_identifier=self.subject_identifier,
+            appt_datetime=get_utcnow(),
+            visit_code='1000M')
+
+    def cleaned_data(self, **options):
+        cleaned_data = {
+            'report_datetime': get_utcnow(),
+            'survival_status': ALIVE,
+            'last_alive_date': get_utcnow().date(),
+            'study_status': ON_STUDY,
+            'appointment': self.appointment}
+        cleaned_data.update(options)
+        return cleaned_data
+
+
+class TestAsyncValidation(VisitSetUpMixin, TestCase):
+
+    def form_validator(self, **options):
+        form_validator = MaternalVisitFormValidator(
+            cleaned_data=self.cleaned_data(**options))
+        form_validator.async_thread_sensitive = True
+        return form_validator
+
+    def test_avalidate_valid(self):
+        form_validator = self.form_validator()
+        try:
+            async_to_sync(form_validator.avalidate)()
+        except ValidationError as e:
+            self.fail(f'ValidationError unexpectedly raised. Got{e}')
+
+    def test_avalidate_invalid(self):
+        form_validator = self.form_validator(
+            last_alive_date=(get_utcnow() - relativedelta(days=5)).date())
+        self.assertRaises(
+            ValidationError, async_to_sync(form_validator.avalidate))
+        self.assertIn('last_alive_date', form_validator._errors)
+
+    def test_avalidate_missing_prerequisite(self):
+        MaternalLabourDel.objects.create(
+            subject_identifier=self.subject_identifier,
+            delivery_datetime=get_utcnow() - relativedelta(months=18))
+        form_validator = self.form_validator()
+        self.assertRaises(
+            ValidationError, async_to_sync(form_validator.avalidate))
+        self.assertIn('__all__', form_validator._errors)
+
+    def test_aprefetch_loads_lookups(self):
+        KaraboSubjectScreening.objects.create(
+            subject_identifier=self.subject_identifier,
+            is_eligible=False)
+        form_validator = self.form_validator()
+        async_to_sync(form_validator.aprefetch)()
+        self.assertEqual(form_validator.subject_identifier, self.subject_identifier)
+        with self.assertNumQueries(0):
+            form_validator.subject_context.consent_version
+            form_validator.subject_context.consents
+            form_validator.karabo_screening()
+            form_validator.karabo_consent()
+            form_validator.maternal_labour_del()
+
+
+class TestAsyncValidationConcurrent(VisitSetUpMixin, TransactionTestCase):
+
+    def test_aclean_concurrent(self):
+        form_validator = MaternalVisitFormValidator(
+            cleaned_data=self.cleaned_data())
+        form_validator.async_thread_sensitive = False
+        try:
+            async_to_sync(form_validator.aclean)()
+        except ValidationError as e:
+            self.fail(f'ValidationError unexpectedly raised. Got{e}')
+        self.assertEqual(
+            form_validator.subject_context.latest_consent(version='3'),
+            self.subject_consent)
+
+    def test_aprefetch_in_transaction(self):
+        with transaction.atomic():
+            karabo_screening = KaraboSubjectScreening.objects.create(
+                subject_identifier=self.subject_identifier,
+                is_eligible=False)
+            form_validator = MaternalVisitFormValidator(
+                cleaned_data=self.cleaned_data())
+            form_validator.async_thread_sensitive = False
+            async_to_sync(form_validator.aprefetch)()
+            with self.assertNumQueries(0):
+                self.assertEqual(
+                    form_validator.subject_context.latest_consent(version='3'),
+                    self.subject_consent)
+                self.assertEqual(
+                    form_validator.karabo_screening(), karabo_screening)
@@ -0,0 +1,171 @@
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+from io import StringIO
+from unittest import skipUnless
+
+from dateutil.relativedelta import relativedelta
+from django.conf import settings
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from edc_base.utils import get_utcnow
+from edc_constants.constants import NEG, POS
+
+from ..audit import Checkpoint, instance_cleaned_data, run_audit
+from ..audit import run_parallel_audit, shard_of, subject_lookup
+from ..form_validators import RapidTestResultFormValidator
+from .models import AntenatalEnrollment, Appointment, MaternalVisit
+from .models import MaternalLabourDel, RapidTestResult, SubjectConsent
+
+AUDITED_MODELS = {
+    'td_maternal_validators.rapidtestresult': 'RapidTestResultFormValidator'}
+
+PARALLEL_SCRIPT = '''
+import json
+
+import django
+
+django.setup()
+from td_maternal_validators.benchmarks import run_parallel_benchmarks
+print(json.dumps(run_parallel_benchmarks(
+    subjects=6, visits=1, workers=(1, 2), chunk_size=2)))
+'''
+
+
+class AuditCohortMixin:
+
+    def setUp(self):
+        RapidTestResultFormValidator.antenatal_enrollment_model = \
+            'td_maternal_validators.antenatalenrollment'
+        self.results = []
+        for index in range(5):
+            subject_identifier = f'1111111{index}'
+            SubjectConsent.objects.create(
+                subject_identifier=subject_identifier,
+                gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+                consent_datetime=get_utcnow())
+            appointment = Appointment.objects.create(
+                subject_identifier=subject_identifier,
+                appt_datetime=get_utcnow(), visit_code='1000M')
+            maternal_visit = MaternalVisit.objects.create(appointment=appointment)
+            AntenatalEnrollment.objects.create(
+                subject_identifier=subject_identifier,
+                enrollment_hiv_status=NEG,
+                rapid_test_date=get_utcnow().date())
+            # a result without a rapid test is invalid
+            self.results.append(RapidTestResult.objects.create(
+                maternal_visit=maternal_visit,
+                result=POS if index % 2 else ''))
+        self.results.sort(key=lambda obj: obj.pk)
+        self.output = os.path.join(tempfile.mkdtemp(), 'failures.jsonl')
+
+    def failures(self):
+        with open(self.output) as f:
+            return [json.loads(line) for line in f]
+
+
+class TestAudit(AuditCohortMixin, TestCase):
+
+    def test_instance_cleaned_data(self):
+        cleaned_data = instance_cleaned_data(self.results[0])
+        self.assertEqual(
+            cleaned_data['maternal_visit'], self.results[0].maternal_visit)
+        self.assertNotIn('id', cleaned_data)
+
+    def test_run_audit(self):
+        checkpoint = run_audit(self.output, models=AUDITED_MODELS, chunk_size=2)
+        self.assertEqual(checkpoint.rows, 5)
+        self.assertEqual(checkpoint.failures, 2)
+        self.assertEqual(
+            sorted(record['subject_identifier'] for record in self.failures()),
+            ['11111111', '11111113'])
+        record = self.failures()[0]
+        self.assertEqual(record['validator'], 'RapidTestResultFormValidator')
+        self.assertIn('result', record['errors'])
+        self.assertEqual(checkpoint.completed, list(AUDITED_MODELS))
+
+    def test_resume(self):
+        checkpoint_path = f'{self.output}.checkpoint'
+        run_audit(self.output, models=AUDITED_MODELS, chunk_size=2,
+                  checkpoint=Checkpoint(path=checkpoint_path))
+        expected = self.failures()
+
+        # interrupted after the first chunk, with part of the second
+        # chunk's failures written
+        first = [obj for obj in self.results[:2] if obj.result]
+        with open(self.output, 'w') as f:
+            for record in expected[:len(first)]:
+                f.write(json.dumps(record, sort_keys=True) + '\n')
+            offset = f.tell()
+            f.write('{"partial": ')
+        Checkpoint(path=checkpoint_path, model='td_maternal_validators.rapidtestresult',
+                   pk=str(self.results[1].pk), offset=offset, rows=2,
+                   failures=len(first)).save()
+
+        checkpoint = run_audit(
+            self.output, models=AUDITED_MODELS, chunk_size=2,
+            checkpoint=Checkpoint.load(checkpoint_path))
+        self.assertEqual(checkpoint.rows, 5)
+        self.assertEqual(checkpoint.failures, 2)
+        self.assertEqual(self.failures(), expected)
+
+    def test_command(self):
+        self.assertEqual(RapidTestResult.objects.filter(result=POS).count(), 2)
+        with self.settings(TD_MATERNAL_VALIDATORS_AUDIT_MODELS=AUDITED_MODELS):
+            call_command(
+                'audit_validators', self.output,
+                '--model', 'td_maternal_validators.rapidtestresult',
+                stdout=StringIO())
+        self.assertEqual(len(self.failures()), 2)
+        self.assertTrue(os.path.exists(f'{self.output}.checkpoint'))
+
+
+class TestParallelAudit(AuditCohortMixin, TestCase):
+
+    def test_shard_of(self):
+        self.assertEqual(shard_of('11111111', 4), shard_of('11111111', 4))
+        self.assertEqual(
+            {shard_of(f'1111111{index}', 3) for index in range(30)}, {0, 1, 2})
+
+    def test_subject_lookup(self):
+        self.assertEqual(
+            subject_lookup(RapidTestResult), 'maternal_visit__subject_identifier')
+        self.assertEqual(subject_lookup(MaternalLabourDel), 'subject_identifier')
+
+    def test_run_parallel_audit(self):
+        run_audit(self.output, models=AUDITED_MODELS, chunk_size=2)
+        expected = self.failures()
+        for shards in (1, 3):
+            result = run_parallel_audit(
+                self.output, workers=1, shards=shards, models=AUDITED_MODELS,
+                chunk_size=2)
+            self.assertEqual(result['rows'], 5)
+            self.assertEqual(result['failures'], 2)
+            self.assertEqual(self.failures(), expected)
+
+
+@skipUnless('fork' in multiprocessing.get_all_start_methods(),
+            'Parallel audits need the fork start method.')
+class TestParallelAuditWorkers(SimpleTestCase):
+    """Audits with a pool of forked workers in a fresh interpreter, whose
+    benchmark test database is a file the workers open too, unlike the
+    in-memory database of the test run.
+    """
+
+    def test_run_parallel_benchmarks(self):
+        env = dict(os.environ)
+        env.setdefault('DJANGO_SETTINGS_MODULE', settings.SETTINGS_MODULE)
+        output = subprocess.run(
+            [sys.executable, '-c', PARALLEL_SCRIPT],
+            env=env, stdout=subprocess.PIPE, check=True,
+            universal_newlines=True).stdout
+        results = json.loads(output.strip().splitlines()[-1])
+        self.assertEqual([result['workers'] for result in results], [1, 2])
+        self.assertGreater(results[0]['rows'], 0)
+        for result in results:
+            self.assertTrue(result['matches_audit'])
+            self.assertEqual(result['rows'], results[0]['rows'])
+            self.assertEqual(result['failures'], results[0]['failures'])
@@ -0,0 +1,35 @@
+from django.test import TestCase
+
+from ..benchmarks import build_cohort, format_report, percentile, run_benchmarks
+from ..form_validators import AntenatalVisitMembershipFormValidator
+
+
+class TestBenchmarks(TestCase):
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([3], 90), 3)
+        self.assertIsNone(percentile([], 50))
+
+    def test_run_benchmarks(self):
+        cohort = build_cohort(subjects=2, visits=1)
+        results = run_benchmarks(
+            cohort, validator_names=['AntenatalVisitMembershipFormValidator'])
+        self.assertEqual(
+            [(r['payload'], r['runs']) for r in results],
+            [('valid', 2), ('invalid', 2)])
+        self.assertEqual(results[0]['valid'], 2)
+        self.assertEqual(results[1]['invalid'], 2)
+        self.assertIn('AntenatalVisitMembershipFormValidator', format_report(results))
+
+    def test_model_labels_restored(self):
+        maternal_consent_model = \
+            AntenatalVisitMembershipFormValidator.maternal_consent_model
+        run_benchmarks(
+            build_cohort(subjects=1, visits=1),
+            validator_names=['AntenatalVisitMembershipFormValidator'])
+        self.assertEqual(
+            AntenatalVisitMembershipFormValidator.maternal_consent_model,
+            maternal_consent_model)
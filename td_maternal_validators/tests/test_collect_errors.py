@@ -0,0 +1,128 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from edc_base.utils import get_utcnow
+from edc_form_validators import FormValidator
+
+from ..form_validators import MaternalRandoFormValidator, TDCRFFormValidator
+from .models import Appointment, MaternalVisit
+
+
+class StepsFormValidator(TDCRFFormValidator, FormValidator):
+
+    def clean(self):
+        self.steps = []
+        self.validate_first()
+        self.validate_prerequisite()
+        self.validate_second()
+
+    def validate_first(self):
+        self.steps.append('first')
+        if self.cleaned_data.get('first'):
+            message = {'first': 'First is invalid.'}
+            self._errors.update(message)
+            raise ValidationError(message)
+
+    def validate_prerequisite(self):
+        self.steps.append('prerequisite')
+        if self.cleaned_data.get('prerequisite'):
+            raise ValidationError('Please complete the prerequisite form first.')
+
+    def validate_second(self):
+        self.steps.append('second')
+        if self.cleaned_data.get('second'):
+            message = {'second': 'Second is invalid.'}
+            self._errors.update(message)
+            raise ValidationError(message)
+
+
+class PrerequisiteStepsFormValidator(StepsFormValidator):
+
+    prerequisite_steps = ('validate_first', )
+
+
+class LatePrerequisiteStepsFormValidator(StepsFormValidator):
+
+    prerequisite_steps = ('validate_second', )
+
+
+class TestCollectErrors(TestCase):
+
+    def form_validator(self, collect_all_errors=None, **cleaned_data):
+        form_validator = StepsFormValidator(cleaned_data=cleaned_data)
+        form_validator.collect_all_errors = collect_all_errors
+        return form_validator
+
+    def test_first_error_only_by_default(self):
+        form_validator = self.form_validator(first=True, second=True)
+        with self.assertRaises(ValidationError) as cm:
+            form_validator.validate()
+        self.assertIn('first', cm.exception.message_dict)
+        self.assertNotIn('second', cm.exception.message_dict)
+        self.assertEqual(form_validator.steps, ['first'])
+
+    def test_collects_all_errors(self):
+        form_validator = self.form_validator(
+            collect_all_errors=True, first=True, second=True)
+        with self.assertRaises(ValidationError) as cm:
+            form_validator.validate()
+        self.assertEqual(
+            cm.exception.message_dict,
+            {'first': ['First is invalid.'], 'second': ['Second is invalid.']})
+        self.assertEqual(form_validator.steps, ['first', 'prerequisite', 'second'])
+
+    def test_prerequisite_short_circuits(self):
+        form_validator = self.form_validator(
+            collect_all_errors=True, first=True, prerequisite=True, second=True)
+        with self.assertRaises(ValidationError) as cm:
+            form_validator.validate()
+        self.assertIn('first', cm.exception.message_dict)
+        self.assertIn('__all__', cm.exception.message_dict)
+        self.assertNotIn('second', cm.exception.message_dict)
+        self.assertEqual(form_validator.steps, ['first', 'prerequisite'])
+
+    def test_prerequisite_step_short_circuits(self):
+        form_validator = PrerequisiteStepsFormValidator(
+            cleaned_data={'first': True, 'second': True})
+        form_validator.collect_all_errors = True
+        with self.assertRaises(ValidationError) as cm:
+            form_validator.validate()
+        self.assertEqual(cm.exception.message_dict, {'first': ['First is invalid.']})
+        self.assertEqual(form_validator.steps, ['first'])
+
+    def test_prerequisite_step_error_with_collected_errors(self):
+        form_validator = LatePrerequisiteStepsFormValidator(
+            cleaned_data={'first': True, 'second': True})
+        form_validator.collect_all_errors = True
+        with self.assertRaises(ValidationError) as cm:
+            form_validator.validate()
+        self.assertEqual(
+            cm.exception.message_dict,
+            {'first': ['First is invalid.'], 'second': ['Second is invalid.']})
+        self.assertEqual(str(cm.exception), str(cm.exception.message_dict))
+
+    def test_missing_antenatal_enrollment_ends_clean(self):
+        MaternalRandoFormValidator.antenatal_enrollment_model = \
+            'td_maternal_validators.antenatalenrollment'
+        appointment = Appointment.objects.create(
+            subject_identifier='11111111', appt_datetime=get_utcnow(),
+            visit_code='1000M')
+        form_validator = MaternalRandoFormValidator(
+            cleaned_data={'maternal_visit': MaternalVisit.objects.create(
+                appointment=appointment)})
+        form_validator.collect_all_errors = True
+        # verify_hiv_status would fail without the enrollment
+        with self.assertRaises(ValidationError) as cm:
+            form_validator.validate()
+        self.assertEqual(list(cm.exception.message_dict), ['sid'])
+
+    def test_valid(self):
+        form_validator = self.form_validator(collect_all_errors=True)
+        try:
+            form_validator.validate()
+        except ValidationError as e:
+            self.fail(f'ValidationError unexpectedly raised. Got{e}')
+
+    def test_step_raises_outside_validate(self):
+        form_validator = self.form_validator(collect_all_errors=True, first=True)
+        form_validator.steps = []
+        self.assertRaises(ValidationError, form_validator.validate_first)
@@ -0,0 +1,109 @@
+from dateutil.relativedelta import relativedelta
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from edc_base.utils import get_utcnow
+
+from ..form_validators import DependencyInvalidator, MaternalVisitFormValidator
+from ..form_validators import SubjectContext, subject_facts_cache
+from .models import Appointment, MaternalLabourDel, MaternalObstericalHistory
+from .models import MaternalVisit, SubjectConsent, SubjectScreening, TdConsentVersion
+
+CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+}
+
+LABELS = [
+    'td_maternal_validators.maternallabourdel',
+    'td_maternal_validators.maternalobstericalhistory',
+    'td_maternal_validators.subjectconsent',
+    'td_maternal_validators.tdconsentversion',
+]
+
+
+@override_settings(CACHES=CACHES, TD_MATERNAL_VALIDATORS_FACTS_CACHE='default')
+class TestDependencyInvalidation(TestCase):
+
+    def setUp(self):
+        caches['default'].clear()
+        self.invalidator = DependencyInvalidator()
+        self.invalidator.subject_screening_model = \
+            'td_maternal_validators.subjectscreening'
+        self.invalidator.connect(*LABELS)
+        self.model_labels = dict(
+            antenatal_enrollment_model='td_maternal_validators.antenatalenrollment',
+            consent_version_model='td_maternal_validators.tdconsentversion',
+            maternal_consent_model='td_maternal_validators.subjectconsent',
+            maternal_labour_del_model='td_maternal_validators.maternallabourdel',
+            subject_screening_model='td_maternal_validators.subjectscreening')
+        self.subject_identifier = '11111111'
+        SubjectScreening.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='ABC12345',
+            age_in_years=22)
+        SubjectConsent.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='ABC12345',
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow() - relativedelta(days=2), version='3')
+        self.consent_version = TdConsentVersion.objects.create(
+            screening_identifier='ABC12345', version='3',
+            report_datetime=get_utcnow())
+
+    def tearDown(self):
+        self.invalidator.disconnect(*LABELS)
+
+    def context(self):
+        return SubjectContext(self.subject_identifier, **self.model_labels)
+
+    def test_dependency_labels(self):
+        labels = self.invalidator.dependency_labels(MaternalVisitFormValidator)
+        self.assertIn(MaternalVisitFormValidator.maternal_consent_model, labels)
+        self.assertIn(MaternalVisitFormValidator.karabo_subject_consent_model, labels)
+        self.assertIn(SubjectContext.maternal_offstudy_model, labels)
+
+    def test_save_bumps_version(self):
+        version = subject_facts_cache.version(self.subject_identifier)
+        self.assertIsNone(self.context().facts.delivery_datetime)
+        labour_del = MaternalLabourDel.objects.create(
+            subject_identifier=self.subject_identifier,
+            delivery_datetime=get_utcnow())
+        self.assertNotEqual(
+            subject_facts_cache.version(self.subject_identifier), version)
+        self.assertEqual(
+            self.context().facts.delivery_datetime, labour_del.delivery_datetime)
+
+    def test_delete_bumps_version(self):
+        labour_del = MaternalLabourDel.objects.create(
+            subject_identifier=self.subject_identifier,
+            delivery_datetime=get_utcnow())
+        self.assertIsNotNone(self.context().facts.delivery_datetime)
+        labour_del.delete()
+        self.assertIsNone(self.context().facts.delivery_datetime)
+
+    def test_subject_by_screening_identifier(self):
+        self.assertEqual(self.context().facts.consent_version, '3')
+        self.consent_version.version = '4'
+        self.consent_version.save()
+        self.assertEqual(self.context().facts.consent_version, '4')
+
+    def test_subject_by_maternal_visit(self):
+        appointment = Appointment.objects.create(
+            subject_identifier=self.subject_identifier,
+            appt_datetime=get_utcnow(),
+            visit_code='1000M')
+        maternal_visit = MaternalVisit.objects.create(
+            appointment=appointment,
+            subject_identifier=self.subject_identifier)
+        version = subject_facts_cache.version(self.subject_identifier)
+        MaternalObstericalHistory.objects.create(
+            maternal_visit=maternal_visit, prev_pregnancies=1)
+        self.assertNotEqual(
+            subject_facts_cache.version(self.subject_identifier), version)
+
+    def test_other_subjects_unchanged(self):
+        version = subject_facts_cache.version(self.subject_identifier)
+        MaternalLabourDel.objects.create(
+            subject_identifier='22222222',
+            delivery_datetime=get_utcnow())
+        self.assertEqual(
+            subject_facts_cache.version(self.subject_identifier), version)
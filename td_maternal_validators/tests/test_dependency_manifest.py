@@ -0,0 +1,122 @@
+import re
+
+from django.apps import apps as django_apps
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models import Model, QuerySet
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from ..benchmarks import build_cohort, payload_builders
+from ..benchmarks.runner import benchmarked_validators, stand_in_models
+from ..form_validators import Dependency, MaternalVisitFormValidator
+from ..form_validators import RapidTestResultFormValidator, dependency_manifest
+from ..form_validators import manifest_labels
+
+STUDY_TABLE = 'td_maternal_validators_'
+
+TABLE = re.compile(r'(?:FROM|JOIN) "(\w+)"')
+
+
+def input_tables(cleaned_data):
+    """Returns the tables of the models of the inputs, with their M2M
+    through tables, but not of the models they relate to.
+    """
+    tables = set()
+    for value in cleaned_data.values():
+        if isinstance(value, Model):
+            model_cls = value.__class__
+        elif isinstance(value, QuerySet):
+            model_cls = value.model
+        else:
+            continue
+        tables.add(model_cls._meta.db_table)
+        for field in model_cls._meta.many_to_many:
+            tables.add(field.remote_field.through._meta.db_table)
+    return tables
+
+
+def manifest_tables(validator_cls):
+    tables = set()
+    for entry in dependency_manifest(validator_cls):
+        try:
+            model_cls = django_apps.get_model(entry.label)
+        except (LookupError, ValueError):
+            continue
+        tables.add(model_cls._meta.db_table)
+    return tables
+
+
+class Base:
+
+    dependencies = (
+        Dependency('maternal_visit_model', 'subject_identifier'),
+        Dependency('td_maternal.maternalstatus', 'subject_identifier'))
+
+    maternal_visit_model = 'td_maternal.maternalvisit'
+
+
+class Validator(Base):
+
+    dependencies = (
+        Dependency('maternal_visit_model', 'subject_identifier'),
+        Dependency('antenatal_enrollment_model', 'subject_identifier'))
+
+    antenatal_enrollment_model = 'td_maternal.antenatalenrollment'
+
+
+class TestDependencyManifest(TestCase):
+
+    def test_manifest_collects_bases(self):
+        self.assertEqual(
+            [(entry.model, entry.label) for entry in dependency_manifest(Validator)],
+            [('maternal_visit_model', 'td_maternal.maternalvisit'),
+             ('td_maternal.maternalstatus', 'td_maternal.maternalstatus'),
+             ('antenatal_enrollment_model', 'td_maternal.antenatalenrollment')])
+
+    def test_manifest_follows_model_labels(self):
+        Validator.maternal_visit_model = 'td_maternal_validators.maternalvisit'
+        try:
+            self.assertEqual(
+                manifest_labels(Validator),
+                ['td_maternal.antenatalenrollment', 'td_maternal.maternalstatus',
+                 'td_maternal_validators.maternalvisit'])
+        finally:
+            Validator.maternal_visit_model = 'td_maternal.maternalvisit'
+
+    def test_manifest_falls_back_to_subject_context(self):
+        labels = manifest_labels(MaternalVisitFormValidator)
+        self.assertIn(
+            MaternalVisitFormValidator.subject_context_cls.maternal_offstudy_model,
+            labels)
+        self.assertIn(MaternalVisitFormValidator.maternal_labour_del_model, labels)
+
+    def test_subject_context_facts(self):
+        facts = RapidTestResultFormValidator(
+            cleaned_data={}).subject_context_facts()
+        self.assertIn('antenatal_enrollment', facts)
+        self.assertNotIn('maternal_labour_del', facts)
+
+    def test_validators_read_manifest_only(self):
+        """Asserts every study table a validator queries is in its
+        manifest or is the table of one of its inputs.
+        """
+        cohort = build_cohort(subjects=2, visits=1)
+        validator_classes = benchmarked_validators()
+        with stand_in_models(validator_classes):
+            for validator_cls in validator_classes:
+                allowed = manifest_tables(validator_cls)
+                for subject in cohort:
+                    for cleaned_data in payload_builders[validator_cls.__name__](subject):
+                        with CaptureQueriesContext(connection) as queries:
+                            try:
+                                validator_cls(cleaned_data=cleaned_data).validate()
+                            except ValidationError:
+                                pass
+                        tables = {
+                            table for query in queries
+                            for table in TABLE.findall(query['sql'])
+                            if table.startswith(STUDY_TABLE)}
+                        with self.subTest(validator=validator_cls.__name__):
+                            self.assertLessEqual(
+                                tables, allowed | input_tables(cleaned_data))
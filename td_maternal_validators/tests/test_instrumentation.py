@@ -0,0 +1,54 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from edc_base.utils import get_utcnow
+from edc_constants.constants import POS, NEG
+
+from ..form_validators import MaternalRandoFormValidator
+from ..instrumentation import instrument, uninstrument, validator_stats
+from .models import AntenatalEnrollment, Appointment, MaternalVisit
+
+
+class TestInstrumentation(TestCase):
+
+    def setUp(self):
+        MaternalRandoFormValidator.antenatal_enrollment_model = \
+            'td_maternal_validators.antenatalenrollment'
+        appointment = Appointment.objects.create(
+            subject_identifier='11111111',
+            appt_datetime=get_utcnow(),
+            visit_code='1000')
+        self.maternal_visit = MaternalVisit.objects.create(
+            appointment=appointment)
+        AntenatalEnrollment.objects.create(
+            subject_identifier='11111111',
+            enrollment_hiv_status=POS)
+        validator_stats.reset()
+        instrument(MaternalRandoFormValidator)
+        self.addCleanup(uninstrument, MaternalRandoFormValidator)
+
+    def test_clean_recorded(self):
+        form_validator = MaternalRandoFormValidator(
+            cleaned_data={'maternal_visit': self.maternal_visit,
+                          'report_datetime': get_utcnow()})
+        form_validator.validate()
+        stats = validator_stats.snapshot()['MaternalRandoFormValidator']
+        self.assertEqual(stats['clean']['calls'], 1)
+        self.assertEqual(stats['clean']['queries'], 1)
+        self.assertGreater(stats['clean']['wall_time'], 0)
+
+    def test_failing_clean_recorded(self):
+        AntenatalEnrollment.objects.update(enrollment_hiv_status=NEG)
+        form_validator = MaternalRandoFormValidator(
+            cleaned_data={'maternal_visit': self.maternal_visit,
+                          'report_datetime': get_utcnow()})
+        self.assertRaises(ValidationError, form_validator.validate)
+        stats = validator_stats.snapshot()['MaternalRandoFormValidator']
+        self.assertEqual(stats['clean']['calls'], 1)
+
+    def test_uninstrument(self):
+        uninstrument(MaternalRandoFormValidator)
+        form_validator = MaternalRandoFormValidator(
+            cleaned_data={'maternal_visit': self.maternal_visit,
+                          'report_datetime': get_utcnow()})
+        form_validator.validate()
+        self.assertEqual(validator_stats.snapshot(), {})
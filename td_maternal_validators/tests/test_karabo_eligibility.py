@@ -0,0 +1,77 @@
+from datetime import date, datetime, timezone
+
+from dateutil.relativedelta import relativedelta
+from django.test import TestCase
+from edc_base.utils import get_utcnow
+
+from ..form_validators import KaraboEligibility
+from .models import MaternalLabourDel
+
+
+class TestKaraboEligibility(TestCase):
+
+    def setUp(self):
+        self.eligibility = KaraboEligibility(
+            maternal_labour_del_model='td_maternal_validators.maternallabourdel')
+
+    def deliver(self, subject_identifier, delivery_datetime):
+        MaternalLabourDel.objects.create(
+            subject_identifier=subject_identifier,
+            delivery_datetime=delivery_datetime)
+
+    def test_is_eligible(self):
+        delivery_datetime = get_utcnow() - relativedelta(months=20)
+        self.assertTrue(self.eligibility.is_eligible(delivery_datetime))
+        self.assertFalse(self.eligibility.is_eligible(
+            delivery_datetime, report_datetime=delivery_datetime + relativedelta(
+                months=21)))
+        self.assertFalse(self.eligibility.is_eligible(
+            get_utcnow() - relativedelta(months=21, days=1)))
+        self.assertFalse(self.eligibility.is_eligible(None))
+
+    def test_windows(self):
+        delivery_datetime = get_utcnow() - relativedelta(months=3)
+        self.deliver('11111111', delivery_datetime)
+        self.deliver('22222222', delivery_datetime)
+        with self.assertNumQueries(1):
+            windows = self.eligibility.windows(['11111111'])
+        self.assertEqual(list(windows), ['11111111'])
+        self.assertEqual(
+            windows['11111111'].closes, delivery_datetime + relativedelta(months=21))
+
+    def test_report(self):
+        self.deliver('11111111', datetime(2020, 3, 15, 10, tzinfo=timezone.utc))
+        self.deliver('22222222', datetime(2021, 12, 15, 8, tzinfo=timezone.utc))
+        self.deliver('33333333', datetime(2020, 3, 16, tzinfo=timezone.utc))
+        self.deliver('44444444', datetime(2020, 3, 14, 23, tzinfo=timezone.utc))
+        with self.assertNumQueries(1):
+            report = self.eligibility.report(date(2021, 12, 15))
+        self.assertEqual(report.entering, ['22222222'])
+        self.assertEqual(report.leaving, ['11111111'])
+
+    def test_report_short_month(self):
+        # windows of deliveries on the 28th to 31st of May close on the
+        # 28th of February
+        for day in (27, 28, 31):
+            self.deliver(f'1111111{day}', datetime(2019, 5, day, tzinfo=timezone.utc))
+        self.assertEqual(
+            self.eligibility.report(date(2021, 2, 28)).leaving,
+            ['11111128', '11111131'])
+        # and none closes on the 30th of November
+        self.deliver('22222222', datetime(2020, 2, 28, tzinfo=timezone.utc))
+        self.assertEqual(self.eligibility.report(date(2021, 11, 30)).leaving, [])
+        self.assertEqual(
+            self.eligibility.report(date(2021, 11, 28)).leaving, ['22222222'])
+
+    def test_report_matches_windows(self):
+        start = datetime(2019, 5, 25, tzinfo=timezone.utc)
+        for hours in range(0, 24 * 14, 7):
+            self.deliver(f'S{hours}', start + relativedelta(hours=hours))
+        start_of_day = datetime(2021, 2, 28, tzinfo=timezone.utc)
+        end_of_day = datetime(2021, 3, 1, tzinfo=timezone.utc)
+        expected = sorted(
+            obj.subject_identifier for obj in MaternalLabourDel.objects.all()
+            if start_of_day <= self.eligibility.window(
+                obj.delivery_datetime).closes < end_of_day)
+        self.assertTrue(expected)
+        self.assertEqual(self.eligibility.report(date(2021, 2, 28)).leaving, expected)
@@ -0,0 +1,105 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from edc_base.utils import get_utcnow, relativedelta
+from edc_constants.constants import YES
+
+from ..form_validators import KaraboSubjectConsentFormValidator
+from .models import SubjectConsent, KaraboSubjectScreening
+
+
+class TestKaraboSubjectConsentForm(TestCase):
+
+    def setUp(self):
+        KaraboSubjectConsentFormValidator.maternal_subject_consent = \
+            'td_maternal_validators.subjectconsent'
+        KaraboSubjectConsentFormValidator.karabo_screening_model = \
+            'td_maternal_validators.karabosubjectscreening'
+
+        self.subject_identifier = '11111111'
+        self.dob = (get_utcnow() - relativedelta(years=25)).date()
+        SubjectConsent.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='ABC12345',
+            first_name='TEST ONE', last_name='TEST', initials='TOT',
+            identity='111121111', gender='F', dob=self.dob,
+            consent_datetime=get_utcnow() - relativedelta(days=1),
+            version='3')
+
+        KaraboSubjectScreening.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='KABC12345',
+            report_datetime=get_utcnow() - relativedelta(days=1))
+
+        self.cleaned_data = {
+            'subject_identifier': self.subject_identifier,
+            'report_datetime': get_utcnow(),
+            'first_name': 'TEST ONE',
+            'last_name': 'TEST',
+            'initials': 'TOT',
+            'dob': self.dob,
+            'identity': '111121111',
+            'is_literate': YES,
+            'consent_reviewed': YES,
+            'study_questions': YES,
+            'assessment_score': YES,
+            'consent_copy': YES,
+            'consent_signature': YES}
+
+    def test_maternal_details_match(self):
+        form_validator = KaraboSubjectConsentFormValidator(
+            cleaned_data=self.cleaned_data)
+        try:
+            form_validator.validate()
+        except ValidationError as e:
+            self.fail(f'ValidationError unexpectedly raised. Got{e}')
+
+    def test_all_mismatches_reported(self):
+        self.cleaned_data.update(
+            first_name='TEST TWO',
+            dob=self.dob - relativedelta(days=1),
+            identity='111121112')
+        form_validator = KaraboSubjectConsentFormValidator(
+            cleaned_data=self.cleaned_data)
+        self.assertRaises(ValidationError, form_validator.validate)
+        self.assertIn('first_name', form_validator._errors)
+        self.assertIn('dob', form_validator._errors)
+        self.assertIn('identity', form_validator._errors)
+        self.assertNotIn('last_name', form_validator._errors)
+
+    def test_maternal_consent_queried_once(self):
+        form_validator = KaraboSubjectConsentFormValidator(
+            cleaned_data=self.cleaned_data)
+        form_validator.maternal_identifier = self.subject_identifier
+        form_validator.maternal_consent
+        with self.assertNumQueries(0):
+            form_validator.validate_maternal_consent_fields()
+
+    def test_maternal_consent_missing(self):
+        self.cleaned_data.update(subject_identifier='22222222')
+        KaraboSubjectScreening.objects.create(
+            subject_identifier='22222222',
+            screening_identifier='KABC22222',
+            report_datetime=get_utcnow() - relativedelta(days=1))
+        form_validator = KaraboSubjectConsentFormValidator(
+            cleaned_data=self.cleaned_data)
+        self.assertRaises(ValidationError, form_validator.validate)
+        self.assertIn('subject_identifier', form_validator._errors)
+
+    def test_screening_read_from_subject_context(self):
+        form_validator = KaraboSubjectConsentFormValidator(
+            cleaned_data=self.cleaned_data)
+        screening = form_validator.get_subject_context(
+            self.subject_identifier).karabo_screening
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                form_validator.validate_against_screening_date(
+                    subject_identifier=self.subject_identifier,
+                    report_datetime=get_utcnow()),
+                screening.report_datetime)
+
+    def test_screening_missing(self):
+        form_validator = KaraboSubjectConsentFormValidator(
+            cleaned_data=self.cleaned_data)
+        self.assertRaises(
+            ValidationError, form_validator.validate_against_screening_date,
+            subject_identifier='22222222', report_datetime=get_utcnow())
@@ -0,0 +1,43 @@
+from unittest import mock
+
+from django.apps import apps as django_apps
+from django.test import SimpleTestCase
+
+from .. import form_validators
+from ..benchmarks import format_import_report, run_import_benchmarks
+from ..form_validators import ListModelIndex, MaternalStatusCache
+
+
+class TestLazyImports(SimpleTestCase):
+
+    def test_exports_resolve(self):
+        for name in form_validators.__all__:
+            with self.subTest(name=name):
+                value = getattr(form_validators, name)
+                self.assertEqual(getattr(value, '__name__', name), name)
+                self.assertIn(name, dir(form_validators))
+
+    def test_unknown_name(self):
+        self.assertRaises(
+            AttributeError, getattr, form_validators, 'MaternalFormValidator')
+
+    def test_run_import_benchmarks(self):
+        results = run_import_benchmarks(names=['TDCRFFormValidator'], repeat=1)
+        self.assertEqual(
+            [result['names'] for result in results], ['TDCRFFormValidator', 'all'])
+        self.assertLess(results[0]['modules'], results[1]['modules'])
+        self.assertIsNotNone(results[0]['setup_p50_ms'])
+        self.assertIn('TDCRFFormValidator', format_import_report(results))
+
+    def test_ready_connects_enabled_caches_only(self):
+        app_config = django_apps.get_app_config('td_maternal_validators')
+        with mock.patch.object(MaternalStatusCache, 'connect') as connect, \
+                mock.patch.object(ListModelIndex, 'load') as load:
+            with self.settings(TD_MATERNAL_STATUS_CACHE_TTL=0,
+                               TD_MATERNAL_VALIDATORS_PRELOAD_LIST_MODELS=False):
+                app_config.ready()
+            connect.assert_not_called()
+            load.assert_not_called()
+            with self.settings(TD_MATERNAL_STATUS_CACHE_TTL=300):
+                app_config.ready()
+            connect.assert_called_once_with()
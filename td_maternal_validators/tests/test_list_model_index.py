@@ -0,0 +1,83 @@
+from django.test import TestCase
+from edc_constants.constants import NOT_APPLICABLE, OTHER
+
+from ..form_validators import M2MSnapshotMixin
+from ..form_validators.list_model_index import ListModelIndex
+from .models import ListModel, MaternalCrfSelection, OtherListModel
+
+
+class FormValidator(M2MSnapshotMixin):
+
+    def __init__(self, cleaned_data=None, list_model_index=None, instance=None):
+        self.cleaned_data = cleaned_data
+        self.list_model_index = list_model_index
+        self.instance = instance
+
+
+class TestListModelIndex(TestCase):
+
+    def setUp(self):
+        self.list_model_index = ListModelIndex()
+        self.not_applicable = ListModel.objects.create(
+            name=NOT_APPLICABLE, short_name=NOT_APPLICABLE)
+        self.other = ListModel.objects.create(name=OTHER, short_name=OTHER)
+
+    def test_loaded_once(self):
+        with self.assertNumQueries(1):
+            self.list_model_index.load(ListModel)
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                self.list_model_index.short_name(self.other.pk), OTHER)
+            self.assertEqual(
+                self.list_model_index.short_name(str(self.other.pk)), OTHER)
+
+    def test_loaded_on_first_lookup(self):
+        self.assertEqual(
+            self.list_model_index.short_name(self.other.pk, model=ListModel),
+            OTHER)
+        self.assertIsNone(
+            self.list_model_index.short_name('unknown', model=ListModel))
+
+    def test_keyed_by_model(self):
+        OtherListModel.objects.create(
+            id=self.other.pk, name='hypertension', short_name='hypertension')
+        self.assertEqual(
+            self.list_model_index.short_name(self.other.pk, model=ListModel),
+            OTHER)
+        self.assertEqual(
+            self.list_model_index.short_name(self.other.pk, model=OtherListModel),
+            'hypertension')
+
+    def test_reloaded_on_change(self):
+        self.list_model_index.load(ListModel)
+        obj = ListModel.objects.create(name='hypertension', short_name='hypertension')
+        self.list_model_index.list_model_changed(sender=ListModel, instance=obj)
+        self.assertEqual(
+            self.list_model_index.short_name(obj.pk), 'hypertension')
+
+    def test_m2m_selection_from_pks(self):
+        self.list_model_index.load(ListModel)
+        form_validator = FormValidator(
+            cleaned_data={'who': [str(self.not_applicable.pk), str(self.other.pk)]},
+            list_model_index=self.list_model_index)
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                form_validator.m2m_selection('who'),
+                frozenset([NOT_APPLICABLE, OTHER]))
+
+    def test_m2m_selection_by_list_model(self):
+        OtherListModel.objects.create(
+            id=self.other.pk, name='hypertension', short_name='hypertension')
+        cleaned_data = {'who': [str(self.other.pk)], 'contr': [str(self.other.pk)]}
+        form_validator = FormValidator(
+            cleaned_data=cleaned_data, list_model_index=self.list_model_index,
+            instance=MaternalCrfSelection())
+        self.assertEqual(form_validator.m2m_selection('who'), frozenset([OTHER]))
+        self.assertEqual(
+            form_validator.m2m_selection('contr'), frozenset(['hypertension']))
+
+        form_validator = FormValidator(
+            cleaned_data=cleaned_data, list_model_index=self.list_model_index)
+        form_validator.m2m_model = 'td_maternal_validators.maternalcrfselection'
+        self.assertEqual(
+            form_validator.m2m_selection('contr'), frozenset(['hypertension']))
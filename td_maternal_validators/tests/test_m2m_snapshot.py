@@ -0,0 +1,41 @@
+from django.test import TestCase
+from edc_constants.constants import NOT_APPLICABLE, OTHER
+
+from ..form_validators import M2MSnapshotMixin
+from .models import ListModel
+
+
+class FormValidator(M2MSnapshotMixin):
+
+    def __init__(self, cleaned_data=None):
+        self.cleaned_data = cleaned_data
+
+
+class TestM2MSnapshot(TestCase):
+
+    def setUp(self):
+        ListModel.objects.create(name=NOT_APPLICABLE, short_name=NOT_APPLICABLE)
+        ListModel.objects.create(name=OTHER, short_name=OTHER)
+
+    def test_selection_fetched_once(self):
+        qs = ListModel.objects.all()
+        form_validator = FormValidator(cleaned_data={'who': qs})
+        with self.assertNumQueries(1):
+            selection = form_validator.m2m_selection('who')
+        self.assertEqual(selection, frozenset([NOT_APPLICABLE, OTHER]))
+        with self.assertNumQueries(0):
+            form_validator.m2m_selection('who')
+            self.assertEqual(qs.count(), 2)
+            [obj.short_name for obj in qs]
+
+    def test_new_value_resolved_again(self):
+        form_validator = FormValidator(
+            cleaned_data={'who': ListModel.objects.all()})
+        form_validator.m2m_selection('who')
+        form_validator.cleaned_data['who'] = ListModel.objects.filter(
+            short_name=OTHER)
+        self.assertEqual(form_validator.m2m_selection('who'), frozenset([OTHER]))
+
+    def test_missing_field(self):
+        form_validator = FormValidator(cleaned_data={})
+        self.assertEqual(form_validator.m2m_selection('who'), frozenset())
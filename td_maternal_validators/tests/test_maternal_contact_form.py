@@ -136,3 +136,15 @@ class TestMaternalContactForm(TestCase):
             form_validator.validate()
         except ValidationError as e:
             self.fail(f'ValidationError unexpectedly raised. Got{e}')
+
+    def test_missing_locator_collecting_errors(self):
+        self.maternal_locator.delete()
+        cleaned_data = {
+            'subject_identifier': '11111111',
+            'contact_type': 'voice_call'}
+        form_validator = MaternalContactFormValidator(
+            cleaned_data=cleaned_data)
+        form_validator.collect_all_errors = True
+        with self.assertRaises(ValidationError) as cm:
+            form_validator.validate()
+        self.assertEqual(list(cm.exception.message_dict), ['__all__'])
@@ -373,3 +373,46 @@ class TestMaternalLifetimeArvHistoryForm(TestCase):
         form_validator = MaternalLifetimeArvHistoryFormValidator(
             cleaned_data=cleaned_data)
         self.assertRaises(ValidationError, form_validator.validate)
+
+    def test_missing_prerequisites_reported_together(self):
+        '''Asserts every missing prerequisite form is reported at once.'''
+        self.ob_history.delete()
+        self.medical_history.delete()
+        self.antenatal_enrollment.delete()
+        cleaned_data = {
+            'maternal_visit': self.maternal_visit,
+        }
+        form_validator = MaternalLifetimeArvHistoryFormValidator(
+            cleaned_data=cleaned_data)
+        with self.assertRaises(ValidationError) as cm:
+            form_validator.validate()
+        self.assertEqual(len(cm.exception.messages), 3)
+        self.assertIn('Maternal Obsterical History', cm.exception.messages[0])
+        self.assertIn('Maternal Medical History', cm.exception.messages[1])
+        self.assertIn('Antenatal Enrollment', cm.exception.messages[2])
+
+    def test_prerequisites_queried_once(self):
+        '''Asserts each prerequisite form is queried once per clean.'''
+        cleaned_data = {
+            'maternal_visit': self.maternal_visit,
+        }
+        form_validator = MaternalLifetimeArvHistoryFormValidator(
+            cleaned_data=cleaned_data)
+        form_validator.subject_identifier = self.maternal_visit.subject_identifier
+        prerequisites = form_validator.prerequisites()
+        self.assertEqual(prerequisites.get('ob_history'), self.ob_history)
+        self.assertEqual(
+            prerequisites.get('medical_history'), self.medical_history)
+        with self.assertNumQueries(0):
+            form_validator.prerequisites()
+
+    def test_medical_history_from_subject_context(self):
+        '''Asserts the medical history is the subject context fact.'''
+        form_validator = MaternalLifetimeArvHistoryFormValidator(
+            cleaned_data={'maternal_visit': self.maternal_visit})
+        form_validator.subject_identifier = self.maternal_visit.subject_identifier
+        self.assertEqual(
+            form_validator.subject_context.medical_history, self.medical_history)
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                form_validator.medical_history(), self.medical_history)
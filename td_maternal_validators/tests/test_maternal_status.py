@@ -0,0 +1,100 @@
+from django.test import TestCase
+from edc_base.utils import get_utcnow
+from edc_constants.constants import NEG, POS
+
+from ..form_validators import MaternalStatusCache, MaternalStatusMixin
+from .models import Appointment, MaternalVisit
+
+
+class MaternalStatusHelper:
+
+    calls = 0
+    status = POS
+
+    def __init__(self, maternal_visit=None):
+        self.maternal_visit = maternal_visit
+
+    @property
+    def hiv_status(self):
+        MaternalStatusHelper.calls += 1
+        return self.status
+
+
+class MaternalStatusCacheStub(MaternalStatusCache):
+
+    helper_cls = MaternalStatusHelper
+
+
+class Validator(MaternalStatusMixin):
+
+    def __init__(self, cleaned_data=None, cache=None):
+        self.cleaned_data = cleaned_data
+        self.maternal_status_cache = cache
+
+
+class TestMaternalStatusCache(TestCase):
+
+    def setUp(self):
+        MaternalStatusHelper.calls = 0
+        MaternalStatusHelper.status = POS
+        self.cache = MaternalStatusCacheStub(ttl=300)
+        appointment = Appointment.objects.create(
+            subject_identifier='11111111',
+            appt_datetime=get_utcnow(),
+            visit_code='1000M')
+        self.maternal_visit = MaternalVisit.objects.create(
+            appointment=appointment)
+
+    def test_status_computed_once(self):
+        form_validator = Validator(
+            cleaned_data={'maternal_visit': self.maternal_visit},
+            cache=self.cache)
+        for _ in range(4):
+            self.assertEqual(form_validator.maternal_status_helper.hiv_status, POS)
+        Validator(
+            cleaned_data={'maternal_visit': self.maternal_visit},
+            cache=self.cache).maternal_status_helper
+        self.assertEqual(MaternalStatusHelper.calls, 1)
+
+    def test_status_computed_once_per_validator(self):
+        cache = MaternalStatusCacheStub(ttl=0)
+        form_validator = Validator(
+            cleaned_data={'maternal_visit': self.maternal_visit}, cache=cache)
+        for _ in range(4):
+            self.assertEqual(form_validator.maternal_status_helper.hiv_status, POS)
+        self.assertEqual(MaternalStatusHelper.calls, 1)
+        form_validator.cleaned_data = {
+            'maternal_visit': MaternalVisit.objects.get(pk=self.maternal_visit.pk)}
+        form_validator.maternal_status_helper
+        self.assertEqual(MaternalStatusHelper.calls, 2)
+
+    def test_expired_entry_recomputed(self):
+        cache = MaternalStatusCacheStub(ttl=0)
+        cache.get(self.maternal_visit)
+        cache.get(self.maternal_visit)
+        self.assertEqual(MaternalStatusHelper.calls, 2)
+
+    def test_disabled_by_default(self):
+        cache = MaternalStatusCacheStub()
+        with self.settings(TD_MATERNAL_STATUS_CACHE_TTL=0):
+            self.assertFalse(cache.enabled)
+            cache.get(self.maternal_visit)
+            MaternalStatusHelper.status = NEG
+            self.assertEqual(cache.get(self.maternal_visit).hiv_status, NEG)
+        self.assertEqual(MaternalStatusHelper.calls, 2)
+        self.assertFalse(MaternalStatusCacheStub().enabled)
+
+    def test_invalidate_subject(self):
+        self.cache.get(self.maternal_visit)
+        MaternalStatusHelper.status = NEG
+        self.cache.invalidate(subject_identifier='22222222')
+        self.assertEqual(self.cache.get(self.maternal_visit).hiv_status, POS)
+        self.cache.invalidate(subject_identifier='11111111')
+        self.assertEqual(self.cache.get(self.maternal_visit).hiv_status, NEG)
+
+    def test_status_model_changed(self):
+        self.cache.get(self.maternal_visit)
+        MaternalStatusHelper.status = NEG
+        self.cache.status_model_changed(
+            sender=None, instance=MaternalVisit(subject_identifier='11111111'))
+        self.assertEqual(self.cache.get(self.maternal_visit).hiv_status, NEG)
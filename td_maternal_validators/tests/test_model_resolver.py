@@ -0,0 +1,37 @@
+from unittest import mock
+
+from django.apps import apps as django_apps
+from django.test import TestCase
+
+from ..form_validators import MaternalVisitFormValidator
+from ..form_validators.model_resolver import clear_resolved_models, resolve_model
+from .models import KaraboSubjectConsent, SubjectConsent
+
+
+class TestModelResolver(TestCase):
+
+    def setUp(self):
+        clear_resolved_models()
+
+    def test_resolved_once(self):
+        label = 'td_maternal_validators.subjectconsent'
+        with mock.patch.object(
+                django_apps, 'get_model', wraps=django_apps.get_model) as get_model:
+            for _ in range(2):
+                self.assertIs(
+                    resolve_model(MaternalVisitFormValidator, label), SubjectConsent)
+                self.assertIs(
+                    resolve_model(MaternalVisitFormValidator(cleaned_data={}), label),
+                    SubjectConsent)
+        get_model.assert_called_once_with(label)
+
+    def test_label_override_honoured(self):
+        MaternalVisitFormValidator.maternal_consent_model = \
+            'td_maternal_validators.subjectconsent'
+        form_validator = MaternalVisitFormValidator(cleaned_data={})
+        self.assertIs(form_validator.maternal_consent_cls, SubjectConsent)
+        MaternalVisitFormValidator.maternal_consent_model = \
+            'td_maternal_validators.karabosubjectconsent'
+        self.assertIs(form_validator.maternal_consent_cls, KaraboSubjectConsent)
+        MaternalVisitFormValidator.maternal_consent_model = \
+            'td_maternal_validators.subjectconsent'
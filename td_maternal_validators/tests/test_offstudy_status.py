@@ -0,0 +1,91 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from edc_constants.constants import NO, OFF_STUDY, ON_STUDY, YES
+
+from ..constants import OFFSTUDY_SCHEDULED
+from ..form_validators import MaternalArvFormValidator, MaternalArvPregFormValidator
+
+
+class MaternalVisit:
+
+    def __init__(self, require_crfs=None):
+        self.require_crfs = require_crfs
+
+
+class MaternalArvPreg:
+
+    pk = None
+
+    def __init__(self, maternal_visit=None):
+        self.maternal_visit = maternal_visit
+
+
+class TestOffstudyStatus(TestCase):
+
+    def form_validator(self, cleaned_data=None, validator_cls=None, **facts):
+        validator_cls = validator_cls or MaternalArvPregFormValidator
+        form_validator = validator_cls(cleaned_data=cleaned_data or {})
+        form_validator.subject_identifier = '11111111'
+        form_validator.subject_context.prime(**facts)
+        return form_validator
+
+    def test_on_study(self):
+        form_validator = self.form_validator(
+            offstudy_action_item=None, maternal_offstudy=None)
+        self.assertEqual(form_validator.offstudy_status.status, ON_STUDY)
+        try:
+            form_validator.validate_offstudy_model()
+        except ValidationError as e:
+            self.fail(f'ValidationError unexpectedly raised. Got{e}')
+
+    def test_off_study(self):
+        form_validator = self.form_validator(
+            offstudy_action_item=None, maternal_offstudy=object())
+        self.assertEqual(form_validator.offstudy_status.status, OFF_STUDY)
+        self.assertRaises(
+            ValidationError, form_validator.validate_offstudy_model)
+
+    def test_offstudy_scheduled_no_crfs(self):
+        action_item = object()
+        form_validator = self.form_validator(
+            cleaned_data={'maternal_visit': MaternalVisit(require_crfs=NO)},
+            offstudy_action_item=action_item)
+        self.assertEqual(
+            form_validator.offstudy_status, (OFFSTUDY_SCHEDULED, action_item))
+        self.assertRaises(
+            ValidationError, form_validator.validate_offstudy_model)
+
+    def test_offstudy_scheduled_crfs_required(self):
+        form_validator = self.form_validator(
+            cleaned_data={'maternal_visit': MaternalVisit(require_crfs=YES)},
+            offstudy_action_item=object())
+        try:
+            form_validator.validate_offstudy_model()
+        except ValidationError as e:
+            self.fail(f'ValidationError unexpectedly raised. Got{e}')
+
+    def test_offstudy_scheduled_visit_of_parent(self):
+        """Asserts the visit of a CRF that points to a parent CRF is
+        the visit of the parent.
+        """
+        for require_crfs in (NO, YES):
+            form_validator = self.form_validator(
+                cleaned_data={'maternal_arv_preg': MaternalArvPreg(
+                    maternal_visit=MaternalVisit(require_crfs=require_crfs))},
+                validator_cls=MaternalArvFormValidator,
+                offstudy_action_item=object())
+            if require_crfs == NO:
+                self.assertRaises(
+                    ValidationError, form_validator.validate_offstudy_model)
+            else:
+                try:
+                    form_validator.validate_offstudy_model()
+                except ValidationError as e:
+                    self.fail(f'ValidationError unexpectedly raised. Got{e}')
+
+    def test_status_memoized(self):
+        form_validator = self.form_validator(
+            offstudy_action_item=None, maternal_offstudy=None)
+        offstudy_status = form_validator.offstudy_status
+        form_validator.subject_context.prime(maternal_offstudy=object())
+        self.assertIs(form_validator.offstudy_status, offstudy_status)
@@ -140,3 +140,17 @@ class TestRapidTestResultForm(TestCase):
         form_validator = RapidTestResultFormValidator(
             cleaned_data=cleaned_data)
         self.assertRaises(ValidationError, form_validator.validate)
+
+    def test_missing_antenatal_enrollment_collecting_errors(self):
+        self.antenatal_enrollment.delete()
+        cleaned_data = {
+            'maternal_visit': self.maternal_visit,
+            'rapid_test_done': YES,
+            'result_date': get_utcnow().date(),
+            'result': NEG}
+        form_validator = RapidTestResultFormValidator(
+            cleaned_data=cleaned_data)
+        form_validator.collect_all_errors = True
+        with self.assertRaises(ValidationError) as cm:
+            form_validator.validate()
+        self.assertEqual(list(cm.exception.message_dict), ['rapid_test_done'])
@@ -0,0 +1,104 @@
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.test import TestCase, override_settings
+from edc_base.utils import get_utcnow, relativedelta
+
+from ..form_validators import AntenatalVisitMembershipFormValidator
+from ..form_validators import subject_facts_cache
+from ..form_validators.result_cache import normalized
+from .models import Appointment, SubjectConsent, SubjectScreening, TdConsentVersion
+
+CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+}
+
+
+@override_settings(
+    CACHES=CACHES, TD_MATERNAL_VALIDATORS_FACTS_CACHE='default',
+    TD_MATERNAL_VALIDATORS_RESULT_CACHE=True)
+class TestResultCache(TestCase):
+
+    def setUp(self):
+        caches['default'].clear()
+        AntenatalVisitMembershipFormValidator.maternal_consent_model = \
+            'td_maternal_validators.subjectconsent'
+        AntenatalVisitMembershipFormValidator.consent_version_model = \
+            'td_maternal_validators.tdconsentversion'
+        AntenatalVisitMembershipFormValidator.subject_screening_model = \
+            'td_maternal_validators.subjectscreening'
+
+        self.subject_identifier = '11111111'
+        self.subject_consent = SubjectConsent.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='ABC12345',
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow() - relativedelta(days=2), version='3')
+        SubjectScreening.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='ABC12345',
+            age_in_years=22)
+        TdConsentVersion.objects.create(
+            screening_identifier='ABC12345', version='3',
+            report_datetime=get_utcnow())
+        self.report_datetime = get_utcnow()
+
+    def validate(self, cleaned_data):
+        AntenatalVisitMembershipFormValidator(cleaned_data=cleaned_data).validate()
+
+    def test_valid_result_cached(self):
+        cleaned_data = {'subject_identifier': self.subject_identifier,
+                        'report_datetime': self.report_datetime}
+        self.validate(dict(cleaned_data))
+        with self.assertNumQueries(0):
+            self.validate(dict(cleaned_data))
+
+    def test_invalid_result_cached(self):
+        cleaned_data = {'subject_identifier': self.subject_identifier,
+                        'report_datetime': self.report_datetime - relativedelta(days=5)}
+        self.assertRaises(ValidationError, self.validate, dict(cleaned_data))
+        form_validator = AntenatalVisitMembershipFormValidator(
+            cleaned_data=dict(cleaned_data))
+        with self.assertNumQueries(0):
+            with self.assertRaises(ValidationError) as cm:
+                form_validator.validate()
+        self.assertIn(
+            'Report datetime cannot be before consent datetime',
+            cm.exception.messages)
+
+    def test_changed_submission_validated(self):
+        self.validate({'subject_identifier': self.subject_identifier,
+                       'report_datetime': self.report_datetime})
+        self.assertRaises(
+            ValidationError, self.validate,
+            {'subject_identifier': self.subject_identifier,
+             'report_datetime': self.report_datetime - relativedelta(days=5)})
+
+    def test_subject_version_drops_result(self):
+        cleaned_data = {'subject_identifier': self.subject_identifier,
+                        'report_datetime': self.report_datetime}
+        self.validate(dict(cleaned_data))
+        self.subject_consent.consent_datetime = get_utcnow() + relativedelta(days=1)
+        self.subject_consent.save()
+        subject_facts_cache.invalidate(self.subject_identifier)
+        self.assertRaises(ValidationError, self.validate, dict(cleaned_data))
+
+    def test_disabled(self):
+        cleaned_data = {'subject_identifier': self.subject_identifier,
+                        'report_datetime': self.report_datetime}
+        form_validator = AntenatalVisitMembershipFormValidator(
+            cleaned_data=cleaned_data)
+        with override_settings(TD_MATERNAL_VALIDATORS_RESULT_CACHE=False):
+            self.assertFalse(form_validator.caches_results)
+        with override_settings(TD_MATERNAL_VALIDATORS_FACTS_CACHE=None):
+            self.assertFalse(form_validator.caches_results)
+        form_validator.cache_results = False
+        self.assertFalse(form_validator.caches_results)
+
+    def test_normalized(self):
+        appointment = Appointment.objects.create(
+            subject_identifier=self.subject_identifier,
+            appt_datetime=get_utcnow(), visit_code='1000M')
+        self.assertEqual(
+            normalized({'appointment': appointment, 'b': {2, 1}}),
+            {'appointment': ['td_maternal_validators.appointment', str(appointment.pk)],
+             'b': [1, 2]})
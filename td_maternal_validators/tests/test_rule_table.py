@@ -0,0 +1,119 @@
+from unittest import mock
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from edc_constants.constants import NO, NOT_APPLICABLE, OTHER, YES
+from edc_form_validators import FormValidator
+
+from ..benchmarks import build_cohort, format_rule_report, run_rule_benchmarks
+from ..form_validators import (
+    MaternalCovidScreeningFormValidator, MaternalDemographicsFormValidator,
+    MaternalTuberculosisHistoryFormValidator, TDCRFFormValidator)
+from ..form_validators.rule_table import ApplicableIf, OtherSpecify, RequiredIf, Step
+from .models import ListModel
+
+
+def holds(rule, **cleaned_data):
+    check, *_ = rule.compile(MaternalTuberculosisHistoryFormValidator)
+    return check(cleaned_data)
+
+
+class TestRuleTable(TestCase):
+
+    def test_rules_compiled_once(self):
+        self.assertEqual(
+            len(MaternalTuberculosisHistoryFormValidator._compiled_rules), 3)
+        check, function, args, kwargs = \
+            MaternalTuberculosisHistoryFormValidator._compiled_rules[0]
+        self.assertTrue(callable(check))
+        self.assertIs(function, FormValidator.required_if)
+        self.assertEqual(args, (YES, ))
+        self.assertEqual(kwargs['field_required'], 'coughing_rel')
+
+    def test_rule_fields(self):
+        self.assertEqual(
+            [fields for _, fields
+             in MaternalTuberculosisHistoryFormValidator.rule_fields()],
+            [('coughing', 'coughing_rel'),
+             ('diagnosis', 'diagnosis_rel'),
+             ('tb_treatment', 'tb_treatment_rel')])
+
+    def test_other_specify_default_field(self):
+        _, fields = MaternalDemographicsFormValidator.rule_fields()[0]
+        self.assertEqual(fields, ('marital_status', 'marital_status_other'))
+
+    def test_step_fields(self):
+        rule, fields = MaternalCovidScreeningFormValidator.rule_fields()[3]
+        self.assertIsInstance(rule, Step)
+        self.assertEqual(fields, ('covid_test_date', ))
+
+    def test_unknown_helper(self):
+        with self.assertRaises(TypeError):
+            type('BadFormValidator', (TDCRFFormValidator, FormValidator),
+                 {'rules': (Step('validate_missing'), )})
+
+    def test_rule_repr(self):
+        self.assertEqual(
+            repr(RequiredIf(YES, field='coughing', field_required='coughing_rel')),
+            f"RequiredIf({YES!r}, field='coughing', field_required='coughing_rel')")
+
+    def test_required_if_check(self):
+        rule = RequiredIf(YES, field='coughing', field_required='coughing_rel')
+        self.assertTrue(holds(rule, coughing=YES, coughing_rel='weeks'))
+        self.assertTrue(holds(rule, coughing=NO, coughing_rel=None))
+        self.assertTrue(holds(rule, coughing_rel='weeks'))
+        self.assertFalse(holds(rule, coughing=YES, coughing_rel=NOT_APPLICABLE))
+        self.assertFalse(holds(rule, coughing=NO, coughing_rel='weeks'))
+
+    def test_applicable_if_check(self):
+        rule = ApplicableIf(YES, field='pap_smear', field_applicable='pap_smear_result')
+        self.assertTrue(holds(rule, pap_smear=YES, pap_smear_result=NO))
+        self.assertTrue(holds(rule, pap_smear=NO, pap_smear_result=NOT_APPLICABLE))
+        self.assertFalse(holds(rule, pap_smear=YES, pap_smear_result=None))
+        self.assertFalse(holds(rule, pap_smear=NO, pap_smear_result=NO))
+
+    def test_other_specify_check(self):
+        rule = OtherSpecify(field='ethnicity')
+        self.assertTrue(holds(rule, ethnicity=OTHER, ethnicity_other='Asian'))
+        self.assertTrue(holds(rule, ethnicity='Black African'))
+        self.assertFalse(holds(rule, ethnicity=OTHER))
+        self.assertFalse(holds(rule, ethnicity=None, ethnicity_other='Asian'))
+
+    def test_model_values_left_to_helper(self):
+        rule = RequiredIf(YES, field='coughing', field_required='coughing_rel')
+        list_model = ListModel(name=YES, short_name=YES)
+        self.assertFalse(holds(rule, coughing=list_model, coughing_rel='weeks'))
+
+    def test_unchecked_kwargs(self):
+        rule = RequiredIf(
+            YES, field='coughing', field_required='coughing_rel',
+            optional_if_dwta=True)
+        check, *_ = rule.compile(MaternalTuberculosisHistoryFormValidator)
+        self.assertIsNone(check)
+
+    def test_helper_skipped_when_check_holds(self):
+        form_validator = MaternalTuberculosisHistoryFormValidator(
+            cleaned_data={'coughing': NO, 'coughing_rel': None})
+        helper = mock.Mock()
+        form_validator._compiled_rules = tuple(
+            (check, helper, args, kwargs)
+            for check, _, args, kwargs in form_validator._compiled_rules)
+        form_validator.apply_rules()
+        helper.assert_not_called()
+
+    def test_helper_raises_when_check_fails(self):
+        form_validator = MaternalTuberculosisHistoryFormValidator(
+            cleaned_data={'coughing': YES, 'coughing_rel': None})
+        with self.assertRaises(ValidationError) as cm:
+            form_validator.apply_rules()
+        self.assertIn('coughing_rel', cm.exception.message_dict)
+
+    def test_run_rule_benchmarks(self):
+        results = run_rule_benchmarks(
+            build_cohort(subjects=1, visits=1),
+            validator_names=['MaternalTuberculosisHistoryFormValidator'], repeat=2)
+        self.assertEqual(
+            [(r['payload'], r['runs']) for r in results],
+            [('valid', 2), ('invalid', 2)])
+        self.assertIn(
+            'MaternalTuberculosisHistoryFormValidator', format_rule_report(results))
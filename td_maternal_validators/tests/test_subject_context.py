@@ -0,0 +1,144 @@
+from dateutil.relativedelta import relativedelta
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from edc_base.utils import get_utcnow
+
+from ..form_validators import SubjectContext, subject_context_scope
+from ..form_validators import AntenatalVisitMembershipFormValidator
+from .models import SubjectConsent, SubjectScreening, TdConsentVersion
+
+
+class TestSubjectContext(TestCase):
+
+    def setUp(self):
+        self.model_labels = dict(
+            antenatal_enrollment_model='td_maternal_validators.antenatalenrollment',
+            consent_version_model='td_maternal_validators.tdconsentversion',
+            maternal_consent_model='td_maternal_validators.subjectconsent',
+            subject_screening_model='td_maternal_validators.subjectscreening')
+        for attr, label in self.model_labels.items():
+            setattr(AntenatalVisitMembershipFormValidator, attr, label)
+
+        self.subject_identifier = '11111111'
+        self.subject_screening = SubjectScreening.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='ABC12345',
+            age_in_years=22)
+
+        TdConsentVersion.objects.create(
+            screening_identifier='ABC12345', version='3',
+            report_datetime=get_utcnow())
+
+        SubjectConsent.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='ABC12345',
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow() - relativedelta(days=2),
+            version='1')
+
+        self.latest_consent = SubjectConsent.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='ABC12345',
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow(), version='3')
+
+    def test_facts_queried_once(self):
+        context = SubjectContext(self.subject_identifier, **self.model_labels)
+        with self.assertNumQueries(4):
+            context.subject_screening
+            context.consent_version
+            context.consents
+            context.antenatal_enrollment
+        with self.assertNumQueries(0):
+            context.subject_screening
+            context.consent_version
+            context.consents
+            context.antenatal_enrollment
+
+    def test_latest_consent_by_version(self):
+        context = SubjectContext(self.subject_identifier, **self.model_labels)
+        self.assertEqual(context.latest_consent(version='3'), self.latest_consent)
+        self.assertEqual(context.first_consent.version, '1')
+        self.assertIsNone(context.latest_consent(version='2'))
+
+    def test_missing_facts_are_none(self):
+        context = SubjectContext('22222222', **self.model_labels)
+        self.assertIsNone(context.subject_screening)
+        self.assertIsNone(context.consent_version)
+        self.assertEqual(context.consents, [])
+        self.assertIsNone(context.antenatal_enrollment)
+
+    def test_invalid_model_label(self):
+        self.assertRaises(
+            TypeError, SubjectContext, self.subject_identifier,
+            maternal_visit_model='td_maternal_validators.maternalvisit')
+
+    def test_context_shared_in_scope(self):
+        cleaned_data = {'subject_identifier': self.subject_identifier,
+                        'report_datetime': get_utcnow()}
+        with subject_context_scope():
+            form_validator = AntenatalVisitMembershipFormValidator(
+                cleaned_data=cleaned_data)
+            form_validator.validate()
+            with self.assertNumQueries(0):
+                AntenatalVisitMembershipFormValidator(
+                    cleaned_data=cleaned_data).validate()
+
+    def test_context_not_shared_outside_scope(self):
+        cleaned_data = {'subject_identifier': self.subject_identifier,
+                        'report_datetime': get_utcnow()}
+        first = AntenatalVisitMembershipFormValidator(cleaned_data=cleaned_data)
+        second = AntenatalVisitMembershipFormValidator(cleaned_data=cleaned_data)
+        first.subject_identifier = second.subject_identifier = self.subject_identifier
+        self.assertIsNot(first.subject_context, second.subject_context)
+
+
+class TestConsentMemoization(TestCase):
+
+    def setUp(self):
+        AntenatalVisitMembershipFormValidator.maternal_consent_model = \
+            'td_maternal_validators.subjectconsent'
+        AntenatalVisitMembershipFormValidator.consent_version_model = \
+            'td_maternal_validators.tdconsentversion'
+        AntenatalVisitMembershipFormValidator.subject_screening_model = \
+            'td_maternal_validators.subjectscreening'
+
+        self.subject_identifier = '11111111'
+        SubjectScreening.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='ABC12345',
+            age_in_years=22)
+        TdConsentVersion.objects.create(
+            screening_identifier='ABC12345', version='3',
+            report_datetime=get_utcnow())
+        self.subject_consent = SubjectConsent.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='ABC12345',
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow(), version='3')
+
+        self.form_validator = AntenatalVisitMembershipFormValidator(
+            cleaned_data={'subject_identifier': self.subject_identifier})
+        self.form_validator.subject_identifier = self.subject_identifier
+
+    def test_consent_memoized(self):
+        consent = self.form_validator.validate_against_consent()
+        with self.assertNumQueries(0):
+            self.form_validator.validate_against_consent_datetime(get_utcnow())
+            self.assertEqual(
+                self.form_validator.validate_against_consent(), consent)
+            self.form_validator.subject_screening
+
+    def test_consent_memoized_by_id(self):
+        self.form_validator.validate_against_consent()
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                self.form_validator.validate_against_consent(id=1),
+                self.subject_consent)
+
+    def test_invalidate_consent(self):
+        self.form_validator.validate_against_consent()
+        self.subject_consent.delete()
+        self.form_validator.invalidate_consent()
+        self.assertRaises(
+            ValidationError, self.form_validator.validate_against_consent)
@@ -0,0 +1,102 @@
+from dateutil.relativedelta import relativedelta
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from edc_base.utils import get_utcnow
+from edc_constants.constants import POS
+
+from ..form_validators import SubjectContext, SubjectFacts, SubjectFactsCache
+from ..form_validators import subject_facts_cache
+from .models import AntenatalEnrollment, MaternalLabourDel, SubjectConsent
+from .models import SubjectScreening, TdConsentVersion
+
+CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'subject_facts': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'subject_facts'},
+}
+
+
+@override_settings(CACHES=CACHES, TD_MATERNAL_VALIDATORS_FACTS_CACHE='subject_facts')
+class TestSubjectFacts(TestCase):
+
+    def setUp(self):
+        caches['subject_facts'].clear()
+        self.model_labels = dict(
+            antenatal_enrollment_model='td_maternal_validators.antenatalenrollment',
+            consent_version_model='td_maternal_validators.tdconsentversion',
+            maternal_consent_model='td_maternal_validators.subjectconsent',
+            maternal_labour_del_model='td_maternal_validators.maternallabourdel',
+            subject_screening_model='td_maternal_validators.subjectscreening')
+        self.subject_identifier = '11111111'
+        SubjectScreening.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='ABC12345',
+            age_in_years=22)
+        TdConsentVersion.objects.create(
+            screening_identifier='ABC12345', version='3',
+            report_datetime=get_utcnow())
+        self.consent = SubjectConsent.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='ABC12345',
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow() - relativedelta(days=2), version='3')
+        AntenatalEnrollment.objects.create(
+            subject_identifier=self.subject_identifier,
+            enrollment_hiv_status=POS,
+            week32_test_date=get_utcnow().date())
+        self.labour_del = MaternalLabourDel.objects.create(
+            subject_identifier=self.subject_identifier,
+            delivery_datetime=get_utcnow() - relativedelta(months=3))
+
+    def context(self):
+        return SubjectContext(self.subject_identifier, **self.model_labels)
+
+    def test_facts(self):
+        facts = self.context().facts
+        self.assertEqual(facts, SubjectFacts(
+            consent_version='3',
+            consent_datetime=self.consent.consent_datetime,
+            screening_identifier='ABC12345',
+            offstudy=False,
+            enrollment_hiv_status=POS,
+            delivery_datetime=self.labour_del.delivery_datetime))
+
+    def test_facts_shared_between_contexts(self):
+        self.context().facts
+        with self.assertNumQueries(0):
+            self.assertEqual(self.context().facts.consent_version, '3')
+
+    def test_invalidate(self):
+        self.context().facts
+        self.labour_del.delete()
+        self.assertIsNotNone(self.context().facts.delivery_datetime)
+        subject_facts_cache.invalidate(self.subject_identifier)
+        self.assertIsNone(self.context().facts.delivery_datetime)
+
+    def test_versions_per_subject(self):
+        version = subject_facts_cache.version(self.subject_identifier)
+        subject_facts_cache.invalidate('22222222')
+        self.assertEqual(subject_facts_cache.version(self.subject_identifier), version)
+        subject_facts_cache.invalidate(self.subject_identifier)
+        self.assertNotEqual(
+            subject_facts_cache.version(self.subject_identifier), version)
+
+    def test_model_labels_keyed(self):
+        self.context().facts
+        labels = dict(
+            self.model_labels, maternal_labour_del_model='td_maternal.maternallabourdel')
+        self.assertNotEqual(
+            subject_facts_cache.key(self.subject_identifier, self.model_labels),
+            subject_facts_cache.key(self.subject_identifier, labels))
+
+    def test_disabled(self):
+        with override_settings(TD_MATERNAL_VALIDATORS_FACTS_CACHE=None):
+            self.assertIsNone(self.context().facts)
+
+    def test_alias(self):
+        facts_cache = SubjectFactsCache(alias='default')
+        facts = facts_cache.get(self.context())
+        self.assertEqual(facts.consent_version, '3')
+        self.assertIsNotNone(caches['default'].get(
+            facts_cache.key(self.subject_identifier, self.model_labels)))
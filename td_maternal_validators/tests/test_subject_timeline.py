@@ -0,0 +1,121 @@
+from dateutil.relativedelta import relativedelta
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.test import TestCase, override_settings
+from edc_base.utils import get_utcnow
+from edc_constants.constants import POS
+
+from ..form_validators import DependencyInvalidator, KaraboSubjectConsentFormValidator
+from ..form_validators import SubjectContext, SubjectTimeline
+from .models import AntenatalEnrollment, Appointment, KaraboSubjectScreening
+from .models import MaternalMedicalHistory, MaternalVisit, SubjectConsent
+from .models import SubjectScreening, TdConsentVersion
+
+CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+}
+
+LABELS = [
+    'td_maternal_validators.antenatalenrollment',
+    'td_maternal_validators.karabosubjectscreening',
+]
+
+
+@override_settings(CACHES=CACHES, TD_MATERNAL_VALIDATORS_FACTS_CACHE='default')
+class TestSubjectTimeline(TestCase):
+
+    def setUp(self):
+        caches['default'].clear()
+        self.model_labels = dict(
+            antenatal_enrollment_model='td_maternal_validators.antenatalenrollment',
+            consent_version_model='td_maternal_validators.tdconsentversion',
+            karabo_subject_screening_model='td_maternal_validators.karabosubjectscreening',
+            maternal_consent_model='td_maternal_validators.subjectconsent',
+            maternal_labour_del_model='td_maternal_validators.maternallabourdel',
+            medical_history_model='td_maternal_validators.maternalmedicalhistory',
+            subject_screening_model='td_maternal_validators.subjectscreening')
+        KaraboSubjectConsentFormValidator.maternal_subject_consent = \
+            'td_maternal_validators.subjectconsent'
+        KaraboSubjectConsentFormValidator.karabo_screening_model = \
+            'td_maternal_validators.karabosubjectscreening'
+        for attr in ('consent_version_model', 'subject_screening_model',
+                     'antenatal_enrollment_model', 'maternal_labour_del_model',
+                     'medical_history_model'):
+            setattr(KaraboSubjectConsentFormValidator, attr, self.model_labels[attr])
+
+        self.subject_identifier = '11111111'
+        SubjectScreening.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='ABC12345',
+            age_in_years=22)
+        TdConsentVersion.objects.create(
+            screening_identifier='ABC12345', version='3',
+            report_datetime=get_utcnow())
+        self.consent = SubjectConsent.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='ABC12345',
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow() - relativedelta(days=20), version='3')
+        self.enrollment = AntenatalEnrollment.objects.create(
+            subject_identifier=self.subject_identifier,
+            enrollment_hiv_status=POS,
+            week32_test_date=(get_utcnow() - relativedelta(weeks=4)).date(),
+            rapid_test_date=(get_utcnow() - relativedelta(weeks=3)).date())
+        appointment = Appointment.objects.create(
+            subject_identifier=self.subject_identifier,
+            appt_datetime=get_utcnow(),
+            visit_code='1000M')
+        maternal_visit = MaternalVisit.objects.create(
+            appointment=appointment,
+            subject_identifier=self.subject_identifier)
+        self.medical_history = MaternalMedicalHistory.objects.create(
+            maternal_visit=maternal_visit,
+            date_hiv_diagnosis=(get_utcnow() - relativedelta(years=1)).date())
+        self.karabo_screening = KaraboSubjectScreening.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='KABC12345',
+            report_datetime=get_utcnow() - relativedelta(days=1))
+
+    def context(self):
+        return SubjectContext(self.subject_identifier, **self.model_labels)
+
+    def test_timeline(self):
+        self.assertEqual(self.context().timeline, SubjectTimeline(
+            consent_datetime=self.consent.consent_datetime,
+            dob=self.consent.dob,
+            karabo_screening_datetime=self.karabo_screening.report_datetime,
+            date_hiv_diagnosis=self.medical_history.date_hiv_diagnosis,
+            week32_test_date=self.enrollment.week32_test_date,
+            rapid_test_date=self.enrollment.rapid_test_date,
+            delivery_datetime=None,
+            infant_birth_datetime=None))
+
+    def test_timeline_one_lookup(self):
+        self.context().timeline
+        context = self.context()
+        with self.assertNumQueries(0):
+            context.anchor('consent_datetime')
+            context.anchor('week32_test_date')
+            context.anchor('karabo_screening_datetime')
+
+    def test_timeline_kept_current(self):
+        invalidator = DependencyInvalidator()
+        invalidator.connect(*LABELS)
+        self.addCleanup(invalidator.disconnect, *LABELS)
+        self.context().timeline
+        self.enrollment.rapid_test_date = get_utcnow().date()
+        self.enrollment.save()
+        self.assertEqual(
+            self.context().anchor('rapid_test_date'), get_utcnow().date())
+
+    def test_date_check_against_timeline(self):
+        self.context().timeline
+        form_validator = KaraboSubjectConsentFormValidator(cleaned_data={})
+        with self.assertNumQueries(0):
+            self.assertRaises(
+                ValidationError, form_validator.validate_against_screening_date,
+                subject_identifier=self.subject_identifier,
+                report_datetime=get_utcnow() - relativedelta(days=2))
+            form_validator.validate_against_screening_date(
+                subject_identifier=self.subject_identifier,
+                report_datetime=get_utcnow())
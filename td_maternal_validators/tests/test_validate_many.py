@@ -0,0 +1,79 @@
+from dateutil.relativedelta import relativedelta
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from edc_base.utils import get_utcnow
+
+from ..form_validators import AntenatalVisitMembershipFormValidator, validate_many
+from .models import SubjectConsent, SubjectScreening, TdConsentVersion
+
+
+class TestValidateMany(TestCase):
+
+    def setUp(self):
+        AntenatalVisitMembershipFormValidator.maternal_consent_model = \
+            'td_maternal_validators.subjectconsent'
+        AntenatalVisitMembershipFormValidator.consent_version_model = \
+            'td_maternal_validators.tdconsentversion'
+        AntenatalVisitMembershipFormValidator.subject_screening_model = \
+            'td_maternal_validators.subjectscreening'
+        AntenatalVisitMembershipFormValidator.antenatal_enrollment_model = \
+            'td_maternal_validators.antenatalenrollment'
+
+        self.subject_identifiers = []
+        for index in range(10):
+            subject_identifier = f'1111111{index}'
+            screening_identifier = f'ABC1234{index}'
+            SubjectScreening.objects.create(
+                subject_identifier=subject_identifier,
+                screening_identifier=screening_identifier,
+                age_in_years=22)
+            TdConsentVersion.objects.create(
+                screening_identifier=screening_identifier, version='3',
+                report_datetime=get_utcnow())
+            SubjectConsent.objects.create(
+                subject_identifier=subject_identifier,
+                screening_identifier=screening_identifier,
+                gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+                consent_datetime=get_utcnow(), version='3')
+            self.subject_identifiers.append(subject_identifier)
+
+    def rows(self, report_datetime):
+        return [{'subject_identifier': subject_identifier,
+                 'report_datetime': report_datetime}
+                for subject_identifier in self.subject_identifiers]
+
+    def test_valid_rows(self):
+        results = validate_many(
+            AntenatalVisitMembershipFormValidator, self.rows(get_utcnow()))
+        self.assertEqual(results, [{}] * 10)
+
+    def test_invalid_rows(self):
+        rows = self.rows(get_utcnow())
+        rows[3]['report_datetime'] = get_utcnow() - relativedelta(days=1)
+        results = validate_many(AntenatalVisitMembershipFormValidator, rows)
+        self.assertEqual(results[:3], [{}] * 3)
+        self.assertIn('__all__', results[3])
+
+    def test_missing_consent(self):
+        rows = self.rows(get_utcnow())
+        rows[0]['subject_identifier'] = '22222222'
+        results = validate_many(AntenatalVisitMembershipFormValidator, rows)
+        self.assertIn('__all__', results[0])
+        self.assertEqual(results[1:], [{}] * 9)
+
+    def test_queries_do_not_grow_with_rows(self):
+        with CaptureQueriesContext(connection) as one_row:
+            validate_many(
+                AntenatalVisitMembershipFormValidator,
+                self.rows(get_utcnow())[:1])
+        with CaptureQueriesContext(connection) as all_rows:
+            validate_many(
+                AntenatalVisitMembershipFormValidator,
+                self.rows(get_utcnow()))
+        self.assertEqual(len(one_row), len(all_rows))
+
+    def test_instances_match_rows(self):
+        self.assertRaises(
+            ValueError, validate_many, AntenatalVisitMembershipFormValidator,
+            self.rows(get_utcnow()), instances=[None])
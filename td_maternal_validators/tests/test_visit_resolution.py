@@ -0,0 +1,60 @@
+from dateutil.relativedelta import relativedelta
+from django.test import TestCase
+from edc_base.utils import get_utcnow
+from edc_constants.constants import YES
+
+from ..form_validators import MaternalArvFormValidator, RapidTestResultFormValidator
+from .models import Appointment, MaternalArvPreg, MaternalVisit, SubjectConsent
+
+
+class TestVisitResolution(TestCase):
+
+    def setUp(self):
+        subject_consent = SubjectConsent.objects.create(
+            subject_identifier='11111111', consent_datetime=get_utcnow(),
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date())
+        self.appointment = Appointment.objects.create(
+            subject_identifier=subject_consent.subject_identifier,
+            appt_datetime=get_utcnow(), visit_code='1000M')
+        self.maternal_visit = MaternalVisit.objects.create(
+            appointment=self.appointment)
+        MaternalArvPreg.objects.create(
+            took_arv=YES, maternal_visit=self.maternal_visit)
+
+    def test_parent_resolved_in_one_query(self):
+        maternal_arv_preg = MaternalArvPreg.objects.get()
+        form_validator = MaternalArvFormValidator(
+            cleaned_data={'maternal_arv_preg': maternal_arv_preg})
+        with self.assertNumQueries(1):
+            resolved = form_validator.resolved_visit
+            self.assertEqual(resolved.maternal_visit, self.maternal_visit)
+            self.assertEqual(resolved.appointment, self.appointment)
+            self.assertEqual(resolved.subject_identifier, '11111111')
+            self.assertIs(resolved.parent, maternal_arv_preg)
+            self.assertIs(form_validator.resolved_visit, resolved)
+
+    def test_parent_already_joined(self):
+        maternal_arv_preg = MaternalArvPreg.objects.select_related(
+            'maternal_visit__appointment').get()
+        form_validator = MaternalArvFormValidator(
+            cleaned_data={'maternal_arv_preg': maternal_arv_preg})
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                form_validator.resolved_visit.appointment, self.appointment)
+
+    def test_visit(self):
+        maternal_visit = MaternalVisit.objects.get()
+        form_validator = RapidTestResultFormValidator(
+            cleaned_data={'maternal_visit': maternal_visit})
+        with self.assertNumQueries(0):
+            resolved = form_validator.resolved_visit
+            self.assertIs(resolved.maternal_visit, maternal_visit)
+            self.assertIsNone(resolved.parent)
+            self.assertEqual(resolved.subject_identifier, '11111111')
+
+    def test_resolved_again_for_new_value(self):
+        form_validator = RapidTestResultFormValidator(
+            cleaned_data={'maternal_visit': self.maternal_visit})
+        self.assertIsNotNone(form_validator.resolved_visit.maternal_visit)
+        form_validator.cleaned_data = {}
+        self.assertIsNone(form_validator.resolved_visit.maternal_visit)